@@ -0,0 +1,138 @@
+'''
+Batch runner that solves every day and part for a directory of inputs in one
+go, spreading the solver calls over a pool of worker processes.
+Usage: ./main.py batch [--workers N] [--memory] <input_dir>
+
+Inputs are looked up as <input_dir>/dayNN.txt; days without an input file are
+skipped.
+'''
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from profiling import format_bytes, trace_memory
+from inputs import InputBuffer
+import solvers
+
+
+@dataclass
+class TaskResult:
+    '''
+    The outcome of running a single solver on a single input file.
+    '''
+    day: int
+    part: str
+    answer: Optional[solvers.Answer]
+    error: Optional[str]
+    seconds: float
+    peak_memory: Optional[int] = None
+
+
+def input_path(input_dir: str, day: int) -> str:
+    '''
+    Returns the path of the input file for `day` within `input_dir`.
+    '''
+    return os.path.join(input_dir, f'{solvers.module_name(day)}.txt')
+
+
+def find_tasks(input_dir: str) -> List[Tuple[int, str, str]]:
+    '''
+    Returns a (day, part, input path) tuple for every solver that has an input
+    file in `input_dir`.
+    '''
+    tasks = []
+    for day in solvers.DAYS:
+        path = input_path(input_dir, day)
+        if os.path.isfile(path):
+            tasks.extend((day, part, path) for part in solvers.PARTS)
+    return tasks
+
+
+def run_task(day: int, part: str, path: str,
+             memory: bool = False) -> TaskResult:
+    '''
+    Runs the solver for `day` and `part` on the file at `path`, timing it and
+    capturing any exception it raises. If `memory` is set, the solver's peak
+    memory is traced too (which inflates its time).
+    '''
+    start = time.perf_counter()
+    peak = None
+    try:
+        solver = solvers.get_solver(day, part)
+        with open(path, 'rb') as file:
+            lines = InputBuffer.from_file(file)
+            if memory:
+                answer, usage = trace_memory(solver, lines)
+                peak = usage.peak
+            else:
+                answer = solver(lines)
+        error = None
+    except Exception as ex:  # pylint: disable=broad-except
+        answer = None
+        error = f'{type(ex).__name__}: {ex}'
+    return TaskResult(day, part, answer, error,
+                      time.perf_counter() - start, peak)
+
+
+def run_all(tasks: List[Tuple[int, str, str]],
+            workers: Optional[int] = None,
+            memory: bool = False) -> List[TaskResult]:
+    '''
+    Runs every task over a pool of `workers` processes (defaulting to the
+    number of CPUs) and returns the results sorted by day and part.
+    '''
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_task, *task, memory) for task in tasks]
+        results = [future.result() for future in as_completed(futures)]
+    results.sort(key=lambda result: (result.day, result.part))
+    return results
+
+
+def print_report(results: List[TaskResult], wall_time: float) -> None:
+    '''
+    Prints the answer and solve time of every task, followed by a summary of
+    the total wall time compared to the sum of the individual solve times.
+    '''
+    for result in results:
+        if result.error is not None:
+            outcome = f'ERROR {result.error}'
+        else:
+            outcome = str(result.answer).replace('\n', '\n' + ' ' * 32)
+        if result.peak_memory is not None:
+            outcome = f'[peak {format_bytes(result.peak_memory)}]  ' + outcome
+        print(f'day {result.day:2} part {result.part}  '
+              f'{result.seconds * 1000:10.3f} ms  {outcome}')
+
+    total = sum(result.seconds for result in results)
+    print(f'{len(results)} tasks in {wall_time * 1000:.3f} ms wall time '
+          f'({total * 1000:.3f} ms summed solve time)')
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py batch`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py batch')
+    parser.add_argument('input_dir')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: CPUs)')
+    parser.add_argument('--memory', action='store_true',
+                        help='trace the peak memory of each solver')
+    args = parser.parse_args(argv)
+
+    tasks = find_tasks(args.input_dir)
+    if len(tasks) == 0:
+        print(f"No dayNN.txt inputs found in '{args.input_dir}'",
+              file=sys.stderr)
+        sys.exit(-1)
+
+    start = time.perf_counter()
+    results = run_all(tasks, args.workers, args.memory)
+    print_report(results, time.perf_counter() - start)
+    if any(result.error is not None for result in results):
+        sys.exit(1)
@@ -0,0 +1,170 @@
+'''
+Benchmark suite timing every solver over a sweep of synthetic input sizes.
+Usage: ./main.py bench [--days 1,2,...] [--sizes N,...] [--output FILE]
+                       [--baseline FILE] [--max-regression PERCENT]
+                       [--memory] [--backends python,numpy]
+
+Results are written as JSON. When a baseline (a previous --output file) is
+given, the command exits with a non-zero code if any solver got slower than
+its baseline time by more than the allowed percentage. When several backends
+are given, every solver is timed on each of them and the speedup over the
+first is reported alongside.
+'''
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import generators
+from inputs import InputBuffer
+from profiling import format_bytes, trace_memory
+import solvers
+
+
+def time_solver(day: int, part: str, lines: Iterable[str], repeat: int,
+                backend: str = solvers.DEFAULT_BACKEND) -> float:
+    '''
+    Returns the fastest of `repeat` runs of the given solver on `lines`, in
+    seconds.
+    '''
+    solver = solvers.get_solver(day, part, backend)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solver(lines)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(days: Sequence[int], sizes: Optional[Sequence[int]],
+                   repeat: int, seed: int, memory: bool = False,
+                   backends: Sequence[str] = (solvers.DEFAULT_BACKEND,)) \
+        -> List[Dict[str, Any]]:
+    '''
+    Times both parts of each day in `days` at each size in `sizes` (or the
+    day's default sweep if None) on each of `backends`, printing progress to
+    stderr as it goes. If `memory` is set, each solver's peak memory is
+    measured in an extra, untimed run.
+    '''
+    results = []
+    for day in days:
+        _, default_sizes = generators.GENERATORS[day]
+        for size in sizes or default_sizes:
+            lines = InputBuffer(
+                ''.join(generators.generate(day, size, seed)).encode())
+            for part in solvers.PARTS:
+                first = None
+                for backend in backends:
+                    seconds = time_solver(day, part, lines, repeat, backend)
+                    result = {'day': day, 'part': part, 'size': size,
+                              'backend': backend, 'seconds': seconds}
+                    message = (f'day {day:2} part {part}  size {size:>8}  '
+                               f'{backend:>7}  {seconds * 1000:12.3f} ms')
+                    if first is None:
+                        first = seconds
+                    elif seconds > 0:
+                        result['speedup'] = first / seconds
+                        message += f'  {first / seconds:7.2f}x'
+                    if memory:
+                        _, usage = trace_memory(
+                            solvers.get_solver(day, part, backend), lines)
+                        result['peak_memory'] = usage.peak
+                        message += f'  peak {format_bytes(usage.peak):>10}'
+                    print(message, file=sys.stderr)
+                    results.append(result)
+    return results
+
+
+def find_regressions(results: List[Dict[str, Any]],
+                     baseline: List[Dict[str, Any]],
+                     max_regression: float) -> List[str]:
+    '''
+    Compares `results` against `baseline` and returns a description of every
+    solver whose time grew by more than `max_regression` percent. Results
+    with no matching baseline entry are ignored.
+    '''
+    def key_of(entry: Dict[str, Any]) -> tuple:
+        return (entry['day'], entry['part'], entry['size'],
+                entry.get('backend', solvers.DEFAULT_BACKEND))
+
+    baseline_times = {key_of(entry): entry['seconds'] for entry in baseline}
+    regressions = []
+    for result in results:
+        key = key_of(result)
+        if (before := baseline_times.get(key)) is None:
+            continue
+        change = (result['seconds'] - before) / before * 100
+        if change > max_regression:
+            regressions.append(
+                f"day {key[0]} part {key[1]} size {key[2]} ({key[3]}): "
+                f"{before * 1000:.3f} ms -> {result['seconds'] * 1000:.3f} ms "
+                f"(+{change:.1f}%)")
+    return regressions
+
+
+def int_list(value: str) -> List[int]:
+    '''
+    Parses a comma-separated list of integers.
+    '''
+    return [int(i) for i in value.split(',')]
+
+
+def backend_list(value: str) -> List[str]:
+    '''
+    Parses a comma-separated list of backends.
+    '''
+    backends = value.split(',')
+    for backend in backends:
+        if backend not in solvers.BACKENDS:
+            raise argparse.ArgumentTypeError(f"invalid backend '{backend}'")
+    return backends
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py bench`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py bench')
+    parser.add_argument('--days', type=int_list, default=list(solvers.DAYS),
+                        help='comma-separated days to benchmark')
+    parser.add_argument('--sizes', type=int_list, default=None,
+                        help="comma-separated input sizes (default: each "
+                             "day's own sweep)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='runs per measurement; the fastest is kept')
+    parser.add_argument('--seed', type=int, default=2021)
+    parser.add_argument('--output', help='file to write JSON results to')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--max-regression', type=float, default=10.0,
+                        help='allowed slowdown against the baseline, in '
+                             'percent (default: 10)')
+    parser.add_argument('--memory', action='store_true',
+                        help='also measure the peak memory of each solver')
+    parser.add_argument('--backends', type=backend_list,
+                        default=[solvers.DEFAULT_BACKEND],
+                        help='comma-separated backends to time; speedups are '
+                             'reported against the first')
+    args = parser.parse_args(argv)
+
+    for backend in args.backends:
+        if not solvers.backend_available(backend):
+            parser.error(f"the {backend} backend isn't installed")
+    results = run_benchmarks(args.days, args.sizes, args.repeat, args.seed,
+                             args.memory, args.backends)
+    report = {'seed': args.seed, 'repeat': args.repeat, 'results': results}
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline is not None:
+        with open(args.baseline, encoding='utf-8') as baseline:
+            regressions = find_regressions(
+                results, json.load(baseline)['results'], args.max_regression)
+        for regression in regressions:
+            print(f'REGRESSION {regression}', file=sys.stderr)
+        if len(regressions) > 0:
+            sys.exit(1)
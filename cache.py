@@ -0,0 +1,256 @@
+'''
+Content-addressed on-disk cache of solver answers. Entries are keyed by a hash
+of the day, the part, the raw input bytes and a version stamp of the solver
+source code, so editing any solver invalidates its cached answers. The cache
+is bounded by the disk space its entries occupy, evicting the least recently
+used entries first. Entries are written to unique temporary files and renamed
+into place, so concurrent runs never see each other's partial writes.
+
+The same cache also holds pre-parsed inputs for days whose module can
+serialise its parsed representation: a `dump_parsed(parsed) -> bytes`
+function and a matching `load_parsed(memoryview)`. These entries are
+memory-mapped when read back, so a cache hit skips text parsing entirely.
+'''
+
+import glob
+import hashlib
+import mmap
+import os
+import struct
+import time
+from types import ModuleType
+from typing import Any, Iterable, Optional, Tuple
+
+from inputs import Buffer, InputBuffer
+from profiling import phase
+from solvers import Answer
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Suffix of the temporary files that entries are written to.
+TEMP_SUFFIX = '.tmp'
+# Temporary files older than this many seconds are left over from a run that
+# was killed mid-write, and are removed on eviction.
+STALE_TEMP_SECONDS = 3600
+
+
+def disk_usage(stat: os.stat_result) -> int:
+    '''
+    Returns the disk space occupied by a file, which for the tiny answer
+    entries is far more than their length. Where the blocks aren't reported
+    (or not yet allocated), the length is used instead.
+    '''
+    return max(stat.st_size, getattr(stat, 'st_blocks', 0) * 512)
+
+
+def default_directory() -> str:
+    '''
+    Returns the cache directory to use when none is given explicitly:
+    $AOC2021_CACHE_DIR if set, otherwise aoc2021 within the user's cache
+    directory.
+    '''
+    if (directory := os.environ.get('AOC2021_CACHE_DIR')) is not None:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME',
+                          os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(base, 'aoc2021')
+
+
+def solver_version() -> str:
+    '''
+    Returns a stamp identifying the current version of the solvers, computed
+    from the source of every module alongside them. This is deliberately
+    conservative: a change to any module invalidates every cached answer.
+    '''
+    digest = hashlib.sha256()
+    source_dir = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(source_dir, '*.py'))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    '''
+    A directory of cached answers, one file per entry. Each entry's
+    modification time records when it was last used. The directory is only
+    scanned for its total size on the first write, which is then kept up to
+    date as entries are written, so later writes only rescan it to evict.
+    '''
+
+    def __init__(self, directory: Optional[str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self._version: Optional[str] = None
+        self._content: Optional[Tuple[Buffer, str]] = None
+        # Disk space used by the cache, as of the last scan plus the entries
+        # written since; None until the first write.
+        self._usage: Optional[int] = None
+
+    def content_hash(self, data: Buffer) -> str:
+        '''
+        Returns a hash of the input `data`, remembering it for the most
+        recent input so that its several keys only hash it once.
+        '''
+        if self._content is None or self._content[0] is not data:
+            self._content = (data, hashlib.sha256(data).hexdigest())
+        return self._content[1]
+
+    def _key(self, *parts: Any) -> str:
+        if self._version is None:
+            self._version = solver_version()
+        text = ':'.join(str(part) for part in (self._version, *parts))
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def key(self, day: int, part: str, data: Buffer) -> str:
+        '''
+        Returns the cache key for running the given solver on `data`.
+        '''
+        return self._key(day, part, self.content_hash(data))
+
+    def parsed_key(self, module: ModuleType, data: Buffer) -> str:
+        '''
+        Returns the cache key for the parsed form of `data` produced by the
+        given day module.
+        '''
+        return self._key('parsed', module.__name__, self.content_hash(data))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[Answer]:
+        '''
+        Returns the cached answer for `key`, or None if there isn't one.
+        '''
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as entry:
+                kind, _, text = entry.read().partition('\n')
+            os.utime(path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        if kind == 'int':
+            try:
+                return int(text)
+            except ValueError:
+                return None
+        return text if kind == 'str' else None
+
+    def put(self, key: str, answer: Answer) -> None:
+        '''
+        Stores `answer` under `key`, then evicts the least recently used
+        entries if the cache has outgrown its size limit. Failures to write
+        are ignored, as the cache is only an optimisation.
+        '''
+        kind = 'int' if isinstance(answer, int) else 'str'
+        self._write(key, f'{kind}\n{answer}'.encode())
+
+    def get_bytes(self, key: str) -> Optional[Buffer]:
+        '''
+        Returns the binary entry for `key`, memory-mapped, or None if there
+        isn't one.
+        '''
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as entry:
+                if os.fstat(entry.fileno()).st_size == 0:
+                    return b''
+                data = mmap.mmap(entry.fileno(), 0, access=mmap.ACCESS_READ)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return data
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        '''
+        Stores the binary entry `data` under `key`, like put().
+        '''
+        self._write(key, data)
+
+    def _write(self, key: str, data: bytes) -> None:
+        # Writing is rarer than reading, so tempfile (and the modules it
+        # imports) only costs runs that store something.
+        import tempfile  # pylint: disable=import-outside-toplevel
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if self._usage is None:
+                self._usage = self.scan()
+            fd, temp_path = tempfile.mkstemp(suffix=TEMP_SUFFIX,
+                                             dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as entry:
+                    entry.write(data)
+                    entry.flush()
+                    self._usage += disk_usage(os.fstat(entry.fileno()))
+                os.replace(temp_path, self._path(key))
+            except OSError:
+                os.remove(temp_path)
+                raise
+            if self._usage > self.max_bytes:
+                self.evict()
+        except OSError:
+            pass
+
+    def parse(self, module: ModuleType, lines: Iterable[str]) -> Any:
+        '''
+        Returns `lines` parsed by the given day module, loading the parsed
+        form from the cache if it's there. Otherwise the input is parsed as
+        usual and, if the module supports it, its parsed form is stored.
+        '''
+        if not (isinstance(lines, InputBuffer)
+                and hasattr(module, 'dump_parsed')):
+            return module.parse(lines)
+
+        key = self.parsed_key(module, lines.data)
+        if (data := self.get_bytes(key)) is not None:
+            with phase('load parsed'):
+                try:
+                    return module.load_parsed(memoryview(data))
+                except (TypeError, ValueError, struct.error):
+                    # A corrupt entry is a miss; it's replaced below.
+                    pass
+        parsed = module.parse(lines)
+        with phase('store parsed'):
+            self.put_bytes(key, module.dump_parsed(parsed))
+        return parsed
+
+    def entries(self) -> Iterable[Tuple[float, int, str]]:
+        '''
+        Yields the last use time, disk usage and name of every entry.
+        Temporary files are skipped, and removed if they're stale.
+        '''
+        stale = time.time() - STALE_TEMP_SECONDS
+        for name in os.listdir(self.directory):
+            try:
+                stat = os.stat(self._path(name))
+                if name.endswith(TEMP_SUFFIX):
+                    if stat.st_mtime < stale:
+                        os.remove(self._path(name))
+                    continue
+            except OSError:
+                continue
+            yield stat.st_mtime, disk_usage(stat), name
+
+    def scan(self) -> int:
+        '''
+        Returns the disk space used by the entries of the cache.
+        '''
+        return sum(usage for _, usage, _ in self.entries())
+
+    def evict(self) -> None:
+        '''
+        Removes the least recently used entries until the disk space used by
+        the cache is no more than its limit.
+        '''
+        entries = sorted(self.entries())
+        total = sum(usage for _, usage, _ in entries)
+        for _, usage, name in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass
+            total -= usage
+        self._usage = total
@@ -0,0 +1,166 @@
+'''
+Incremental solving of inputs that only ever grow, such as logs that are
+appended to. The running state of the solvers is saved to a checkpoint file
+along with the number of input bytes it covers, and the next run resumes
+from that offset, so its cost is proportional to the new data alone.
+Usage: ./main.py resume [--checkpoint FILE] [--restart]
+                        <day_number> <part_number|both> <input_file>
+
+A day supports checkpoints by providing `initial_state()`, returning the
+state before any input, `advance_state(state, lines)`, returning the state
+after some more lines, and `state_answers(state)`, returning the answers to
+both parts. States must be JSON-serialisable.
+
+A checkpoint only covers complete lines, so a line still being written when
+the input is read is counted in the answers but read again next time. The
+checkpoint is discarded, and the input solved from the start, if the input
+no longer begins with the bytes it covered (as far as can be told from a
+hash of their final TAIL_SIZE bytes) or if the solvers have changed since.
+'''
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Any, BinaryIO, List, NamedTuple, Optional
+
+from cache import solver_version
+from inputs import InputBuffer
+import solvers
+
+# Number of bytes before the checkpoint offset that are hashed to check the
+# input hasn't been replaced.
+TAIL_SIZE = 4096
+
+
+class Checkpoint(NamedTuple):
+    '''
+    The solver state after the first `offset` bytes of an input.
+    '''
+    day: int
+    offset: int
+    tail_hash: str
+    version: str
+    state: Any
+
+
+def supports_checkpoints(module: ModuleType) -> bool:
+    '''
+    Returns True if the day module can save its running state.
+    '''
+    return all(hasattr(module, name) for name in
+               ('initial_state', 'advance_state', 'state_answers'))
+
+
+def default_path(input_path: str, day: int) -> str:
+    '''
+    Returns the checkpoint file to use for an input when none is given.
+    '''
+    return f'{input_path}.{solvers.module_name(day)}.checkpoint'
+
+
+def tail_hash(file: BinaryIO, offset: int) -> str:
+    '''
+    Returns a hash of the TAIL_SIZE bytes before `offset` in `file`.
+    '''
+    start = max(0, offset - TAIL_SIZE)
+    file.seek(start)
+    return hashlib.sha256(file.read(offset - start)).hexdigest()
+
+
+def load(path: str) -> Optional[Checkpoint]:
+    '''
+    Reads the checkpoint at `path`, returning None if there isn't one or it
+    can't be read.
+    '''
+    try:
+        with open(path, encoding='utf-8') as file:
+            return Checkpoint(**json.load(file))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save(path: str, checkpoint: Checkpoint) -> None:
+    '''
+    Writes a checkpoint to `path`, replacing any earlier one atomically.
+    '''
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump(checkpoint._asdict(), file)
+    os.replace(path + '.tmp', path)
+
+
+def is_valid(checkpoint: Checkpoint, day: int, file: BinaryIO,
+             size: int) -> bool:
+    '''
+    Returns True if `checkpoint` can be resumed from for `day` on `file`,
+    which is `size` bytes long.
+    '''
+    return (checkpoint.day == day
+            and checkpoint.version == solver_version()
+            and checkpoint.offset <= size
+            and tail_hash(file, checkpoint.offset) == checkpoint.tail_hash)
+
+
+def resume(day: int, input_path: str, checkpoint_path: str,
+           restart: bool = False) -> List[solvers.Answer]:
+    '''
+    Returns the answers to both parts for the input at `input_path`,
+    resuming from the checkpoint at `checkpoint_path` where possible (unless
+    `restart` is set) and leaving behind a checkpoint covering every complete
+    line. Raises a ValueError if the day doesn't support checkpoints.
+    '''
+    module = solvers.load_day(day)
+    if not supports_checkpoints(module):
+        raise ValueError(f"Day {day} doesn't support checkpoints.")
+
+    with open(input_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        checkpoint = None if restart else load(checkpoint_path)
+        if checkpoint is None or not is_valid(checkpoint, day, file, size):
+            checkpoint = Checkpoint(day, 0, tail_hash(file, 0),
+                                    solver_version(), module.initial_state())
+        file.seek(checkpoint.offset)
+        data = file.read(size - checkpoint.offset)
+        # Checkpoint up to the end of the last complete line only.
+        complete = data.rfind(b'\n') + 1
+        state = module.advance_state(checkpoint.state,
+                                     InputBuffer(data[:complete]))
+        if complete > 0:
+            offset = checkpoint.offset + complete
+            save(checkpoint_path,
+                 Checkpoint(day, offset, tail_hash(file, offset),
+                            checkpoint.version, state))
+    if complete < len(data):
+        state = module.advance_state(state, InputBuffer(data[complete:]))
+    return list(module.state_answers(state))
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py resume`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py resume')
+    parser.add_argument('day', type=int)
+    parser.add_argument('part')
+    parser.add_argument('input', help='the input file, which may have grown '
+                                      'since the last run')
+    parser.add_argument('--checkpoint',
+                        help='checkpoint file (default: the input path '
+                             'followed by .dayNN.checkpoint)')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore any existing checkpoint')
+    args = parser.parse_args(argv)
+
+    try:
+        solvers.check_day(args.day)
+        parts = solvers.selected_parts(args.part)
+        answers = resume(args.day, args.input,
+                         args.checkpoint or default_path(args.input, args.day),
+                         args.restart)
+    except (ValueError, OSError) as error:
+        print(error, file=sys.stderr)
+        sys.exit(-1)
+    for part in parts:
+        print(answers[solvers.PARTS.index(part)])
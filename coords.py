@@ -0,0 +1,92 @@
+'''
+Integer (x, y) coordinates packed into a single int, for days that keep
+coordinates in sets and dicts. A packed coordinate hashes and compares as a
+plain int, with no per-point object beyond the int itself.
+
+Packing is linear: pack(x + dx, y + dy) == pack(x, y) + offset(dx, dy). So
+moving by a fixed step is a single addition, and the points of a straight
+line form a range(). Both coordinates must lie within [-BIAS, BIAS).
+'''
+
+from typing import Iterator, Tuple
+
+SHIFT = 32
+BIAS = 1 << (SHIFT - 1)
+MASK = (1 << SHIFT) - 1
+
+
+def pack(x: int, y: int) -> int:
+    '''
+    Returns the packed form of the coordinate (x, y).
+    '''
+    return ((y + BIAS) << SHIFT) + x + BIAS
+
+
+def unpack(point: int) -> Tuple[int, int]:
+    '''
+    Returns the (x, y) coordinate of a packed point.
+    '''
+    return (point & MASK) - BIAS, (point >> SHIFT) - BIAS
+
+
+def x_of(point: int) -> int:
+    '''
+    Returns the x coordinate of a packed point.
+    '''
+    return (point & MASK) - BIAS
+
+
+def y_of(point: int) -> int:
+    '''
+    Returns the y coordinate of a packed point.
+    '''
+    return (point >> SHIFT) - BIAS
+
+
+def offset(dx: int, dy: int) -> int:
+    '''
+    Returns the amount to add to a packed point to move it by (dx, dy).
+    '''
+    return (dy << SHIFT) + dx
+
+
+ORTHOGONAL = tuple(offset(dx, dy)
+                   for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)))
+DIAGONAL = tuple(offset(dx, dy)
+                 for dx, dy in ((-1, -1), (1, -1), (-1, 1), (1, 1)))
+
+
+def in_bounds(point: int, width: int, height: int) -> bool:
+    '''
+    Returns True if a packed point lies within the rectangle from (0, 0) to
+    (width - 1, height - 1).
+    '''
+    return 0 <= (point & MASK) - BIAS < width \
+        and 0 <= (point >> SHIFT) - BIAS < height
+
+
+def neighbours(point: int, width: int, height: int,
+               diagonals: bool = False) -> Iterator[int]:
+    '''
+    Iterates over the packed neighbours of `point` that lie within the
+    rectangle from (0, 0) to (width - 1, height - 1): the 4-connected ones,
+    plus the diagonal ones if `diagonals` is set.
+    '''
+    steps = ORTHOGONAL + DIAGONAL if diagonals else ORTHOGONAL
+    for step in steps:
+        neighbour = point + step
+        if in_bounds(neighbour, width, height):
+            yield neighbour
+
+
+def line(start: int, end: int) -> range:
+    '''
+    Returns the packed points from `start` to `end` inclusive, which must lie
+    on a horizontal, vertical or 45 degree line.
+    '''
+    if start == end:
+        return range(start, start + 1)
+    dx = x_of(end) - x_of(start)
+    dy = y_of(end) - y_of(start)
+    step = offset((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
+    return range(start, end + step, step)
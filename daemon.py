@@ -0,0 +1,236 @@
+'''
+Long-lived solver daemon serving requests over a Unix domain socket, so that
+solving an input costs neither interpreter start-up nor module imports.
+Usage: ./main.py serve [--socket PATH] [--workers N] [--quiet]
+       ./main.py request [--socket PATH] <day_number> <part_number> < input.txt
+
+Each request is a header line "<day> <part> <input length>\\n" followed by
+that many bytes of puzzle input (a part of "both" answers both parts, one
+per line, from a single parse), and is answered by a header line
+"<ok|error> <latency in microseconds> <body length>\\n" followed by the answer
+(or error message). Clients may pipeline any number of requests on one
+connection; responses are sent in request order. Requests are solved on a
+pool of worker processes which import every solver module up front.
+'''
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from inputs import InputBuffer
+import solvers
+
+# Maximum number of requests per connection that may be in flight at once
+# before the daemon stops reading further requests from that connection.
+MAX_IN_FLIGHT = 64
+
+
+def default_socket_path() -> str:
+    '''
+    Returns the socket path used when none is given explicitly.
+    '''
+    directory = os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir())
+    return os.path.join(directory, f'aoc2021-{os.getuid()}.sock')
+
+
+def warm_up() -> None:
+    '''
+    Imports every solver module, so that no request pays for an import.
+    '''
+    for day in solvers.DAYS:
+        solvers.load_day(day)
+
+
+def solve(day: int, part: str, data: bytes) -> solvers.Answer:
+    '''
+    Runs the given solver on `data`. Executed within the worker processes.
+    '''
+    return solvers.get_solver(day, part)(InputBuffer(data))
+
+
+def parse_header(header: bytes) -> Tuple[int, str, int]:
+    '''
+    Parses a request header into its day, part and input length, raising a
+    ValueError if it's malformed or the length is negative.
+    '''
+    day, part, size = header.decode('ascii').split()
+    if int(size) < 0:
+        raise ValueError(f'Negative input length: {size}')
+    return int(day), part, int(size)
+
+
+class Daemon:
+    '''
+    The asyncio front end of the solver daemon.
+    '''
+
+    def __init__(self, pool: ProcessPoolExecutor, quiet: bool = False):
+        self.pool = pool
+        self.quiet = quiet
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        '''
+        Serves every request sent over one connection.
+        '''
+        pending: asyncio.Queue = asyncio.Queue(MAX_IN_FLIGHT)
+        responder = asyncio.create_task(self.respond(pending, writer))
+        try:
+            while header := await reader.readline():
+                try:
+                    day, part, size = parse_header(header)
+                except ValueError:
+                    await pending.put((self.failed(
+                        ValueError('Malformed request header')),
+                        time.perf_counter(), 0, '', 0))
+                    break
+                data = await reader.readexactly(size)
+                received = time.perf_counter()
+                try:
+                    solvers.check_day(day)
+                    solvers.check_part(part)
+                    future = asyncio.get_running_loop().run_in_executor(
+                        self.pool, solve, day, part, data)
+                except ValueError as error:
+                    future = self.failed(error)
+                await pending.put((future, received, day, part, size))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            await pending.put(None)
+            await responder
+            writer.close()
+
+    @staticmethod
+    def failed(error: Exception) -> asyncio.Future:
+        '''
+        Returns a future that has already failed with `error`.
+        '''
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(error)
+        return future
+
+    async def respond(self, pending: asyncio.Queue,
+                      writer: asyncio.StreamWriter) -> None:
+        '''
+        Writes the response to each request in `pending`, in order, until a
+        None sentinel is received.
+        '''
+        while (item := await pending.get()) is not None:
+            future, received, day, part, size = item
+            try:
+                body = str(await future).encode()
+                status = 'ok'
+            except Exception as ex:  # pylint: disable=broad-except
+                body = f'{type(ex).__name__}: {ex}'.encode()
+                status = 'error'
+            latency = time.perf_counter() - received
+            if not self.quiet:
+                print(f'day {day:2} part {part}  {size:>10} bytes  '
+                      f'{latency * 1000:10.3f} ms  {status}',
+                      file=sys.stderr)
+            try:
+                writer.write(f'{status} {latency * 1e6:.0f} {len(body)}\n'
+                             .encode() + body)
+                await writer.drain()
+            except ConnectionError:
+                pass
+
+
+async def serve(path: str, workers: Optional[int], quiet: bool) -> None:
+    '''
+    Serves solver requests on the Unix socket at `path` until cancelled.
+    '''
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=warm_up) as pool:
+        daemon = Daemon(pool, quiet)
+        if os.path.exists(path):
+            os.remove(path)
+        server = await asyncio.start_unix_server(daemon.handle, path)
+        print(f'Listening on {path}', file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            os.remove(path)
+
+
+class Response(NamedTuple):
+    '''
+    The daemon's response to a single request.
+    '''
+    ok: bool
+    latency: float
+    body: str
+
+
+def request_many(path: str, requests: Iterable[Tuple[int, str, bytes]]) \
+        -> List[Response]:
+    '''
+    Sends every (day, part, input) request over a single connection to the
+    daemon listening at `path`, pipelining them, and returns the responses in
+    request order.
+    '''
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        requests = list(requests)
+
+        def send_all():
+            for day, part, data in requests:
+                sock.sendall(f'{day} {part} {len(data)}\n'.encode() + data)
+            sock.shutdown(socket.SHUT_WR)
+
+        # Send from a separate thread so that a long pipeline can't deadlock
+        # against the daemon's bounded number of in-flight requests.
+        sender = threading.Thread(target=send_all, daemon=True)
+        sender.start()
+        responses = []
+        with sock.makefile('rb') as stream:
+            for _ in requests:
+                status, latency, size = stream.readline().split()
+                body = stream.read(int(size)).decode()
+                responses.append(Response(status == b'ok',
+                                          int(latency) / 1e6, body))
+        sender.join()
+    return responses
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py serve`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py serve')
+    parser.add_argument('--socket', default=default_socket_path())
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: CPUs)')
+    parser.add_argument('--quiet', action='store_true',
+                        help="don't log each request's latency")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.socket, args.workers, args.quiet))
+    except KeyboardInterrupt:
+        pass
+
+
+def request_main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py request`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py request')
+    parser.add_argument('--socket', default=default_socket_path())
+    parser.add_argument('day', type=int)
+    parser.add_argument('part')
+    args = parser.parse_args(argv)
+    [response] = request_many(
+        args.socket, [(args.day, args.part, sys.stdin.buffer.read())])
+    if not response.ok:
+        print(response.body, file=sys.stderr)
+        sys.exit(1)
+    print(response.body)
@@ -1,38 +1,96 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 1 of the Advent of Code 2021.
+Solvers for Day 1 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/1>
 '''
 
+from array import array
 from collections import deque
-from typing import Iterable
-import unittest
+from typing import Any, Dict, Iterable, Sequence, Tuple
+
+from inputs import InputBuffer, LineStream
+from solvers import REFERENCE, Engine
+
+# Number of readings in each of part 2's sliding windows.
+WINDOW = 3
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 1, part 1
     '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 1, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Sequence[int]:
+    '''
+    Parses the problem input into the sequence of depth readings. Bulk inputs
+    are parsed in a single pass rather than line by line.
+    '''
+    if isinstance(lines, InputBuffer):
+        return lines.ints()
+    if isinstance(lines, LineStream):
+        depths = array('q')
+        for batch in lines.batches():
+            depths.extend(map(int, batch))
+        return depths
+    return [int(line) for line in lines]
+
+
+def solve1(depths: Sequence[int]) -> int:
+    '''
+    Solves part 1 for the parsed depth readings. This is count_increases()
+    with a window of one, but a single pass comparing each reading with the
+    last avoids iterating over the readings twice.
+    '''
     count = 0
     last = None
-    for line in lines:
-        current = int(line)
+    for current in depths:
         if last is not None and current > last:
             count += 1
         last = current
     return count
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2(depths: Sequence[int], window: int = WINDOW) -> int:
     '''
-    Solver for Day 1, part 2
+    Solves part 2 for the parsed depth readings, comparing the sums of
+    sliding windows of `window` readings.
+    '''
+    return count_increases(depths, window)
+
+
+def count_increases(depths: Sequence[int], window: int) -> int:
+    '''
+    Counts the sliding windows of `window` readings whose sum is larger than
+    that of the window before. Consecutive windows share all but one reading,
+    so their sums differ by depths[i + window] - depths[i], and each
+    comparison reduces to comparing two readings `window` apart, without
+    summing any window.
+    '''
+    if window < 1:
+        raise ValueError(f'Window size must be positive, not {window}')
+    return len([1 for earlier, later in zip(depths, depths[window:])
+                if later > earlier])
+
+
+def solve2_reference(depths: Sequence[int]) -> int:
+    '''
+    Solves part 2 by summing every three-reading window in turn.
     '''
     count = 0
     window: deque = deque([], maxlen=3)
     last = None
-    for line in lines:
-        window.append(int(line))
+    for depth in depths:
+        window.append(depth)
         if len(window) == 3:
             current = sum(window)
             if last is not None and current > last:
@@ -41,17 +99,41 @@ def part2(lines: Iterable[str]) -> int:
     return count
 
 
-class TestDay01(unittest.TestCase):
+def initial_state() -> Dict[str, Any]:
+    '''
+    Returns the checkpoint state before any readings: no increases counted
+    and no readings remembered.
+    '''
+    return {'increases': [0, 0], 'last': []}
+
+
+def advance_state(state: Dict[str, Any],
+                  lines: Iterable[str]) -> Dict[str, Any]:
     '''
-    Example test cases for Day 1, as specified in the problem description
+    Returns the checkpoint state after the readings in `lines` follow those
+    already counted in `state`. Only the last WINDOW readings are kept, as
+    they're all that later comparisons need (see count_increases).
     '''
-    # pylint: disable=missing-function-docstring
+    last = state['last']
+    depths = list(last) + list(parse(lines))
+    increases1, increases2 = state['increases']
+    increases1 += sum(
+        1 for i in range(max(0, len(last) - 1), len(depths) - 1)
+        if depths[i + 1] > depths[i])
+    increases2 += sum(
+        1 for i in range(max(0, len(last) - WINDOW), len(depths) - WINDOW)
+        if depths[i + WINDOW] > depths[i])
+    return {'increases': [increases1, increases2],
+            'last': depths[-WINDOW:]}
+
 
-    def setUp(self):
-        self.data = '199 200 208 210 200 207 240 269 260 263'.split()
+def state_answers(state: Dict[str, Any]) -> Tuple[int, int]:
+    '''
+    Returns the answers to both parts for a checkpoint state.
+    '''
+    increases1, increases2 = state['increases']
+    return increases1, increases2
 
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 7)
 
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 5)
+# Part 2 as it was before count_increases.
+ENGINES = {REFERENCE: Engine(parse, solve1, solve2_reference)}
@@ -0,0 +1,64 @@
+#! /usr/bin/env python
+
+'''
+Vectorised NumPy solvers for Day 1 of the Advent of Code 2021, selected with
+`--backend numpy`. They give the same answers as the solvers in day01.
+Problem description: <https://adventofcode.com/2021/day/1>
+'''
+
+from typing import Iterable
+
+import numpy as np
+
+from day01 import WINDOW
+from inputs import InputBuffer
+
+
+def part1(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 1, part 1
+    '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 1, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> np.ndarray:
+    '''
+    Parses the problem input into an array of depth readings, converting the
+    whole input in a single NumPy call.
+    '''
+    if not isinstance(lines, InputBuffer):
+        lines = InputBuffer(''.join(lines).encode())
+    return np.fromstring(lines.bytes(), dtype=np.int64, sep=' ')
+
+
+def solve1(depths: np.ndarray) -> int:
+    '''
+    Solves part 1 for the parsed depth readings.
+    '''
+    return count_increases(depths, 1)
+
+
+def solve2(depths: np.ndarray, window: int = WINDOW) -> int:
+    '''
+    Solves part 2 for the parsed depth readings, comparing the sums of
+    sliding windows of `window` readings.
+    '''
+    return count_increases(depths, window)
+
+
+def count_increases(depths: np.ndarray, window: int) -> int:
+    '''
+    Counts the sliding windows of `window` readings whose sum is larger than
+    that of the window before, with a single vectorised comparison of the
+    readings `window` apart (see day01.count_increases).
+    '''
+    if window < 1:
+        raise ValueError(f'Window size must be positive, not {window}')
+    return int(np.count_nonzero(depths[window:] > depths[:-window]))
@@ -1,23 +1,66 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 2 of the Advent of Code 2021.
+Solvers for Day 2 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/2>
 '''
 
-from typing import Iterable
-import unittest
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from inputs import InputBuffer, LineStream
+from solvers import Engine
+
+Command = Tuple[str, int]
+# The horizontal position, depth and aim of the submarine.
+Position = Tuple[int, int, int]
+# The effect of a run of commands on a submarine at the origin with no aim:
+# the change in horizontal position, in aim and in depth.
+Summary = Tuple[int, int, int]
+
+# Inputs are only split between processes into ranges at least this long.
+MIN_RANGE_BYTES = 1 << 20
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 2, part 1
     '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 2, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> List[Command]:
+    '''
+    Parses the problem input into (command, amount) pairs. Bulk inputs are
+    decoded and split in one go rather than line by line.
+    '''
+    if isinstance(lines, InputBuffer):
+        words = lines.text().split()
+        return list(zip(words[0::2], map(int, words[1::2])))
+    if isinstance(lines, LineStream):
+        commands: List[Command] = []
+        for batch in lines.batches():
+            words = ''.join(batch).split()
+            commands.extend(zip(words[0::2], map(int, words[1::2])))
+        return commands
+    return [(command, int(amount))
+            for command, amount in (line.split() for line in lines)]
+
+
+def solve1(commands: Iterable[Command]) -> int:
+    '''
+    Solves part 1 for the parsed commands.
+    '''
     horizontal = 0
     depth = 0
-    for line in lines:
-        command, amount_str = line.split()
-        amount = int(amount_str)
+    for command, amount in commands:
         match command:
             case 'forward':
                 horizontal += amount
@@ -28,16 +71,31 @@ def part1(lines: Iterable[str]) -> int:
     return horizontal * depth
 
 
-def part2(lines: Iterable[str]) -> int:
+def step(position: Position, command: Union[str, bytes],
+         amount: int) -> Position:
     '''
-    Solver for Day 2, part 2
+    Returns the position after following one command from `position` by
+    the rules of part 2. The command may be given undecoded.
+    '''
+    horizontal, depth, aim = position
+    match command:
+        case 'forward' | b'forward':
+            return horizontal + amount, depth + aim * amount, aim
+        case 'down' | b'down':
+            return horizontal, depth, aim + amount
+        case 'up' | b'up':
+            return horizontal, depth, aim - amount
+    return position
+
+
+def solve2(commands: Iterable[Command]) -> int:
+    '''
+    Solves part 2 for the parsed commands.
     '''
     horizontal = 0
     depth = 0
     aim = 0
-    for line in lines:
-        command, amount_str = line.split()
-        amount = int(amount_str)
+    for command, amount in commands:
         match command:
             case 'forward':
                 horizontal += amount
@@ -49,24 +107,140 @@ def part2(lines: Iterable[str]) -> int:
     return horizontal * depth
 
 
-class TestDay01(unittest.TestCase):
+def initial_state() -> Dict[str, Any]:
+    '''
+    Returns the checkpoint state before any commands: the submarine at the
+    surface with no aim.
+    '''
+    return {'horizontal': 0, 'depth': 0, 'aim': 0}
+
+
+def advance_state(state: Dict[str, Any],
+                  lines: Iterable[str]) -> Dict[str, Any]:
+    '''
+    Returns the checkpoint state after following the commands in `lines`
+    from `state`. Part 1's depth changes exactly as part 2's aim does, so the
+    aim serves as both.
+    '''
+    horizontal, depth, aim = state['horizontal'], state['depth'], state['aim']
+    for command, amount in parse(lines):
+        match command:
+            case 'forward':
+                horizontal += amount
+                depth += aim * amount
+            case 'down':
+                aim += amount
+            case 'up':
+                aim -= amount
+    return {'horizontal': horizontal, 'depth': depth, 'aim': aim}
+
+
+def state_answers(state: Dict[str, Any]) -> Tuple[int, int]:
+    '''
+    Returns the answers to both parts for a checkpoint state.
+    '''
+    return (state['horizontal'] * state['aim'],
+            state['horizontal'] * state['depth'])
+
+
+def read_bytes(lines: Iterable[str]) -> bytes:
+    '''
+    Returns the problem input as raw bytes, for the parallel engine.
+    '''
+    if isinstance(lines, InputBuffer):
+        return lines.bytes()
+    if isinstance(lines, LineStream):
+        return b''.join(''.join(batch).encode() for batch in lines.batches())
+    return ''.join(lines).encode()
+
+
+def summarise(data: bytes) -> Summary:
+    '''
+    Reduces the commands in `data`, which must end at a line boundary, to
+    their Summary.
+    '''
+    words = data.split()
+    horizontal = aim = depth = 0
+    for command, amount in zip(words[0::2], map(int, words[1::2])):
+        match command:
+            case b'forward':
+                horizontal += amount
+                depth += aim * amount
+            case b'down':
+                aim += amount
+            case b'up':
+                aim -= amount
+    return horizontal, aim, depth
+
+
+def combine(first: Summary, second: Summary) -> Summary:
+    '''
+    Returns the Summary of the commands of `first` followed by those of
+    `second`. The second run's forward moves all happen with the first run's
+    aim added on, which deepens them by that aim times their total distance.
+    '''
+    horizontal1, aim1, depth1 = first
+    horizontal2, aim2, depth2 = second
+    return (horizontal1 + horizontal2, aim1 + aim2,
+            depth1 + depth2 + aim1 * horizontal2)
+
+
+def split_lines(data: bytes, count: int) -> List[Tuple[int, int]]:
+    '''
+    Splits `data` into at most `count` (start, end) byte ranges of about
+    equal length, each ending at a line boundary.
+    '''
+    ranges = []
+    start = 0
+    for i in range(1, count + 1):
+        if start >= len(data):
+            break
+        end = len(data) if i == count else data.find(
+            b'\n', max(start, len(data) * i // count)) + 1
+        if end <= 0:
+            end = len(data)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def summarise_parallel(data: bytes, workers: Optional[int] = None) \
+        -> Summary:
+    '''
+    Summarises `data` by splitting it into ranges at line boundaries,
+    reducing each in one of up to `workers` processes (default: the number
+    of CPUs) and combining the results in order. Inputs too small to be
+    worth splitting are reduced in this process.
+    '''
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    import os
+    workers = workers or os.cpu_count() or 1
+    ranges = split_lines(data, min(workers, len(data) // MIN_RANGE_BYTES))
+    if len(ranges) <= 1:
+        return summarise(data)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        summaries = pool.map(summarise,
+                             (data[start:end] for start, end in ranges))
+        return functools.reduce(combine, summaries, (0, 0, 0))
+
+
+def solve1_parallel(data: bytes) -> int:
     '''
-    Example test cases for Day 2, as specified in the problem description
+    Solves part 1 for the raw input using the parallel reduction. Part 1's
+    depth is part 2's aim.
     '''
-    # pylint: disable=missing-function-docstring
+    horizontal, aim, _ = summarise_parallel(data)
+    return horizontal * aim
 
-    def setUp(self):
-        self.data = [
-            'forward 5',
-            'down 5',
-            'forward 8',
-            'up 3',
-            'down 8',
-            'forward 2'
-        ]
 
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 150)
+def solve2_parallel(data: bytes) -> int:
+    '''
+    Solves part 2 for the raw input using the parallel reduction.
+    '''
+    horizontal, _, depth = summarise_parallel(data)
+    return horizontal * depth
+
 
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 900)
+# Reduces byte ranges of the input in separate processes.
+ENGINES = {'parallel': Engine(read_bytes, solve1_parallel, solve2_parallel)}
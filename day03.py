@@ -1,20 +1,139 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 3 of the Advent of Code 2021.
+Solvers for Day 3 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/3>
 '''
 
+from bisect import bisect_left
 from collections import Counter
+from functools import cached_property
 from typing import Iterable, List, Sequence, Tuple, TypeVar
-import unittest
+
+from inputs import InputBuffer
+from solvers import REFERENCE, Engine
+
+
+class Report:
+    '''
+    A diagnostic report: the number of bits in each binary number, its rows
+    of binary digits, and the number of 1s in each column, most significant
+    first. The numbers themselves are only converted and sorted if needed.
+    '''
+
+    def __init__(self, width: int, rows: List[bytes], ones: List[int]):
+        self.width = width
+        self.rows = rows
+        self.ones = ones
+
+    @cached_property
+    def values(self) -> List[int]:
+        '''
+        The numbers in the report, in ascending order.
+        '''
+        return sorted(int(row, 2) for row in self.rows)
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 3, part 1
     '''
-    data = list(line.strip() for line in lines)
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 3, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Report:
+    '''
+    Parses the problem input into a Report. The rows are joined into one
+    string of digits, in which every `width`th byte belongs to the same
+    column, so each column's 1s are counted by a single slice and count()
+    rather than digit by digit. Rows may be of any width, but must all be
+    the same.
+    '''
+    if isinstance(lines, InputBuffer):
+        rows = lines.fields()
+    else:
+        rows = ''.join(lines).encode().split()
+    if len(rows) == 0:
+        return Report(0, [], [])
+    width = len(rows[0])
+    digits = b''.join(rows)
+    if len(digits) != width * len(rows):
+        raise ValueError('Every row of the report must have the same width')
+    ones = [digits[column::width].count(b'1') for column in range(width)]
+    return Report(width, rows, ones)
+
+
+def solve1(report: Report) -> int:
+    '''
+    Solves part 1 for the parsed diagnostic report.
+    '''
+    gamma = 0
+    for count_1s in report.ones:
+        gamma = gamma << 1 | (1 if count_1s > len(report.rows) / 2 else 0)
+
+    epsilon = gamma ^ ((1 << report.width) - 1)    # Invert the bits in gamma
+    return gamma * epsilon
+
+
+def solve2(report: Report) -> int:
+    '''
+    Solves part 2 for the parsed diagnostic report.
+    '''
+    return rating(report, True) * rating(report, False)
+
+
+def rating(report: Report, most_common: bool) -> int:
+    '''
+    Returns the oxygen generator rating if `most_common` is set, otherwise
+    the CO2 scrubber rating.
+
+    The values matching the bits chosen so far are always a contiguous range
+    [lo, hi) of the sorted values. Within it, those with the next bit clear
+    all sort before those with it set, so one bisection at the boundary
+    (the chosen prefix with that bit set) splits the range in two, and the
+    counts of 0s and 1s are just the lengths of the halves.
+    '''
+    values = report.values
+    lo, hi = 0, len(values)
+    prefix = 0
+    for bit in reversed(range(report.width)):
+        if hi - lo <= 1:
+            break
+        boundary = bisect_left(values, prefix | 1 << bit, lo, hi)
+        zeros, ones = boundary - lo, hi - boundary
+        if zeros == 0 or ones == 0:
+            # Every value agrees, so whichever bit they share is kept.
+            keep_ones = zeros == 0
+        elif most_common:
+            keep_ones = ones >= zeros
+        else:
+            keep_ones = ones < zeros
+        if keep_ones:
+            lo = boundary
+            prefix |= 1 << bit
+        else:
+            hi = boundary
+    return values[lo]
+
+
+def parse_reference(lines: Iterable[str]) -> List[str]:
+    '''
+    Parses the problem input into a list of binary strings.
+    '''
+    return [line.strip() for line in lines]
+
+
+def solve1_reference(data: Sequence[str]) -> int:
+    '''
+    Solves part 1 by counting the 1s in each column of strings.
+    '''
     gamma = 0
     mask = 0
     for i in range(len(data[0])):
@@ -26,14 +145,12 @@ def part1(lines: Iterable[str]) -> int:
     return gamma * epsilon
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2_reference(data: Sequence[str]) -> int:
     '''
-    Solver for Day 3, part 2
+    Solves part 2 by filtering the strings one column at a time.
     '''
-    data: List[str] = [line.strip() for line in lines]
-
     # Filter for the oxygen generator rating
-    filtered: List[str] = data[:]
+    filtered: Sequence[str] = data
     for i in range(len(filtered[0])):
         if len(filtered) == 1:
             break
@@ -45,7 +162,7 @@ def part2(lines: Iterable[str]) -> int:
     oxygen_generator_rating = int(filtered[0], base=2)
 
     # Filter for the CO2 scrubber rating
-    filtered = data[:]
+    filtered = data
     for i in range(len(filtered[0])):
         if len(filtered) == 1:
             break
@@ -72,20 +189,6 @@ def ranked_frequency_at(i: int, data: Sequence[Sequence[Item]]) \
     return Counter(row[i] for row in data).most_common()
 
 
-class TestDay03(unittest.TestCase):
-    '''
-    Example test cases for Day 3, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = (('00100 11110 10110 10111 10101 01111 '
-                      '00111 11100 10000 11001 00010 01010')
-                     .replace(' ', '\n ')
-                     .split(' '))
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 198)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 230)
+# The string-based solvers that the sorted ints replaced.
+ENGINES = {REFERENCE: Engine(parse_reference, solve1_reference,
+                             solve2_reference)}
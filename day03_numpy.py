@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+
+'''
+Vectorised NumPy solvers for Day 3 of the Advent of Code 2021, selected with
+`--backend numpy`. They give the same answers as the solvers in day03.
+Problem description: <https://adventofcode.com/2021/day/3>
+'''
+
+from typing import Iterable
+
+import numpy as np
+
+from inputs import InputBuffer
+
+
+def part1(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 3, part 1
+    '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 3, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> np.ndarray:
+    '''
+    Parses the problem input into a 2D array of bits, one row per number.
+    '''
+    if isinstance(lines, InputBuffer):
+        rows = lines.fields()
+    else:
+        rows = ''.join(lines).encode().split()
+    bits = np.frombuffer(b''.join(rows), dtype=np.uint8) - ord('0')
+    return bits.reshape(len(rows), -1)
+
+
+def to_int(bits: np.ndarray) -> int:
+    '''
+    Returns the value of a row of bits, most significant first.
+    '''
+    return int(''.join('1' if bit else '0' for bit in bits), base=2)
+
+
+def solve1(bits: np.ndarray) -> int:
+    '''
+    Solves part 1 for the parsed diagnostic report.
+    '''
+    gamma_bits = 2 * bits.sum(axis=0, dtype=np.int64) > len(bits)
+    gamma = to_int(gamma_bits)
+    epsilon = gamma ^ ((1 << bits.shape[1]) - 1)
+    return gamma * epsilon
+
+
+def rating(bits: np.ndarray, keep_most_common: bool) -> int:
+    '''
+    Filters the report column by column down to a single number, keeping the
+    rows with the most (or least) common bit in each column. Ties keep 1s for
+    the most common bit and 0s for the least common; columns where every row
+    agrees filter nothing.
+    '''
+    for i in range(bits.shape[1]):
+        if len(bits) == 1:
+            break
+        ones = int(np.count_nonzero(bits[:, i]))
+        zeros = len(bits) - ones
+        if ones == 0 or zeros == 0:
+            continue
+        if keep_most_common:
+            keep = 1 if ones >= zeros else 0
+        else:
+            keep = 0 if zeros <= ones else 1
+        bits = bits[bits[:, i] == keep]
+    return to_int(bits[0])
+
+
+def solve2(bits: np.ndarray) -> int:
+    '''
+    Solves part 2 for the parsed diagnostic report.
+    '''
+    return rating(bits, True) * rating(bits, False)
@@ -1,21 +1,189 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 4 of the Advent of Code 2021.
+Solvers for Day 4 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/4>
 '''
 
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Iterable, List, Tuple
-import unittest
+from typing import Iterable, List, Optional, Tuple
+
+from inputs import InputBuffer
+from solvers import REFERENCE, Engine
+
+# The side length of a board and its number of cells.
+SIZE = 5
+CELLS = SIZE * SIZE
+
+# Boards are only split between processes in chunks at least this large.
+MIN_CHUNK_BOARDS = 50_000
+
+# A board's numbers, row by row.
+Board = List[int]
+Game = Tuple[List[int], List[Board]]
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 4, part 1
     '''
-    draw_order, boards = parse_input(lines)
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 4, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Game:
+    '''
+    Parses the problem input into the draw order and the boards, each as a
+    flat list of its numbers in row-major order.
+    '''
+    if isinstance(lines, InputBuffer):
+        first, _, rest = lines.text().partition('\n')
+    else:
+        line_iter = iter(lines)
+        first, rest = next(line_iter), ' '.join(line_iter)
+    draw_order = [int(i) for i in first.strip().split(',')]
+    numbers = [int(i) for i in rest.split()]
+    if len(numbers) % CELLS != 0:
+        raise ValueError(f'Boards must have {CELLS} numbers each')
+    return draw_order, [numbers[i:i + CELLS]
+                        for i in range(0, len(numbers), CELLS)]
+
+
+def solve1(game: Game) -> int:
+    '''
+    Solves part 1 for the parsed draw order and boards.
+    '''
+    return first_winner_score(game, win_times(*game))
+
+
+def solve2(game: Game) -> int:
+    '''
+    Solves part 2 for the parsed draw order and boards.
+    '''
+    return last_winner_score(game, win_times(*game))
+
+
+def draw_ranks(draw_order: List[int], boards: List[Board]) -> List[int]:
+    '''
+    Returns a table mapping each number on the boards to the index in the
+    draw order at which it's first drawn, or to len(draw_order) if it's
+    never drawn.
+    '''
+    never = len(draw_order)
+    largest = max(max(draw_order, default=0),
+                  max(map(max, boards), default=0))
+    ranks = [never] * (largest + 1)
+    for rank in reversed(range(len(draw_order))):
+        ranks[draw_order[rank]] = rank
+    return ranks
+
+
+def win_time(board: Board, ranks: List[int]) -> int:
+    '''
+    Returns the index in the draw order of the number that completes the
+    board. A line is complete once the last of its numbers is drawn, and the
+    board once its first line is, so this is the minimum over its rows and
+    columns of the maximum rank within each.
+    '''
+    board_ranks = [ranks[number] for number in board]
+    return min(min(max(board_ranks[i:i + SIZE])
+                   for i in range(0, CELLS, SIZE)),
+               min(max(board_ranks[i::SIZE]) for i in range(SIZE)))
+
+
+def win_times(draw_order: List[int], boards: List[Board]) -> List[int]:
+    '''
+    Returns the win time of each board (see win_time). Boards that never
+    win have a time of len(draw_order).
+    '''
+    ranks = draw_ranks(draw_order, boards)
+    return [win_time(board, ranks) for board in boards]
+
+
+def board_score(draw_order: List[int], board: Board, time: int) -> int:
+    '''
+    Returns the score of a board that wins at the given time: the sum of the
+    numbers not drawn by then times the number that completed it.
+    '''
+    drawn = set(draw_order[:time + 1])
+    return sum(number for number in board if number not in drawn) \
+        * draw_order[time]
+
+
+def first_winner_score(game: Game, times: List[int]) -> int:
+    '''
+    Returns the score of the first board to win, given every board's win
+    time. Of boards winning on the same draw, the earliest listed wins.
+    '''
+    draw_order, boards = game
+    if len(times) == 0 or (first := min(times)) == len(draw_order):
+        raise ValueError("No winning board for given draw order")
+    return board_score(draw_order, boards[times.index(first)], first)
+
+
+def last_winner_score(game: Game, times: List[int]) -> int:
+    '''
+    Returns the score of the last board to win, given every board's win
+    time.
+    '''
+    draw_order, boards = game
+    if len(times) == 0 or (last := max(times)) == len(draw_order):
+        raise ValueError("No winning board for given draw order")
+    if times.count(last) > 1:
+        raise ValueError("A tie was reached; no single losing board")
+    return board_score(draw_order, boards[times.index(last)], last)
+
+
+def win_times_parallel(draw_order: List[int], boards: List[Board],
+                       workers: Optional[int] = None) -> List[int]:
+    '''
+    Computes win_times() with the boards split into one chunk for each of
+    up to `workers` processes (default: the number of CPUs). Too few boards
+    to be worth splitting are handled in this process.
+    '''
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    import itertools
+    import os
+    workers = workers or os.cpu_count() or 1
+    chunks = min(workers, len(boards) // MIN_CHUNK_BOARDS)
+    if chunks <= 1:
+        return win_times(draw_order, boards)
+    size = -(-len(boards) // chunks)
+    with ProcessPoolExecutor(max_workers=chunks) as pool:
+        results = pool.map(win_times, itertools.repeat(draw_order),
+                           (boards[i:i + size]
+                            for i in range(0, len(boards), size)))
+        return list(itertools.chain.from_iterable(results))
+
+
+def solve1_parallel(game: Game) -> int:
+    '''
+    Solves part 1 with the boards' win times computed in parallel.
+    '''
+    return first_winner_score(game, win_times_parallel(*game))
+
+
+def solve2_parallel(game: Game) -> int:
+    '''
+    Solves part 2 with the boards' win times computed in parallel.
+    '''
+    return last_winner_score(game, win_times_parallel(*game))
+
+
+def solve1_reference(game: Tuple[List[int], List['CellBoard']]) -> int:
+    '''
+    Solves part 1 by marking every board after every draw.
+    '''
+    draw_order, boards = game
+    boards = [copy_board(board) for board in boards]
     for drawn in draw_order:
         for board in boards:
             update(board, drawn)
@@ -25,11 +193,12 @@ def part1(lines: Iterable[str]) -> int:
     raise ValueError("No winning board for given draw order")
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2_reference(game: Tuple[List[int], List['CellBoard']]) -> int:
     '''
-    Solver for Day 4, part 2
+    Solves part 2 by marking every board after every draw.
     '''
-    draw_order, boards = parse_input(lines)
+    draw_order, boards = game
+    boards = [copy_board(board) for board in boards]
     for drawn in draw_order:
         filtered = []
         for board in boards:
@@ -65,10 +234,19 @@ class BingoCell:
     state: CellState
 
 
-Board = List[List[BingoCell]]
+CellBoard = List[List[BingoCell]]
+
+
+def copy_board(board: CellBoard) -> CellBoard:
+    '''
+    Returns a copy of board which can be marked without affecting the
+    original.
+    '''
+    return [[BingoCell(cell.value, cell.state) for cell in row]
+            for row in board]
 
 
-def update(board: Board, drawn: int) -> None:
+def update(board: CellBoard, drawn: int) -> None:
     '''
     Updates board by marking off any instances of drawn.
     '''
@@ -78,7 +256,7 @@ def update(board: Board, drawn: int) -> None:
                 cell.state = CellState.MARKED
 
 
-def is_complete(board: Board) -> bool:
+def is_complete(board: CellBoard) -> bool:
     '''
     Checks if board is in a winning configuration, i.e. there is one row or
     column that has been fully marked.
@@ -106,7 +284,7 @@ def is_complete(board: Board) -> bool:
     return False
 
 
-def score(board: Board, last_drawn: int) -> int:
+def score(board: CellBoard, last_drawn: int) -> int:
     '''
     Calculates the score of a board given its state and the last number drawn.
     A board's score is defined as the sum of all its unmarked numbers
@@ -120,10 +298,11 @@ def score(board: Board, last_drawn: int) -> int:
     return total * last_drawn
 
 
-def parse_input(lines: Iterable[str]) -> Tuple[List[int], List[Board]]:
+def parse_reference(lines: Iterable[str]) \
+        -> Tuple[List[int], List[CellBoard]]:
     '''
     Parses the problem input into a tuple containing the bingo draw order and a
-    list of the boards represented as 2D lists.
+    list of the boards represented as 2D lists of cells.
     '''
     line_iter = iter(lines)
     draw_order = [int(i) for i in next(line_iter).strip().split(',')]
@@ -145,37 +324,9 @@ def parse_input(lines: Iterable[str]) -> Tuple[List[int], List[Board]]:
     return (draw_order, boards)
 
 
-class TestDay04(unittest.TestCase):
-    '''
-    Example test cases for Day 4, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            '7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,'
-            '3,26,1',
-            '',
-            '22 13 17 11  0',
-            ' 8  2 23  4 24',
-            '21  9 14 16  7',
-            ' 6 10  3 18  5',
-            ' 1 12 20 15 19',
-            '',
-            ' 3 15  0  2 22',
-            ' 9 18 13 17  5',
-            '19  8  7 25 23',
-            '20 11 10 24  4',
-            '14 21 16 12  6',
-            '',
-            '14 21 17 24  4',
-            '10 16 15  9 19',
-            '18  8 23 26 20',
-            '22 11 13  6  5',
-            ' 2  0 12  3  7']
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 4512)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 1924)
+# The board-marking simulation that win times replaced, and the win times
+# computed over several processes.
+ENGINES = {
+    REFERENCE: Engine(parse_reference, solve1_reference, solve2_reference),
+    'parallel': Engine(parse, solve1_parallel, solve2_parallel),
+}
@@ -1,112 +1,94 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 5 of the Advent of Code 2021.
+Solvers for Day 5 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/5>
 '''
 
+from array import array
 from collections import Counter
-from dataclasses import dataclass
 from typing import Iterable, List, Tuple
-import unittest
+
+import coords
+from inputs import InputBuffer
+
+# A vent line, as its packed start and end points.
+Vent = Tuple[int, int]
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 5, part 1
     '''
-    vents = parse_input(lines)
-    vent_points: Counter = Counter()
-    for (start, end) in vents:
-        if start.x == end.x or start.y == end.y:
-            vent_points.update(points_between(start, end))
-    return sum(1 for (_, count) in vent_points.most_common() if count >= 2)
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 5, part 2
     '''
-    vents = parse_input(lines)
-    vent_points: Counter = Counter()
-    for (start, end) in vents:
-        vent_points.update(points_between(start, end))
-    return sum(1 for (_, count) in vent_points.most_common() if count >= 2)
+    return solve2(parse(lines))
 
 
-@dataclass(frozen=True)
-class Point:
+def dump_parsed(vents: List[Vent]) -> bytes:
     '''
-    Represents a single (x, y) coordinate.
+    Serialises parsed vent lines for the parsed input cache, as an array of
+    packed start and end points.
     '''
-    x: int
-    y: int
+    return array('Q', [point for vent in vents for point in vent]).tobytes()
 
 
-def points_between(start: Point, end: Point) -> Iterable[Point]:
+def load_parsed(data: memoryview) -> List[Vent]:
     '''
-    Iterates over the integral points between start and end (inclusive). Line
-    must be either vertical, horizontal, or 45 degrees.
+    Reconstructs vent lines serialised by dump_parsed().
     '''
-    x_step = sign(end.x - start.x)
-    y_step = sign(end.y - start.y)
-    x = start.x
-    y = start.y
-    while x != end.x or y != end.y:
-        yield Point(x, y)
-        x += x_step
-        y += y_step
-    yield Point(x, y)
+    points = iter(data.cast('Q'))
+    return list(zip(points, points))
 
 
-def sign(value: int) -> int:
+def solve1(vents: List[Vent]) -> int:
     '''
-    Returns the sign of value, i.e. 1 if value is positive, -1 if value is
-    negative, or 0 if value is zero.
+    Solves part 1 for the parsed vent lines.
     '''
-    if value < 0:
-        return -1
-    if value == 0:
-        return 0
-    return 1
+    x_of, y_of = coords.x_of, coords.y_of
+    return count_overlaps(
+        (start, end) for start, end in vents
+        if x_of(start) == x_of(end) or y_of(start) == y_of(end))
 
 
-def parse_input(lines: Iterable[str]) -> List[Tuple[Point, Point]]:
+def solve2(vents: List[Vent]) -> int:
     '''
-    Parses the problem input and returns a list of (Point, Point) tuples
-    describing the vents.
+    Solves part 2 for the parsed vent lines.
     '''
-    vents = []
-    for line in lines:
-        start, _, end = line.split()
-        p1_x, p1_y = start.split(',')
-        p2_x, p2_y = end.split(',')
-        vents.append((Point(int(p1_x), int(p1_y)),
-                      Point(int(p2_x), int(p2_y))))
-    return vents
+    return count_overlaps(vents)
 
 
-class TestDay05(unittest.TestCase):
+def count_overlaps(vents: Iterable[Vent]) -> int:
     '''
-    Example test cases for Day 5, as specified in the problem description
+    Returns the number of points covered by at least two of `vents`, which
+    must each be horizontal, vertical or diagonal.
     '''
-    # pylint: disable=missing-function-docstring
+    vent_points: Counter = Counter()
+    for start, end in vents:
+        vent_points.update(coords.line(start, end))
+    return sum(1 for count in vent_points.values() if count >= 2)
 
-    def setUp(self):
-        self.data = [
-            '0,9 -> 5,9',
-            '8,0 -> 0,8',
-            '9,4 -> 3,4',
-            '2,2 -> 2,1',
-            '7,0 -> 7,4',
-            '6,4 -> 2,0',
-            '0,9 -> 2,9',
-            '3,4 -> 1,4',
-            '0,0 -> 8,8',
-            '5,5 -> 8,2']
 
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 5)
+def parse(lines: Iterable[str]) -> List[Vent]:
+    '''
+    Parses the problem input and returns a list of (start, end) packed point
+    pairs describing the vents.
+    '''
+    pack = coords.pack
+    if isinstance(lines, InputBuffer):
+        values = iter(lines.ints(separators=b',->'))
+        return [(pack(x1, y1), pack(x2, y2))
+                for x1, y1, x2, y2 in zip(values, values, values, values)]
 
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 12)
+    vents = []
+    for line in lines:
+        start, _, end = line.split()
+        p1_x, p1_y = start.split(',')
+        p2_x, p2_y = end.split(',')
+        vents.append((pack(int(p1_x), int(p1_y)), pack(int(p2_x), int(p2_y))))
+    return vents
@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+
+'''
+Vectorised NumPy solvers for Day 5 of the Advent of Code 2021, selected with
+`--backend numpy`. They give the same answers as the solvers in day05.
+Problem description: <https://adventofcode.com/2021/day/5>
+'''
+
+from typing import Iterable
+
+import numpy as np
+
+from inputs import InputBuffer
+
+# Translation table turning the punctuation between coordinates into spaces.
+SEPARATORS = bytes.maketrans(b',->', b'   ')
+
+
+def part1(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 5, part 1
+    '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 5, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> np.ndarray:
+    '''
+    Parses the problem input into an array with one (x1, y1, x2, y2) row per
+    vent.
+    '''
+    if isinstance(lines, InputBuffer):
+        data = lines.bytes()
+    else:
+        data = ''.join(lines).encode()
+    data = data.translate(SEPARATORS)
+    return np.fromstring(data, dtype=np.int64, sep=' ').reshape(-1, 4)
+
+
+def overlaps(vents: np.ndarray) -> int:
+    '''
+    Returns the number of points covered by at least two of the given
+    horizontal, vertical or diagonal vents.
+    '''
+    if len(vents) == 0:
+        return 0
+    x1, y1, x2, y2 = vents.T
+    dx = np.sign(x2 - x1)
+    dy = np.sign(y2 - y1)
+    lengths = np.maximum(abs(x2 - x1), abs(y2 - y1)) + 1
+
+    # Lay out every point of every vent end to end: `steps` counts along each
+    # vent from zero.
+    starts = np.cumsum(lengths) - lengths
+    steps = np.arange(lengths.sum()) - np.repeat(starts, lengths)
+    xs = np.repeat(x1, lengths) + np.repeat(dx, lengths) * steps
+    ys = np.repeat(y1, lengths) + np.repeat(dy, lengths) * steps
+
+    xs -= xs.min()
+    ys -= ys.min()
+    counts = np.bincount(ys * (int(xs.max()) + 1) + xs)
+    return int(np.count_nonzero(counts >= 2))
+
+
+def solve1(vents: np.ndarray) -> int:
+    '''
+    Solves part 1 for the parsed vent lines.
+    '''
+    x1, y1, x2, y2 = vents.T
+    return overlaps(vents[(x1 == x2) | (y1 == y2)])
+
+
+def solve2(vents: np.ndarray) -> int:
+    '''
+    Solves part 2 for the parsed vent lines.
+    '''
+    return overlaps(vents)
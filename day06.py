@@ -1,33 +1,47 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 6 of the Advent of Code 2021.
+Solvers for Day 6 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/6>
 '''
 
 from collections import Counter, defaultdict
 from typing import Dict, Mapping, Iterable
-import unittest
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 6, part 1
     '''
-    state = simulate_lanternfish(
-        Counter(int(i) for i in next(iter(lines)).strip().split(',')),
-        80)
-    return sum(state.values())
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 6, part 2
     '''
-    state = simulate_lanternfish(
-        Counter(int(i) for i in next(iter(lines)).strip().split(',')),
-        256)
-    return sum(state.values())
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Counter:
+    '''
+    Parses the problem input into a count of the fish with each timer value.
+    '''
+    return Counter(int(i) for i in next(iter(lines)).strip().split(','))
+
+
+def solve1(init_state: Mapping[int, int]) -> int:
+    '''
+    Solves part 1 for the parsed initial state.
+    '''
+    return sum(simulate_lanternfish(init_state, 80).values())
+
+
+def solve2(init_state: Mapping[int, int]) -> int:
+    '''
+    Solves part 2 for the parsed initial state.
+    '''
+    return sum(simulate_lanternfish(init_state, 256).values())
 
 
 def simulate_lanternfish(init_state: Mapping[int, int], days: int) \
@@ -51,19 +65,3 @@ def simulate_lanternfish(init_state: Mapping[int, int], days: int) \
             new_state[i] += state[(i+1) % 9]
         state = new_state
     return state
-
-
-class TestDay06(unittest.TestCase):
-    '''
-    Example test cases for Day 6, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = ["3,4,3,1,2"]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 5934)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 26984457539)
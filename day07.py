@@ -1,31 +1,66 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 7 of the Advent of Code 2021.
+Solvers for Day 7 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/7>
 '''
 
-from typing import Callable, Iterable, List
-import unittest
+from array import array
+from typing import Callable, Iterable, List, Sequence
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 7, part 1
     '''
-    positions = [int(i) for i in next(iter(lines)).strip().split(',')]
-    return min_fuel_needed(positions, lambda x, y: abs(x - y))
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 7, part 2
     '''
-    positions = [int(i) for i in next(iter(lines)).strip().split(',')]
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> List[int]:
+    '''
+    Parses the problem input into a list of crab positions.
+    '''
+    return [int(i) for i in next(iter(lines)).strip().split(',')]
+
+
+def dump_parsed(positions: Sequence[int]) -> bytes:
+    '''
+    Serialises parsed crab positions for the parsed input cache.
+    '''
+    return array('q', positions).tobytes()
+
+
+def load_parsed(data: memoryview) -> Sequence[int]:
+    '''
+    Reconstructs crab positions serialised by dump_parsed().
+    '''
+    positions = array('q')
+    positions.frombytes(data)
+    return positions
+
+
+def solve1(positions: Sequence[int]) -> int:
+    '''
+    Solves part 1 for the parsed crab positions.
+    '''
+    return min_fuel_needed(positions, lambda x, y: abs(x - y))
+
+
+def solve2(positions: Sequence[int]) -> int:
+    '''
+    Solves part 2 for the parsed crab positions.
+    '''
     return min_fuel_needed(positions, lambda x, y: triangle(abs(x - y)))
 
 
-def min_fuel_needed(positions: List[int],
+def min_fuel_needed(positions: Sequence[int],
                     fuel_usage: Callable[[int, int], int]) -> int:
     '''
     Given a list of crab positions and a callable that computes the amount of
@@ -47,19 +82,3 @@ def triangle(n: int) -> int:
     Calculates the nth triangular number.
     '''
     return (n * (n + 1)) // 2
-
-
-class TestDay07(unittest.TestCase):
-    '''
-    Example test cases for Day 7, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = ['16,1,2,0,4,2,7,1,2,14']
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 37)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 168)
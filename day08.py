@@ -1,36 +1,65 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 8 of the Advent of Code 2021.
+Solvers for Day 8 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/8>
 '''
 
 import itertools
-from typing import Dict, Iterable, List, Optional, Sequence
-import unittest
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from progress import counter
+
+Entry = Tuple[List[str], List[str]]
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 8, part 1
     '''
-    total = 0
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 8, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> List[Entry]:
+    '''
+    Parses the problem input into a list of (signal patterns, output value
+    patterns) entries.
+    '''
+    entries = []
     for line in lines:
-        outputs = line.strip().split(' | ')[1].split()
+        inputs_str, outputs_str = line.strip().split(' | ')
+        entries.append((inputs_str.split(), outputs_str.split()))
+    return entries
+
+
+def solve1(entries: Iterable[Entry]) -> int:
+    '''
+    Solves part 1 for the parsed display entries.
+    '''
+    total = 0
+    for _, outputs in entries:
         unique_digits = [i for i in outputs if len(i) in [2, 4, 3, 7]]
         total += len(unique_digits)
     return total
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2(entries: Iterable[Entry]) -> int:
     '''
-    Solver for Day 8, part 2
+    Solves part 2 for the parsed display entries.
     '''
     total = 0
-    for line in lines:
-        inputs_str, outputs_str = line.strip().split(' | ')
-        inputs = [sorted(i) for i in inputs_str.split()]
-        outputs = [sorted(i) for i in outputs_str.split()]
+    tick = counter('lines')
+    for patterns, output_patterns in entries:
+        tick()
+        inputs = [sorted(i) for i in patterns]
+        outputs = [sorted(i) for i in output_patterns]
         mapping = find_mapping(inputs, list(canonical.keys()))
         value = 0
         for output in outputs:
@@ -65,19 +94,23 @@ def find_mapping(given: Sequence[Sequence[str]],
     '''
     given = sorted(given, key=len)
     target = sorted(target, key=len)
-    if (result := _find_mapping(given, target, {})) is not None:
+    tick = counter('mappings')
+    if (result := _find_mapping(given, target, {}, tick)) is not None:
         return result
     raise ValueError('No consistent mapping is possible for the given input')
 
 
 def _find_mapping(given: List[Sequence[str]],
                   target: List[Sequence[str]],
-                  mapping: Dict[str, str]) \
+                  mapping: Dict[str, str],
+                  tick: Callable[[], None]) \
         -> Optional[Dict[str, str]]:
     '''
     Recursive helper function for find_mapping. For best performance, given and
-    target should have their elements sorted by length prior to calling.
+    target should have their elements sorted by length prior to calling. Each
+    partial mapping tried is counted with `tick`.
     '''
+    tick()
     # Base case: if every word has already been matched to a target, then the
     # mapping is complete.
     if len(given) == len(target) == 0:
@@ -107,47 +140,10 @@ def _find_mapping(given: List[Sequence[str]],
             new_mapping = mapping.copy()
             new_mapping.update(zip(unmapped_given, permutation))
             result = _find_mapping(given[1:], target[:i] + target[i+1:],
-                                   new_mapping)
+                                   new_mapping, tick)
             if result is not None:
                 # A complete mapping has been found!
                 return result
 
     # No complete mapping could be built from this starting point
     return None
-
-
-class TestDay08(unittest.TestCase):
-    '''
-    Example test cases for Day 8, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            'be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | '
-            'fdgacbe cefdb cefbgd gcbe',
-            'edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | '
-            'fcgedb cgb dgebacf gc',
-            'fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | '
-            'cg cg fdcagb cbg',
-            'fbegcd cbd adcefb dageb afcb bc aefdc ecdab fgdeca fcdbega | '
-            'efabcd cedba gadfec cb',
-            'aecbfdg fbg gf bafeg dbefa fcge gcbea fcaegb dgceab fcbdga | '
-            'gecf egdcabf bgf bfgea',
-            'fgeab ca afcebg bdacfeg cfaedg gcfdb baec bfadeg bafgc acf | '
-            'gebdcfa ecba ca fadegcb',
-            'dbcfg fgd bdegcaf fgec aegbdf ecdfab fbedc dacgb gdcebf gf | '
-            'cefg dcbef fcge gbcadfe',
-            'bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | '
-            'ed bcgafe cdgba cbgef',
-            'egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | '
-            'gbdfcae bgc cg cgb',
-            'gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | '
-            'fgae cfgab fg bagce'
-        ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 26)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 61229)
@@ -1,101 +1,80 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 9 of the Advent of Code 2021.
+Solvers for Day 9 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/9>
 '''
 
-from dataclasses import astuple, dataclass
-from typing import Iterable, Sequence, Set
-import unittest
+from typing import Iterable, List
+
+from grid import Grid
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 9, part 1
     '''
-    heights = [[int(i) for i in line.strip()] for line in lines]
-    total_risk = 0
-    for y, row in enumerate(heights):
-        for x, height in enumerate(row):
-            if is_low_point(heights, Coord(x, y)):
-                total_risk += height + 1
-    return total_risk
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 9, part 2
     '''
-    heights = [[int(i) for i in line.strip()] for line in lines]
-    basins = []
-    for y in range(len(heights)):
-        for x in range(len(heights[0])):
-            if is_low_point(heights, Coord(x, y)):
-                basins.append(get_basin(heights, Coord(x, y)))
-    basin_sizes = sorted(len(basin) for basin in basins)
-    return basin_sizes[-1] * basin_sizes[-2] * basin_sizes[-3]
+    return solve2(parse(lines))
 
 
-@dataclass(frozen=True)
-class Coord:
+def parse(lines: Iterable[str]) -> Grid:
     '''
-    Represents a single (x, y) coordinate.
+    Parses the problem input into a grid of heights.
     '''
-    x: int
-    y: int
+    return Grid.parse(lines)
 
 
-def is_low_point(heights: Sequence[Sequence[int]], coord: Coord) -> bool:
+def solve1(heights: Grid) -> int:
     '''
-    Returns True if coord is a local minimum in heights, and False otherwise.
+    Solves part 1 for the parsed height map.
     '''
-    x, y = astuple(coord)
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        if 0 <= x+dx < len(heights[0]) and 0 <= y+dy < len(heights):
-            if heights[y][x] >= heights[y+dy][x+dx]:
-                return False
-    return True
+    cells = heights.cells
+    return sum(cells[i] + 1 for i in low_points(heights))
 
 
-def get_basin(heights: Sequence[Sequence[int]], low_point: Coord) \
-        -> Set[Coord]:
+def solve2(heights: Grid) -> int:
     '''
-    Returns the coordinates of all cells within the basin specified by the
-    given lowest point.
+    Solves part 2 for the parsed height map.
     '''
-    basin: Set[Coord] = set()
-    fringe = [low_point]
-    while len(fringe) > 0:
-        coord = fringe.pop()
-        if coord in basin:
-            continue
-        basin.add(coord)
-        x, y = astuple(coord)
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            if 0 <= x+dx < len(heights[0]) and 0 <= y+dy < len(heights):
-                if heights[y][x] <= heights[y+dy][x+dx] < 9:
-                    fringe.append(Coord(x+dx, y+dy))
-    return basin
+    basin_sizes = sorted(
+        basin_size(heights, low_point) for low_point in low_points(heights))
+    return basin_sizes[-1] * basin_sizes[-2] * basin_sizes[-3]
 
 
-class TestDay09(unittest.TestCase):
+def low_points(heights: Grid) -> List[int]:
     '''
-    Example test cases for Day 9, as specified in the problem description
+    Returns the index of every local minimum in `heights`.
     '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            '2199943210\n',
-            '3987894921\n',
-            '9856789892\n',
-            '8767896789\n',
-            '9899965678\n'
-        ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 15)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 1134)
+    cells = heights.cells
+    kinds, offsets = heights.neighbour_table()
+    return [i for i, height in enumerate(cells)
+            if all(height < cells[i + offset] for offset in offsets[kinds[i]])]
+
+
+def basin_size(heights: Grid, low_point: int) -> int:
+    '''
+    Returns the number of cells within the basin specified by the given
+    lowest point.
+    '''
+    cells = heights.cells
+    kinds, offsets = heights.neighbour_table()
+    basin = bytearray(len(cells))
+    size = 0
+    fringe = [low_point]
+    while len(fringe) > 0:
+        i = fringe.pop()
+        if basin[i]:
+            continue
+        basin[i] = 1
+        size += 1
+        for offset in offsets[kinds[i]]:
+            if cells[i] <= cells[i + offset] < 9:
+                fringe.append(i + offset)
+    return size
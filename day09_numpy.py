@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+
+'''
+Vectorised NumPy solvers for Day 9 of the Advent of Code 2021, selected with
+`--backend numpy`. They give the same answers as the solvers in day09.
+Problem description: <https://adventofcode.com/2021/day/9>
+'''
+
+from typing import Iterable
+
+import numpy as np
+
+import day09
+from grid import Grid
+
+
+def part1(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 9, part 1
+    '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 9, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Grid:
+    '''
+    Parses the problem input into a grid of heights.
+    '''
+    return Grid.parse(lines)
+
+
+def low_point_mask(heights: Grid) -> np.ndarray:
+    '''
+    Returns a flat boolean array marking every local minimum in `heights`.
+    '''
+    cells = np.frombuffer(heights.cells, dtype=np.uint8)
+    cells = cells.reshape(heights.height, heights.width)
+    # Surround the map with a border higher than any height, so that every
+    # cell can be compared with all four of its neighbours.
+    padded = np.pad(cells, 1, constant_values=10)
+    centre = padded[1:-1, 1:-1]
+    low = ((centre < padded[:-2, 1:-1]) & (centre < padded[2:, 1:-1])
+           & (centre < padded[1:-1, :-2]) & (centre < padded[1:-1, 2:]))
+    return low.ravel()
+
+
+def solve1(heights: Grid) -> int:
+    '''
+    Solves part 1 for the parsed height map.
+    '''
+    cells = np.frombuffer(heights.cells, dtype=np.uint8)
+    low = cells[low_point_mask(heights)]
+    return int(low.sum(dtype=np.int64)) + len(low)
+
+
+def solve2(heights: Grid) -> int:
+    '''
+    Solves part 2 for the parsed height map. Basins are still flood-filled by
+    day09, starting from the vectorised low points.
+    '''
+    basin_sizes = sorted(
+        day09.basin_size(heights, int(low_point))
+        for low_point in np.flatnonzero(low_point_mask(heights)))
+    return basin_sizes[-1] * basin_sizes[-2] * basin_sizes[-3]
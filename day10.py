@@ -1,38 +1,114 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 10 of the Advent of Code 2021.
+Solvers for Day 10 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/10>
 '''
 
-from typing import Iterable, Optional
-import unittest
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from inputs import InputBuffer, LineStream
+from solvers import REFERENCE, Engine
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 10, part 1
     '''
-    score = 0
-    for line in lines:
-        score += corruption_score(line)
-    return score
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 10, part 2
     '''
-    scores = []
-    for line in lines:
-        if (score := autocomplete_score(line)) is not None:
-            scores.append(score)
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> List[str]:
+    '''
+    Parses the problem input into its lines with all complete chunks removed
+    (see reduce_line). Bulk inputs are decoded and split in one go.
+    '''
+    if isinstance(lines, InputBuffer):
+        return list(map(reduce_line, lines.text().splitlines()))
+    if isinstance(lines, LineStream):
+        reduced: List[str] = []
+        for batch in lines.batches():
+            reduced.extend(map(reduce_line, ''.join(batch).splitlines()))
+        return reduced
+    return [reduce_line(line.strip()) for line in lines]
+
+
+def solve1(reduced_lines: Iterable[str]) -> int:
+    '''
+    Solves part 1 for the parsed, reduced lines.
+    '''
+    return sum(CORRUPTION_SCORES.get(first_closer(line), 0)
+               for line in reduced_lines)
+
+
+def solve2(reduced_lines: Iterable[str]) -> int:
+    '''
+    Solves part 2 for the parsed, reduced lines.
+    '''
+    scores = autocomplete_scores(reduced_lines)
 
     # Return the median score.
     scores.sort()
     return scores[len(scores) // 2]
 
 
+def autocomplete_scores(reduced_lines: Iterable[str]) -> List[int]:
+    '''
+    Returns the autocomplete score of each incomplete line among the parsed,
+    reduced lines, in order.
+    '''
+    scores = []
+    for line in reduced_lines:
+        if first_closer(line) is None:
+            score = 0
+            for char in reversed(line):
+                score = score * 5 + AUTOCOMPLETE_SCORES[char]
+            scores.append(score)
+    return scores
+
+
+CORRUPTION_SCORES = {')': 3, ']': 57, '}': 1197, '>': 25137}
+AUTOCOMPLETE_SCORES = {'(': 1, '[': 2, '{': 3, '<': 4}
+
+
+OPENERS = {')': '(', ']': '[', '}': '{', '>': '<'}
+
+
+def reduce_line(line: str) -> str:
+    '''
+    Matches the chunks of line with a stack in a single pass, returning the
+    opening characters left unclosed, followed by the first illegal closing
+    character if the line is corrupted. The first closing character of the
+    result (if any) is therefore the line's first illegal character, and
+    otherwise the result holds the chunks left unclosed.
+    '''
+    stack = []
+    for char in line:
+        if (opener := OPENERS.get(char)) is None:
+            stack.append(char)
+        elif len(stack) > 0 and stack[-1] == opener:
+            stack.pop()
+        else:
+            stack.append(char)
+            break
+    return ''.join(stack)
+
+
+def first_closer(line: str) -> Optional[str]:
+    '''
+    Returns the first closing character in line, or None if there isn't one.
+    '''
+    positions = [i for i in map(line.find, ')]}>') if i >= 0]
+    return line[min(positions)] if len(positions) > 0 else None
+
+
 def corruption_score(line: str) -> int:
     '''
     Computes the corruption score for line. A non-corrupted line will receive
@@ -88,28 +164,52 @@ def autocomplete_score(line: str) -> Optional[int]:
     return score
 
 
-class TestDay10(unittest.TestCase):
+def initial_state() -> Dict[str, Any]:
+    '''
+    Returns the checkpoint state before any lines: no corruption score and
+    no autocomplete scores.
+    '''
+    return {'corruption': 0, 'autocomplete': []}
+
+
+def advance_state(state: Dict[str, Any],
+                  lines: Iterable[str]) -> Dict[str, Any]:
+    '''
+    Returns the checkpoint state after scoring the lines in `lines` on top
+    of `state`. The autocomplete scores are kept sorted; as the existing
+    scores form one sorted run, sorting after adding a batch costs little
+    more than sorting the batch alone.
+    '''
+    reduced_lines = parse(lines)
+    scores = state['autocomplete'] + autocomplete_scores(reduced_lines)
+    scores.sort()
+    return {'corruption': state['corruption'] + solve1(reduced_lines),
+            'autocomplete': scores}
+
+
+def state_answers(state: Dict[str, Any]) -> Tuple[int, int]:
+    '''
+    Returns the answers to both parts for a checkpoint state.
+    '''
+    scores = state['autocomplete']
+    return state['corruption'], scores[len(scores) // 2]
+
+
+def solve1_reference(lines: Iterable[str]) -> int:
     '''
-    Example test cases for Day 10, as specified in the problem description
+    Solves part 1 by scoring each line with its own chunk stack.
     '''
-    # pylint: disable=missing-function-docstring
+    return sum(corruption_score(line) for line in lines)
+
 
-    def setUp(self):
-        self.data = [
-            '[({(<(())[]>[[{[]{<()<>>\n',
-            '[(()[<>])]({[<{<<[]>>(\n',
-            '{([(<{}[<>[]}>{[]{[(<()>\n',
-            '(((({<>}<{<{<>}{[]{[]{}\n',
-            '[[<[([]))<([[{}[[()]]]\n',
-            '[{[{({}]{}}([{[{{{}}([]\n',
-            '{<[[]]>}<{[{[{[]{()[[[]\n',
-            '[<(<(<(<{}))><([]([]()\n',
-            '<{([([[(<>()){}]>(<<{{\n',
-            '<{([{{}}[<[[[<>{}]]]>[]]'
-        ]
+def solve2_reference(lines: Iterable[str]) -> int:
+    '''
+    Solves part 2 by scoring each line with its own chunk stack.
+    '''
+    scores = sorted(score for line in lines
+                    if (score := autocomplete_score(line)) is not None)
+    return scores[len(scores) // 2]
 
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 26397)
 
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 288957)
+# The stack machine that scores each line separately for each part.
+ENGINES = {REFERENCE: Engine(list, solve1_reference, solve2_reference)}
@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+
+'''
+Vectorised NumPy solvers for Day 11 of the Advent of Code 2021, selected with
+`--backend numpy`. They give the same answers as the solvers in day11.
+Problem description: <https://adventofcode.com/2021/day/11>
+'''
+
+from typing import Iterable
+
+import numpy as np
+
+from grid import Grid
+
+
+def part1(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 11, part 1
+    '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 11, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> np.ndarray:
+    '''
+    Parses the problem input into a 2D array of energy levels.
+    '''
+    grid = Grid.parse(lines)
+    cells = np.frombuffer(grid.cells, dtype=np.uint8)
+    return cells.reshape(grid.height, grid.width).astype(np.int16)
+
+
+def solve1(energy_levels: np.ndarray) -> int:
+    '''
+    Solves part 1 for the parsed energy levels.
+    '''
+    grid = energy_levels.copy()
+    return sum(simulate_octopuses(grid) for _ in range(100))
+
+
+def solve2(energy_levels: np.ndarray) -> int:
+    '''
+    Solves part 2 for the parsed energy levels.
+    '''
+    grid = energy_levels.copy()
+    step = 1
+    while simulate_octopuses(grid) != grid.size:
+        step += 1
+    return step
+
+
+def simulate_octopuses(grid: np.ndarray) -> int:
+    '''
+    Executes one step of the Dumbo octopus simulation, updating `grid` in
+    place and returning the number of octopuses that flashed in that timestep.
+    '''
+    grid += 1
+    flashed = np.zeros(grid.shape, dtype=bool)
+    # Each round flashes every octopus that's newly above 9 at once, then
+    # adds the number of flashing neighbours to every cell.
+    padded = np.zeros((grid.shape[0] + 2, grid.shape[1] + 2), dtype=np.int16)
+    while (flashing := (grid > 9) & ~flashed).any():
+        flashed |= flashing
+        padded[1:-1, 1:-1] = flashing
+        grid += (padded[:-2, :-2] + padded[:-2, 1:-1] + padded[:-2, 2:]
+                 + padded[1:-1, :-2] + padded[1:-1, 2:]
+                 + padded[2:, :-2] + padded[2:, 1:-1] + padded[2:, 2:])
+    grid[flashed] = 0
+    return int(np.count_nonzero(flashed))
@@ -1,78 +1,84 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 13 of the Advent of Code 2021.
+Solvers for Day 13 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/13>
 '''
 
-from dataclasses import dataclass
 from typing import Iterable, List, Tuple
-import unittest
+
+import coords
+
+Fold = Tuple[str, int]
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 13, part 1
     '''
-    dots, [fold, *_] = read_input(lines)
-    result = perform_fold(dots, fold)
-    return len(result)
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> str:
     '''
     Solver for Day 13, part 2
     '''
-    dots, folds = read_input(lines)
+    return solve2(parse(lines))
+
+
+def solve1(manual: Tuple[List[int], List[Fold]]) -> int:
+    '''
+    Solves part 1 for the parsed dots and fold instructions.
+    '''
+    dots, [fold, *_] = manual
+    result = perform_fold(dots, fold)
+    return len(result)
+
+
+def solve2(manual: Tuple[List[int], List[Fold]]) -> str:
+    '''
+    Solves part 2 for the parsed dots and fold instructions.
+    '''
+    dots, folds = manual
     for fold in folds:
         dots = perform_fold(dots, fold)
 
     # Assemble pretty print output.
+    dot_set = set(dots)
     lines = []
     for y in range(-1, 6):
         line = []
         for x in range(-1, 5*8):
-            line.append('██' if Coord(x, y) in dots else '  ')
+            line.append('██' if coords.pack(x, y) in dot_set else '  ')
         lines.append(''.join(line))
 
     return '\n'.join(lines)
 
 
-@dataclass(frozen=True)
-class Coord:
-    '''
-    Represents a single (x, y) coordinate.
-    '''
-    x: int
-    y: int
-
-
-def perform_fold(dots: List[Coord], fold: Tuple[str, int]) -> List[Coord]:
+def perform_fold(dots: List[int], fold: Fold) -> List[int]:
     '''
-    Returns the result of folding dots along the axis specified by fold.
-    Duplicate dots and dots along the fold axis are removed.
+    Returns the result of folding the packed dots along the axis specified by
+    fold. Duplicate dots and dots along the fold axis are removed.
     '''
     axis, threshold = fold
     dot_set = set()
+    # Reflecting a coordinate c in the fold line moves it by 2 * (threshold -
+    # c), which for packed points is a single addition.
+    if axis == 'y':
+        position, step = coords.y_of, coords.offset(0, 1)
+    else:
+        position, step = coords.x_of, coords.offset(1, 0)
     for dot in dots:
-        if axis == 'y':
-            if dot.y > threshold:
-                dot_set.add(Coord(dot.x, threshold - (dot.y - threshold)))
-            elif dot.y < threshold:
-                dot_set.add(dot)
-        else:
-            if dot.x > threshold:
-                dot_set.add(Coord(threshold - (dot.x - threshold), dot.y))
-            elif dot.x < threshold:
-                dot_set.add(dot)
-        dots = list(dot_set)
-    return dots
-
-
-def read_input(lines: Iterable[str]) \
-        -> Tuple[List[Coord], List[Tuple[str, int]]]:
+        if (distance := position(dot) - threshold) > 0:
+            dot_set.add(dot - 2 * distance * step)
+        elif distance < 0:
+            dot_set.add(dot)
+    return list(dot_set)
+
+
+def parse(lines: Iterable[str]) -> Tuple[List[int], List[Fold]]:
     '''
-    Parses the problem input into a list of dot coordinates and fold
+    Parses the problem input into a list of packed dot coordinates and fold
     instructions.
     '''
     dots = []
@@ -82,7 +88,7 @@ def read_input(lines: Iterable[str]) \
         if len(line) == 0:
             break
         x, y = line.split(',')
-        dots.append(Coord(int(x), int(y)))
+        dots.append(coords.pack(int(x), int(y)))
 
     folds = []
     for line in lines_iter:
@@ -91,49 +97,3 @@ def read_input(lines: Iterable[str]) \
         folds.append((axis, int(value)))
 
     return dots, folds
-
-
-class TestDay13(unittest.TestCase):
-    '''
-    Example test cases for Day 13, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            '6,10\n',
-            '0,14\n',
-            '9,10\n',
-            '0,3\n',
-            '10,4\n',
-            '4,11\n',
-            '6,0\n',
-            '6,12\n',
-            '4,1\n',
-            '0,13\n',
-            '10,12\n',
-            '3,4\n',
-            '3,0\n',
-            '8,4\n',
-            '1,10\n',
-            '2,14\n',
-            '8,10\n',
-            '9,0\n',
-            '\n',
-            'fold along y=7\n',
-            'fold along x=5'
-        ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 17)
-
-    def test_part2_example(self):
-        expected = '\n'.join(line.ljust(82) for line in [
-            '              ',
-            '  ██████████  ',
-            '  ██      ██  ',
-            '  ██      ██  ',
-            '  ██      ██  ',
-            '  ██████████  ',
-            '              '])
-        self.assertEqual(part2(self.data), expected)
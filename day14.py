@@ -1,30 +1,43 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 14 of the Advent of Code 2021.
+Solvers for Day 14 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/14>
 '''
 
 from collections import defaultdict
 from itertools import pairwise
 from typing import Dict, Iterable, List, Tuple
-import unittest
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 14, part 1
     '''
-    template_str, insertion_rules = read_input(lines)
-    counts = element_count_after(10, list(template_str), insertion_rules)
-    return counts[0][1] - counts[-1][1]
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 14, part 2
     '''
-    template_str, insertion_rules = read_input(lines)
+    return solve2(parse(lines))
+
+
+def solve1(manual: Tuple[str, Dict[Tuple[str, str], str]]) -> int:
+    '''
+    Solves part 1 for the parsed template and insertion rules.
+    '''
+    template_str, insertion_rules = manual
+    counts = element_count_after(10, list(template_str), insertion_rules)
+    return counts[0][1] - counts[-1][1]
+
+
+def solve2(manual: Tuple[str, Dict[Tuple[str, str], str]]) -> int:
+    '''
+    Solves part 2 for the parsed template and insertion rules.
+    '''
+    template_str, insertion_rules = manual
     counts = element_count_after(40, list(template_str), insertion_rules)
     return counts[0][1] - counts[-1][1]
 
@@ -68,7 +81,7 @@ def element_count_after(
     return counts_list
 
 
-def read_input(lines: Iterable[str]) -> Tuple[str, Dict[Tuple[str, str], str]]:
+def parse(lines: Iterable[str]) -> Tuple[str, Dict[Tuple[str, str], str]]:
     '''
     Parses the problem input and returns a tuple containing the initial
     template and a dictionary of the insertion rules.
@@ -83,38 +96,3 @@ def read_input(lines: Iterable[str]) -> Tuple[str, Dict[Tuple[str, str], str]]:
         insertion_rules[(pair[0], pair[1])] = insertion
 
     return template, insertion_rules
-
-
-class TestDay14(unittest.TestCase):
-    '''
-    Example test cases for Day 14, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            'NNCB\n',
-            '\n',
-            'CH -> B\n',
-            'HH -> N\n',
-            'CB -> H\n',
-            'NH -> C\n',
-            'HB -> C\n',
-            'HC -> B\n',
-            'HN -> C\n',
-            'NN -> C\n',
-            'BH -> H\n',
-            'NC -> B\n',
-            'NB -> B\n',
-            'BN -> B\n',
-            'BB -> N\n',
-            'BC -> B\n',
-            'CC -> N\n',
-            'CN -> C'
-        ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 1588)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 2188189693529)
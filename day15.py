@@ -1,122 +1,112 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 15 of the Advent of Code 2021.
+Solvers for Day 15 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/15>
 '''
 
-from dataclasses import dataclass
 import heapq
-from typing import Iterable, List
-import unittest
+from typing import Iterable
+
+from grid import Grid
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 15, part 1
     '''
-    risk_map = [[int(c) for c in line.strip()] for line in lines]
-    destination = Coord(len(risk_map) - 1, len(risk_map) - 1)
-    return lowest_risk_path(Coord(0, 0), destination, risk_map)
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 15, part 2
     '''
-    risk_map = expand_map([[int(c) for c in line.strip()] for line in lines])
-    destination = Coord(len(risk_map) - 1, len(risk_map) - 1)
-    return lowest_risk_path(Coord(0, 0), destination, risk_map)
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Grid:
+    '''
+    Parses the problem input into a grid of risk levels.
+    '''
+    return Grid.parse(lines)
 
 
-@dataclass(frozen=True, order=True)
-class Coord:
+def dump_parsed(risk_map: Grid) -> bytes:
     '''
-    Represents an (x, y) coordinate within the risk map.
+    Serialises a parsed risk map for the parsed input cache.
     '''
-    x: int
-    y: int
+    return risk_map.to_bytes()
 
 
-def lowest_risk_path(
-        start: Coord, end: Coord, risk_map: List[List[int]]) -> int:
+def load_parsed(data: memoryview) -> Grid:
     '''
-    Returns the risk value of the least risky path from `start` to `end` within
-    the given `risk_map`.
+    Reconstructs a risk map serialised by dump_parsed().
     '''
+    return Grid.from_bytes(data)
+
+
+def solve1(risk_map: Grid) -> int:
+    '''
+    Solves part 1 for the parsed risk map.
+    '''
+    return lowest_risk_path(0, len(risk_map) - 1, risk_map)
+
+
+def solve2(risk_map: Grid) -> int:
+    '''
+    Solves part 2 for the parsed risk map.
+    '''
+    risk_map = expand_map(risk_map)
+    return lowest_risk_path(0, len(risk_map) - 1, risk_map)
+
+
+def lowest_risk_path(start: int, end: int, risk_map: Grid) -> int:
+    '''
+    Returns the risk value of the least risky path from the cell at index
+    `start` to the one at index `end` within the given `risk_map`.
+    '''
+    cells = risk_map.cells
+    kinds, offsets = risk_map.neighbour_table()
     fringe = [(0, start)]
-    seen = set()
+    seen = bytearray(len(cells))
     while len(fringe) > 0:
         risk, current = heapq.heappop(fringe)
         if current == end:
             return risk
 
-        if current in seen:
+        if seen[current]:
             continue
-        seen.add(current)
+        seen[current] = 1
 
-        for neighbour in neighbours(current, risk_map):
-            if neighbour in seen:
+        for offset in offsets[kinds[current]]:
+            neighbour = current + offset
+            if seen[neighbour]:
                 continue
-            heapq.heappush(
-                fringe,
-                (risk + risk_map[neighbour.y][neighbour.x], neighbour))
+            heapq.heappush(fringe, (risk + cells[neighbour], neighbour))
 
-    raise RuntimeError(f"Couldn't find path from {start} to {end}")
+    raise RuntimeError(f"Couldn't find path from {risk_map.coords(start)} to "
+                       f"{risk_map.coords(end)}")
 
 
-def neighbours(coord: Coord, risk_map: List[List[int]]) -> Iterable[Coord]:
-    '''
-    Returns an iterator over the coordinates neighbouring `coord` within
-    `risk_map`.
-    '''
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        if 0 <= coord.x + dx < len(risk_map[0]) \
-                and 0 <= coord.y + dy < len(risk_map):
-            yield Coord(coord.x + dx, coord.y + dy)
+# Translation tables adding 0-8 to a risk level, wrapping from 9 back to 1.
+WRAPPED_ADDITIONS = [
+    bytes((value + n - 1) % 9 + 1 if value > 0 else 0 for value in range(256))
+    for n in range(9)]
 
 
-def expand_map(risk_map: List[List[int]]) -> List[List[int]]:
+def expand_map(risk_map: Grid) -> Grid:
     '''
-    Given an n×n risk map, returns its 5n×5n expanded version as described in
+    Given an n×m risk map, returns its 5n×5m expanded version as described in
     Part 2.
     '''
-    full_map = []
+    width = risk_map.width
+    rows = [risk_map.cells[y * width:(y + 1) * width]
+            for y in range(risk_map.height)]
+    full_map = bytearray()
     for row_tile in range(5):
-        for row in risk_map:
-            current_row = []
+        for row in rows:
             for col_tile in range(5):
-                for value in row:
-                    new_risk = value + row_tile + col_tile
-                    if new_risk > 9:
-                        new_risk -= 9
-                    current_row.append(new_risk)
-            full_map.append(current_row)
-    return full_map
-
-
-class TestDay15(unittest.TestCase):
-    '''
-    Example test cases for Day 15, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            '1163751742\n',
-            '1381373672\n',
-            '2136511328\n',
-            '3694931569\n',
-            '7463417111\n',
-            '1319128137\n',
-            '1359912421\n',
-            '3125421639\n',
-            '1293138521\n',
-            '2311944581'
-        ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 40)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 315)
+                full_map += row.translate(
+                    WRAPPED_ADDITIONS[row_tile + col_tile])
+    return Grid(5 * width, 5 * risk_map.height, full_map)
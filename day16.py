@@ -1,7 +1,7 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 16 of the Advent of Code 2021.
+Solvers for Day 16 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/16>
 '''
 
@@ -12,22 +12,41 @@ from dataclasses import dataclass
 from enum import Enum
 from math import prod
 from typing import Deque, Iterable, List
-import unittest
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 16, part 1
     '''
-    packet = parse_packet(deque(hex_to_bin(list(lines)[0].strip())))
-    return sum(p.version for p in packet_iter(packet))
+    return solve1(parse(lines))
 
 
 def part2(lines: Iterable[str]) -> int:
     '''
     Solver for Day 16, part 2
     '''
-    return parse_packet(deque(hex_to_bin(list(lines)[0].strip()))).evaluate()
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> Packet:
+    '''
+    Decodes the hexadecimal transmission into its outermost packet.
+    '''
+    return parse_packet(deque(hex_to_bin(list(lines)[0].strip())))
+
+
+def solve1(packet: Packet) -> int:
+    '''
+    Solves part 1 for the decoded packet.
+    '''
+    return sum(p.version for p in packet_iter(packet))
+
+
+def solve2(packet: Packet) -> int:
+    '''
+    Solves part 2 for the decoded packet.
+    '''
+    return packet.evaluate()
 
 
 @dataclass  # type: ignore
@@ -160,46 +179,3 @@ def packet_iter(packet: Packet) -> Iterable[Packet]:
     if isinstance(packet, OperatorPacket):
         for subpacket in packet.subpackets:
             yield from packet_iter(subpacket)
-
-
-class TestDay16(unittest.TestCase):
-    '''
-    Example test cases for Day 16, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def test_part1_example1(self):
-        self.assertEqual(part1(['8A004A801A8002F478']), 16)
-
-    def test_part1_example2(self):
-        self.assertEqual(part1(['620080001611562C8802118E34']), 12)
-
-    def test_part1_example3(self):
-        self.assertEqual(part1(['C0015000016115A2E0802F182340']), 23)
-
-    def test_part1_example4(self):
-        self.assertEqual(part1(['A0016C880162017C3686B18A3D4780']), 31)
-
-    def test_part2_example1(self):
-        self.assertEqual(part2(['C200B40A82']), 3)
-
-    def test_part2_example2(self):
-        self.assertEqual(part2(['04005AC33890']), 54)
-
-    def test_part2_example3(self):
-        self.assertEqual(part2(['880086C3E88112']), 7)
-
-    def test_part2_example4(self):
-        self.assertEqual(part2(['CE00C43D881120']), 9)
-
-    def test_part2_example5(self):
-        self.assertEqual(part2(['D8005AC2A8F0']), 1)
-
-    def test_part2_example6(self):
-        self.assertEqual(part2(['F600BC2D8F']), 0)
-
-    def test_part2_example7(self):
-        self.assertEqual(part2(['9C005AC2F8F0']), 0)
-
-    def test_part2_example8(self):
-        self.assertEqual(part2(['9C0141080250320F1802104A08']), 1)
@@ -1,7 +1,7 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 17 of the Advent of Code 2021.
+Solvers for Day 17 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/17>
 '''
 
@@ -9,14 +9,27 @@ from collections import defaultdict
 import itertools
 import math
 from typing import Dict, Iterable, Iterator, List, Tuple
-import unittest
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 17, part 1
     '''
-    (x_lower, x_upper), (y_lower, y_upper) = read_input(lines)
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 17, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def solve1(target: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
+    '''
+    Solves part 1 for the parsed target bounds.
+    '''
+    (x_lower, x_upper), (y_lower, y_upper) = target
 
     # The shot with the highest height will also be the one which hits the
     # target as close as possible to its bottom edge. Checking that it's
@@ -34,16 +47,16 @@ def part1(lines: Iterable[str]) -> int:
     return 0
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2(target: Tuple[Tuple[int, int], Tuple[int, int]]) -> int:
     '''
-    Solver for Day 17, part 2
+    Solves part 2 for the parsed target bounds.
     '''
     # The movement of the probe on each axis is fully independent, so we start
     # by finding all possible initial y velocities, grouped by the timestep(s)
     # at which that velocity puts the probe within the target's y-range, and
     # then do the same for the x-axis. We can then take the set product of both
     # groups at each timestep to find all possible launch options.
-    (x_lower, x_upper), (y_lower, y_upper) = read_input(lines)
+    (x_lower, x_upper), (y_lower, y_upper) = target
     _, max_init_y, max_t = max_valid_y(y_lower)
     init_y_options = y_values_by_t(y_lower, y_upper, max_init_y+1)
 
@@ -58,7 +71,7 @@ def part2(lines: Iterable[str]) -> int:
     return len(all_options)
 
 
-def read_input(lines: Iterable[str]) \
+def parse(lines: Iterable[str]) \
         -> Tuple[Tuple[int, int], Tuple[int, int]]:
     '''
     Parses the problem input and returns the bounds of the target in the form:
@@ -144,19 +157,3 @@ def inv_triangle(n: int) -> float:
     Result will be non-integral in the case of non-triangular number inputs.
     '''
     return (1 - math.sqrt(1 + 8*n)) / -2
-
-
-class TestDay17(unittest.TestCase):
-    '''
-    Example test cases for Day 17, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = ['target area: x=20..30, y=-10..-5']
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 45)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 112)
@@ -1,7 +1,7 @@
 #! /usr/bin/env python
 
 '''
-Solvers and example test cases for Day 18 of the Advent of Code 2021.
+Solvers for Day 18 of the Advent of Code 2021.
 Problem description: <https://adventofcode.com/2021/day/18>
 '''
 
@@ -9,16 +9,38 @@ from __future__ import annotations
 import abc
 import math
 from typing import Iterable, List, Optional, Tuple
-import unittest
+
+from progress import counter
 
 
 def part1(lines: Iterable[str]) -> int:
     '''
     Solver for Day 18, part 1
     '''
+    return solve1(parse(lines))
+
+
+def part2(lines: Iterable[str]) -> int:
+    '''
+    Solver for Day 18, part 2
+    '''
+    return solve2(parse(lines))
+
+
+def parse(lines: Iterable[str]) -> List[SnailfishNumber]:
+    '''
+    Parses each line of the problem input into a SnailfishNumber.
+    '''
+    return [parse_line(line) for line in lines]
+
+
+def solve1(numbers: List[SnailfishNumber]) -> int:
+    '''
+    Solves part 1 for the parsed homework numbers. Addition clones its
+    operands, so `numbers` is left intact.
+    '''
     total = None
-    for line in lines:
-        number = parse_line(line)
+    for number in numbers:
         if total is None:
             total = number
         else:
@@ -28,16 +50,17 @@ def part1(lines: Iterable[str]) -> int:
     return total.magnitude()
 
 
-def part2(lines: Iterable[str]) -> int:
+def solve2(numbers: List[SnailfishNumber]) -> int:
     '''
-    Solver for Day 18, part 2
+    Solves part 2 for the parsed homework numbers.
     '''
     max_magnitude = 0
-    numbers = [parse_line(line) for line in lines]
+    tick = counter('pairs')
     for i, number1 in enumerate(numbers):
         for j, number2 in enumerate(numbers):
             if i == j:
                 continue
+            tick()
             if (current := (number1 + number2).magnitude()) > max_magnitude:
                 max_magnitude = current
     return max_magnitude
@@ -217,30 +240,3 @@ def parse_line(line: str) -> SnailfishNumber:
                 value = SnailfishValue(int(char))
                 stack.append(value)
     return stack.pop()
-
-
-class TestDay18(unittest.TestCase):
-    '''
-    Example test cases for Day 18, as specified in the problem description
-    '''
-    # pylint: disable=missing-function-docstring
-
-    def setUp(self):
-        self.data = [
-            '[[[0,[5,8]],[[1,7],[9,6]]],[[4,[1,2]],[[1,4],2]]]\n',
-            '[[[5,[2,8]],4],[5,[[9,9],0]]]\n',
-            '[6,[[[6,2],[5,6]],[[7,6],[4,7]]]]\n',
-            '[[[6,[0,7]],[0,9]],[4,[9,[9,0]]]]\n',
-            '[[[7,[6,4]],[3,[1,3]]],[[[5,5],1],9]]\n',
-            '[[6,[[7,3],[3,2]]],[[[3,8],[5,7]],4]]\n',
-            '[[[[5,4],[7,7]],8],[[8,3],8]]\n',
-            '[[9,3],[[9,9],[6,[4,9]]]]\n',
-            '[[2,[[7,7],7]],[[5,8],[[9,3],[0,2]]]]\n',
-            '[[[[5,2],5],[8,[3,7]]],[[5,[7,5]],[4,4]]]'
-            ]
-
-    def test_part1_example(self):
-        self.assertEqual(part1(self.data), 4140)
-
-    def test_part2_example(self):
-        self.assertEqual(part2(self.data), 3993)
@@ -0,0 +1,356 @@
+'''
+Seeded generators of synthetic puzzle inputs for every day, used to benchmark
+the solvers on inputs much larger than the examples. Each generator takes a
+random.Random instance and a size (whose meaning depends on the day, e.g. the
+number of lines or the side length of a grid) and returns the input as a list
+of newline-terminated lines, in the same shape as the real puzzle input.
+'''
+
+import itertools
+import random
+import string
+from typing import Callable, Dict, List, Sequence, Tuple
+
+Generator = Callable[[random.Random, int], List[str]]
+
+# Maps each day to its generator and the default sizes to benchmark it at.
+GENERATORS: Dict[int, Tuple[Generator, Tuple[int, ...]]] = {}
+
+
+def generator(day: int, sizes: Tuple[int, ...]) \
+        -> Callable[[Generator], Generator]:
+    '''
+    Decorator registering the decorated function as the input generator for
+    `day`, with `sizes` as its default benchmark sweep.
+    '''
+    def register(function: Generator) -> Generator:
+        GENERATORS[day] = (function, sizes)
+        return function
+    return register
+
+
+def generate(day: int, size: int, seed: int = 2021) -> List[str]:
+    '''
+    Generates an input of the given size for `day`. The same day, size and
+    seed always produce the same input.
+    '''
+    function, _ = GENERATORS[day]
+    return function(random.Random(f'{day}:{size}:{seed}'), size)
+
+
+def digit_grid(rng: random.Random, side: int, digits: str) -> List[str]:
+    '''
+    Returns a square grid of random characters from `digits`.
+    '''
+    return [''.join(rng.choices(digits, k=side)) + '\n' for _ in range(side)]
+
+
+@generator(1, sizes=(1_000, 10_000, 100_000))
+def day01(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` sonar depth readings following a random walk.
+    '''
+    depth = 1000
+    lines = []
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        lines.append(f'{depth}\n')
+    return lines
+
+
+@generator(2, sizes=(1_000, 10_000, 100_000))
+def day02(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` submarine commands.
+    '''
+    commands = ('forward', 'down', 'up')
+    return [f'{rng.choice(commands)} {rng.randint(1, 9)}\n'
+            for _ in range(size)]
+
+
+@generator(3, sizes=(1_000, 10_000, 100_000))
+def day03(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` 12-bit diagnostic report lines.
+    '''
+    return [format(rng.getrandbits(12), '012b') + '\n' for _ in range(size)]
+
+
+@generator(4, sizes=(10, 100, 1_000))
+def day04(rng: random.Random, size: int) -> List[str]:
+    '''
+    A draw order covering every number from 0 to 99 and `size` bingo boards,
+    arranged so that exactly one board is the last to win.
+    '''
+    draw_order = list(range(100))
+    rng.shuffle(draw_order)
+    rank = {number: i for i, number in enumerate(draw_order)}
+
+    def win_time(board: List[int]) -> int:
+        rows = [board[i:i+5] for i in range(0, 25, 5)]
+        columns = [board[i::5] for i in range(5)]
+        return min(max(rank[n] for n in line) for line in rows + columns)
+
+    boards = [rng.sample(range(100), 25) for _ in range(size)]
+    times = [win_time(board) for board in boards]
+    last = max(times)
+    for i in [i for i, time in enumerate(times) if time == last][1:]:
+        while win_time(boards[i]) >= last:
+            boards[i] = rng.sample(range(100), 25)
+
+    lines = [','.join(str(n) for n in draw_order) + '\n']
+    for board in boards:
+        lines.append('\n')
+        for i in range(0, 25, 5):
+            lines.append(' '.join(f'{n:2}' for n in board[i:i+5]) + '\n')
+    return lines
+
+
+@generator(5, sizes=(100, 1_000, 5_000))
+def day05(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` horizontal, vertical or diagonal vent lines within a 1000×1000
+    area.
+    '''
+    lines = []
+    for _ in range(size):
+        x1, y1 = rng.randrange(1000), rng.randrange(1000)
+        dx, dy = rng.choice([(1, 0), (0, 1), (1, 1), (1, -1),
+                             (-1, 0), (0, -1), (-1, -1), (-1, 1)])
+        reach = [999 - x1, x1, 999 - y1, y1]
+        limit = min([200] + [reach[(d < 0) + 2 * axis]
+                             for axis, d in enumerate((dx, dy)) if d != 0])
+        length = rng.randint(0, limit)
+        lines.append(f'{x1},{y1} -> {x1 + dx*length},{y1 + dy*length}\n')
+    return lines
+
+
+@generator(6, sizes=(300, 3_000, 30_000))
+def day06(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` lanternfish timers.
+    '''
+    return [','.join(str(rng.randint(1, 5)) for _ in range(size)) + '\n']
+
+
+@generator(7, sizes=(100, 300, 1_000))
+def day07(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` crab positions spread over a range proportional to `size`.
+    '''
+    return [','.join(str(rng.randrange(size)) for _ in range(size)) + '\n']
+
+
+# The seven-segment wiring of each digit, indexed by the digit.
+SEGMENTS = ('abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf',
+            'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg')
+
+
+def scramble(rng: random.Random, wires: Dict[str, str], segments: str) -> str:
+    '''
+    Returns the pattern lit up by `segments` on a display with the given
+    crossed `wires`, with its letters in a random order.
+    '''
+    return ''.join(rng.sample([wires[s] for s in segments], len(segments)))
+
+
+@generator(8, sizes=(100, 1_000, 10_000))
+def day08(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` scrambled seven-segment display entries.
+    '''
+    lines = []
+    for _ in range(size):
+        wires = dict(zip('abcdefg', rng.sample('abcdefg', 7)))
+        patterns = [scramble(rng, wires, s) for s in rng.sample(SEGMENTS, 10)]
+        outputs = [scramble(rng, wires, rng.choice(SEGMENTS))
+                   for _ in range(4)]
+        lines.append(' '.join(patterns) + ' | ' + ' '.join(outputs) + '\n')
+    return lines
+
+
+@generator(9, sizes=(50, 100, 200))
+def day09(rng: random.Random, size: int) -> List[str]:
+    '''
+    A `size`×`size` height map.
+    '''
+    return digit_grid(rng, size, string.digits)
+
+
+PAIRS = {'(': ')', '[': ']', '{': '}', '<': '>'}
+
+
+def incomplete_chunks(rng: random.Random, length: int) -> Tuple[str, str]:
+    '''
+    Returns a random line of navigation subsystem chunks of at least `length`
+    characters which is incomplete but not corrupted, together with the stack
+    of chunks left open at its end.
+    '''
+    stack: List[str] = []
+    chars = []
+    while len(chars) < length or len(stack) == 0:
+        if len(stack) > 0 and rng.random() < 0.4:
+            chars.append(PAIRS[stack.pop()])
+        else:
+            stack.append(rng.choice('([{<'))
+            chars.append(stack[-1])
+    return ''.join(chars), ''.join(stack)
+
+
+@generator(10, sizes=(100, 1_000, 10_000))
+def day10(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` lines of navigation subsystem chunks, an odd number of which are
+    incomplete and the rest corrupted.
+    '''
+    lines = []
+    for i in range(size):
+        line, stack = incomplete_chunks(rng, rng.randint(20, 100))
+        if i >= size // 2 | 1:
+            expected = PAIRS[stack[-1]]
+            line += rng.choice([c for c in PAIRS.values() if c != expected])
+            line += ''.join(rng.choices('()[]{}<>', k=rng.randint(0, 10)))
+        lines.append(line + '\n')
+    rng.shuffle(lines)
+    return lines
+
+
+@generator(11, sizes=(10, 30, 100))
+def day11(rng: random.Random, size: int) -> List[str]:
+    '''
+    A `size`×`size` grid of octopus energy levels. Uniformly random grids
+    often never synchronise, so levels are drawn from 0-3, which reliably
+    synchronises within a handful of steps and keeps part 2 finite.
+    '''
+    return digit_grid(rng, size, '0123')
+
+
+@generator(12, sizes=(8, 12, 16))
+def day12(rng: random.Random, size: int) -> List[str]:
+    '''
+    A cave system with `size` small caves and half as many big caves. Big caves
+    are never connected to each other, so the number of paths is finite.
+    '''
+    small = [f'{a}{b}' for a, b in itertools.product(string.ascii_lowercase,
+                                                     repeat=2)][:size]
+    big = [name.upper() for name in small[:max(1, size // 2)]]
+    nodes = ['start', 'end'] + small
+    edges = set()
+    for cave in big:
+        for node in rng.sample(nodes, min(len(nodes), 3)):
+            edges.add((cave, node))
+    for _ in range(size):
+        node1, node2 = sorted(rng.sample(nodes, 2))
+        edges.add((node1, node2))
+    return [f'{node1}-{node2}\n' for node1, node2 in sorted(edges)]
+
+
+@generator(13, sizes=(1_000, 3_000, 10_000))
+def day13(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` dots on a sheet which folds down to the 40×6 code area.
+    '''
+    folds: List[Tuple[str, int]] = []
+    width, height = 39, 5
+    for axis in 'xyxyyy':
+        if axis == 'x':
+            folds.append(('x', width + 1))
+            width = 2 * width + 2
+        else:
+            folds.append(('y', height + 1))
+            height = 2 * height + 2
+    lines = [f'{rng.randint(0, width)},{rng.randint(0, height)}\n'
+             for _ in range(size)]
+    lines.append('\n')
+    lines.extend(f'fold along {axis}={value}\n'
+                 for axis, value in reversed(folds))
+    return lines
+
+
+@generator(14, sizes=(100, 1_000, 10_000))
+def day14(rng: random.Random, size: int) -> List[str]:
+    '''
+    A polymer template of length `size` with an insertion rule for every pair
+    of elements.
+    '''
+    elements = 'BCFHKNOPSV'
+    lines = [''.join(rng.choices(elements, k=size)) + '\n', '\n']
+    lines.extend(f'{a}{b} -> {rng.choice(elements)}\n'
+                 for a, b in itertools.product(elements, repeat=2))
+    return lines
+
+
+@generator(15, sizes=(20, 40, 80))
+def day15(rng: random.Random, size: int) -> List[str]:
+    '''
+    A `size`×`size` risk map.
+    '''
+    return digit_grid(rng, size, '123456789')
+
+
+def packet_bits(rng: random.Random, literals: int) -> str:
+    '''
+    Returns the binary encoding of a random BITS packet containing `literals`
+    literal packets in total.
+    '''
+    version = format(rng.randrange(8), '03b')
+    if literals == 1:
+        value = format(rng.randrange(1 << 16), '016b')
+        groups = [value[i:i+4] for i in range(0, 16, 4)]
+        return (version + '100'
+                + ''.join('1' + group for group in groups[:-1])
+                + '0' + groups[-1])
+
+    if literals == 2 and rng.random() < 0.5:
+        packet_type = rng.randint(5, 7)
+        counts: Sequence[int] = (1, 1)
+    else:
+        packet_type = rng.randint(0, 3)
+        cuts = sorted(rng.sample(range(1, literals), min(literals - 1, 3)))
+        counts = [b - a for a, b in zip([0] + cuts, cuts + [literals])]
+    subpackets = ''.join(packet_bits(rng, count) for count in counts)
+    if rng.random() < 0.5 and len(subpackets) < 1 << 15:
+        header = '0' + format(len(subpackets), '015b')
+    else:
+        header = '1' + format(len(counts), '011b')
+    return version + format(packet_type, '03b') + header + subpackets
+
+
+@generator(16, sizes=(10, 100, 1_000))
+def day16(rng: random.Random, size: int) -> List[str]:
+    '''
+    A hex-encoded BITS transmission containing `size` literal packets.
+    '''
+    bits = packet_bits(rng, size)
+    bits += '0' * (-len(bits) % 8)
+    return [format(int(bits, 2), f'0{len(bits) // 4}X') + '\n']
+
+
+@generator(17, sizes=(100, 300, 1_000))
+def day17(rng: random.Random, size: int) -> List[str]:
+    '''
+    A target area whose distance from the launcher is proportional to `size`.
+    '''
+    x_lower = size + rng.randrange(size)
+    y_lower = -size - rng.randrange(size)
+    return [f'target area: x={x_lower}..{x_lower + size // 2}, '
+            f'y={y_lower}..{y_lower + size // 2}\n']
+
+
+def snailfish_number(rng: random.Random, depth: int = 0) -> str:
+    '''
+    Returns a random reduced snailfish number nested no deeper than four
+    pairs.
+    '''
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randrange(10))
+    return (f'[{snailfish_number(rng, depth + 1)},'
+            f'{snailfish_number(rng, depth + 1)}]')
+
+
+@generator(18, sizes=(10, 20, 40))
+def day18(rng: random.Random, size: int) -> List[str]:
+    '''
+    `size` snailfish numbers.
+    '''
+    return [snailfish_number(rng) + '\n' for _ in range(size)]
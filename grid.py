@@ -0,0 +1,143 @@
+'''
+Compact grid of small integers for the grid-based days. Cells are stored
+row-major in a single flat bytearray, so the cell at (x, y) has index
+y * width + x, and each cell costs one byte rather than a boxed int in a
+nested list.
+
+Neighbours are found without per-step bounds checks or coordinate objects:
+every cell is assigned one of sixteen border kinds (which of the four edges
+it touches), and a precomputed table maps each kind to the index offsets of
+its in-bounds neighbours. A typical walk looks like:
+
+    kinds, offsets = grid.neighbour_table()
+    for offset in offsets[kinds[index]]:
+        neighbour = index + offset
+'''
+
+from functools import lru_cache
+import struct
+from typing import Iterable, Tuple, Union
+
+from inputs import InputBuffer
+
+# Border kind flags, combined to give each cell's kind.
+LEFT, RIGHT, TOP, BOTTOM = 1, 2, 4, 8
+
+ORTHOGONAL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+
+# Translation table from ASCII digits to their values.
+DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+# Header of a serialised grid: its width and height.
+HEADER = struct.Struct('<II')
+
+NeighbourTable = Tuple[bytes, Tuple[Tuple[int, ...], ...]]
+
+
+@lru_cache(maxsize=16)
+def neighbour_table(width: int, height: int,
+                    diagonals: bool = False) -> NeighbourTable:
+    '''
+    Returns the border kind of every cell in a grid of the given size, and the
+    neighbour index offsets for each kind: the 4-connected neighbours, plus
+    the diagonal ones if `diagonals` is set.
+    '''
+    directions = ORTHOGONAL + DIAGONAL if diagonals else ORTHOGONAL
+    offsets = []
+    for kind in range(16):
+        offsets.append(tuple(
+            dy * width + dx for dx, dy in directions
+            if not (dx < 0 and kind & LEFT or dx > 0 and kind & RIGHT
+                    or dy < 0 and kind & TOP or dy > 0 and kind & BOTTOM)))
+
+    row = bytearray(width)
+    row[0] |= LEFT
+    row[-1] |= RIGHT
+    if height == 1:
+        return bytes(b | TOP | BOTTOM for b in row), tuple(offsets)
+    top = bytes(b | TOP for b in row)
+    bottom = bytes(b | BOTTOM for b in row)
+    return top + bytes(row) * (height - 2) + bottom, tuple(offsets)
+
+
+class Grid:
+    '''
+    A width × height grid of integers in the range [0, 255].
+    '''
+
+    def __init__(self, width: int, height: int, cells: bytearray):
+        if len(cells) != width * height:
+            raise ValueError(
+                f'{len(cells)} cells given for a {width}x{height} grid')
+        self.width = width
+        self.height = height
+        self.cells = cells
+
+    @classmethod
+    def from_digits(cls, data: bytes) -> 'Grid':
+        '''
+        Parses a grid of single-digit cells, one row per line, straight from
+        bytes. Every row is assumed to be as long as the first.
+        '''
+        rows = data.split()
+        if len(rows) == 0:
+            return cls(0, 0, bytearray())
+        cells = bytearray(b''.join(rows).translate(DIGIT_VALUES))
+        return cls(len(rows[0]), len(rows), cells)
+
+    @classmethod
+    def parse(cls, lines: Iterable[str]) -> 'Grid':
+        '''
+        Parses a digit grid from the lines of a puzzle input.
+        '''
+        if isinstance(lines, InputBuffer):
+            return cls.from_digits(lines.bytes())
+        return cls.from_digits(''.join(lines).encode())
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, memoryview]) -> 'Grid':
+        '''
+        Reconstructs a grid serialised by to_bytes().
+        '''
+        width, height = HEADER.unpack_from(data)
+        return cls(width, height, bytearray(data[HEADER.size:]))
+
+    def to_bytes(self) -> bytes:
+        '''
+        Serialises this grid as its dimensions followed by its raw cells.
+        '''
+        return HEADER.pack(self.width, self.height) + self.cells
+
+    def copy(self) -> 'Grid':
+        '''
+        Returns a copy of this grid that shares none of its storage.
+        '''
+        return Grid(self.width, self.height, self.cells[:])
+
+    def index(self, x: int, y: int) -> int:
+        '''
+        Returns the index within `cells` of the cell at (x, y).
+        '''
+        return y * self.width + x
+
+    def coords(self, index: int) -> Tuple[int, int]:
+        '''
+        Returns the (x, y) coordinates of the cell at `index`.
+        '''
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def __getitem__(self, coord: Tuple[int, int]) -> int:
+        x, y = coord
+        return self.cells[y * self.width + x]
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def neighbour_table(self, diagonals: bool = False) -> NeighbourTable:
+        '''
+        Returns the border kinds and neighbour offsets for this grid's size;
+        see the module-level neighbour_table().
+        '''
+        return neighbour_table(self.width, self.height, diagonals)
@@ -0,0 +1,249 @@
+'''
+Bulk input layer for the solvers. An InputBuffer holds a whole puzzle input as
+bytes, memory-mapped when it comes from a regular file and otherwise read in
+large chunks. It still iterates as text lines, so it satisfies the
+Iterable[str] contract every solver accepts, but solvers that know about it
+can instead take zero-copy line slices or parse the entire input into words
+or numbers with a handful of C-level calls.
+
+For slow pipes, a LineStream instead reads and splits the input on a
+background thread while the solver consumes it, handing over batches of lines
+through a bounded queue so that I/O and parsing overlap.
+'''
+
+from array import array
+import mmap
+import os
+import stat
+from typing import BinaryIO, Iterator, List, Union
+
+CHUNK_SIZE = 1 << 20
+DEFAULT_BATCH_SIZE = 4096
+# Number of line batches a LineStream may read ahead of its consumer.
+MAX_BATCHES = 16
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+class InputBuffer:
+    '''
+    A complete puzzle input held in memory as bytes.
+    '''
+
+    def __init__(self, data: Buffer):
+        self.data = data
+
+    @classmethod
+    def from_file(cls, file: BinaryIO) -> 'InputBuffer':
+        '''
+        Reads the whole of the given binary file. Regular files are
+        memory-mapped rather than copied; pipes and terminals are read in
+        CHUNK_SIZE blocks.
+        '''
+        try:
+            fileno = file.fileno()
+            regular = stat.S_ISREG(os.fstat(fileno).st_mode)
+        except (AttributeError, OSError, ValueError):
+            regular = False
+        if regular and os.fstat(fileno).st_size > file.tell():
+            data = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+            if file.tell() == 0:
+                return cls(data)
+            return cls(data[file.tell():])
+
+        chunks = []
+        while chunk := file.read(CHUNK_SIZE):
+            chunks.append(chunk)
+        return cls(b''.join(chunks))
+
+    def __iter__(self) -> Iterator[str]:
+        '''
+        Iterates over the lines of the input as strings, each including its
+        trailing newline, exactly as iterating over a text file would.
+        '''
+        for line in self.byte_lines(keepends=True):
+            yield str(line, 'utf-8')
+
+    def byte_lines(self, keepends: bool = False) -> Iterator[memoryview]:
+        '''
+        Iterates over the lines of the input as zero-copy memoryview slices.
+        '''
+        view = memoryview(self.data)
+        find = self.data.find
+        start = 0
+        end = len(self.data)
+        while start < end:
+            newline = find(b'\n', start)
+            if newline < 0:
+                newline = end - 1 if keepends else end
+            yield view[start:newline + 1 if keepends else newline]
+            start = newline + 1
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def line_count(self) -> int:
+        '''
+        Returns the number of lines in the input, counting a final line
+        without a trailing newline.
+        '''
+        # mmap has no count(), so count a block at a time.
+        count = sum(self.data[start:start + CHUNK_SIZE].count(b'\n')
+                    for start in range(0, len(self.data), CHUNK_SIZE))
+        if len(self.data) > 0 and self.data[-1:] != b'\n':
+            count += 1
+        return count
+
+    def bytes(self) -> bytes:
+        '''
+        Returns the input as a bytes object, copying it if memory-mapped.
+        '''
+        if isinstance(self.data, bytes):
+            return self.data
+        return self.data[:]
+
+    def text(self) -> str:
+        '''
+        Returns the whole input decoded as a single string.
+        '''
+        return str(self.data, 'utf-8')
+
+    def fields(self) -> List[bytes]:
+        '''
+        Returns the whitespace-separated fields of the whole input.
+        '''
+        return self.bytes().split()
+
+    def ints(self, separators: bytes = b'', typecode: str = 'q') -> array:
+        '''
+        Parses every integer in the input into an array, in order. Integers
+        may be separated by whitespace or any of the characters in
+        `separators` (which therefore can't include '-' if any of the
+        integers are negative).
+        '''
+        data = self.bytes()
+        if separators:
+            data = data.translate(bytes.maketrans(
+                separators, b' ' * len(separators)))
+        return array(typecode, map(int, data.split()))
+
+
+def split_lines(text: str) -> List[str]:
+    '''
+    Splits text ending in a newline into its lines, each including its
+    newline. Only newlines end lines, as for an InputBuffer, whereas
+    str.splitlines() also splits at \\r, \\x0c and other line boundaries;
+    it's used whenever it splits exactly at the newlines, being faster.
+    '''
+    lines = text.splitlines(True)
+    if len(lines) == text.count('\n'):
+        return lines
+    return [line + '\n' for line in text.split('\n')[:-1]]
+
+
+class LineStream:
+    '''
+    The lines of a binary file, read ahead on a background thread. Lines are
+    handed to the consumer in batches of `batch_size` through a queue of at
+    most `max_batches` batches, so a slow consumer holds back the reader
+    rather than letting it buffer the whole input. A LineStream can only be
+    iterated once.
+    '''
+
+    def __init__(self, file: BinaryIO, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_batches: int = MAX_BATCHES):
+        if batch_size < 1:
+            raise ValueError('Batch size must be at least 1')
+        # Only streamed runs need the reader thread, so plain runs don't pay
+        # for importing threading.
+        # pylint: disable=import-outside-toplevel
+        import queue
+        import threading
+        self._full = queue.Full
+        self._queue: queue.Queue = queue.Queue(max_batches)
+        self._stop = threading.Event()
+        self._done = False
+        # Totals read so far; complete once the stream has been consumed.
+        self.bytes_read = 0
+        self.lines_read = 0
+        self._thread = threading.Thread(
+            target=self._read, args=(file, batch_size), daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        '''
+        Queues `item` for the consumer, waiting for space. Returns False if
+        the stream was closed in the meantime.
+        '''
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except self._full:
+                pass
+        return False
+
+    def _read(self, file: BinaryIO, batch_size: int) -> None:
+        '''
+        Reads `file` in blocks, splitting each into lines and queueing them in
+        batches, followed by a None sentinel (or the exception that stopped
+        the reader). Runs on the reader thread.
+        '''
+        # Take whatever a pipe has available rather than waiting to fill a
+        # whole block.
+        read = getattr(file, 'read1', file.read)
+        try:
+            batch: List[str] = []
+            partial = b''
+            while block := read(CHUNK_SIZE):
+                self.bytes_read += len(block)
+                end = block.rfind(b'\n') + 1
+                if end == 0:
+                    partial += block
+                    continue
+                lines = split_lines(str(partial + block[:end], 'utf-8'))
+                self.lines_read += len(lines)
+                batch.extend(lines)
+                partial = block[end:]
+                full = len(batch) - len(batch) % batch_size
+                for start in range(0, full, batch_size):
+                    if not self._put(batch[start:start + batch_size]):
+                        return
+                del batch[:full]
+            if partial:
+                batch.append(str(partial, 'utf-8'))
+                self.lines_read += 1
+            if batch and not self._put(batch):
+                return
+            self._put(None)
+        except Exception as ex:  # pylint: disable=broad-except
+            self._put(ex)
+
+    def batches(self) -> Iterator[List[str]]:
+        '''
+        Iterates over the batches of lines as the reader produces them, each
+        line including its trailing newline. Raises any exception the reader
+        encountered.
+        '''
+        while not self._done:
+            batch = self._queue.get()
+            if batch is None or isinstance(batch, Exception):
+                self._done = True
+                if batch is not None:
+                    raise batch
+                return
+            yield batch
+
+    def __iter__(self) -> Iterator[str]:
+        '''
+        Iterates over the lines of the input as strings, exactly as iterating
+        over a text file would.
+        '''
+        for batch in self.batches():
+            yield from batch
+
+    def close(self) -> None:
+        '''
+        Stops the reader thread, discarding any input not yet consumed.
+        '''
+        self._stop.set()
@@ -1,29 +1,71 @@
 #! /usr/bin/env python
 '''
 Command-line runner for Advent of Code 2021 solvers.
-Usage: ./main.py <day_number> <part_number> < input.txt
+Usage: ./main.py [options] <day_number> <part_number|both> < input.txt
+       ./main.py <command> [options...]
+
+With a part of "both", the input is parsed once and both answers are printed,
+one per line. With --format json, a single JSON object is printed instead,
+giving the answers along with the input size, the time taken to read, parse
+and solve it (in nanoseconds) and the peak resident set size of the process:
+
+    {"day": 1, "part": "both", "backend": "python", "engine": null,
+     "answers": {"1": 7, "2": 5}, "input_bytes": 40, "input_lines": 10,
+     "read_ns": 21000, "parse_ns": 9000, "solve_ns": {"1": 4000, "2": 6000},
+     "peak_rss_bytes": 10240000}
+
+JSON runs always solve the input rather than using the cache.
+
+With --engine, the input is solved by one of the day's named engines (see
+solvers.engines), such as the parallel engine of day 2, instead of the
+backend's own solvers. Engine runs also bypass the result cache, so an
+engine's answers are neither served from nor stored under the entries of
+the default solvers.
+
+With --progress, the slower solvers (days 8, 12 and 18) periodically report
+the work they've done and its rate to stderr, e.g. states/s for day 12. With
+--timeout, those solvers are aborted if still running after that many
+seconds, and the work they had done so far is reported instead of an answer.
+Only these days count their work, so the other days always run to the end.
+
+Available commands are listed in COMMANDS; run ./main.py <command> --help for
+their options.
 '''
 
+import time
+START = time.perf_counter()
+
+# pylint: disable=wrong-import-position
+import argparse
+import importlib
+import os
 import sys
+from typing import Iterable, List, Optional, Tuple
+
+from inputs import DEFAULT_BATCH_SIZE, InputBuffer, LineStream
+from profiling import (PhaseRecorder, peak_rss, phase, print_hot_functions,
+                       print_memory_usage, trace_memory)
+import solvers
+
+# Maps each subcommand to the module and function implementing it. The modules
+# are imported on demand so they add nothing to the start-up time of a single
+# solver run. For the same reason, the modules behind the cache, JSON output
+# and progress reporting are only imported by the modes that use them.
+COMMANDS = {
+    'batch': ('batch', 'main'),
+    'bench': ('bench', 'main'),
+    'serve': ('daemon', 'main'),
+    'request': ('daemon', 'request_main'),
+    'resume': ('checkpoint', 'main'),
+    'throughput': ('throughput', 'main'),
+    'trajectory': ('trajectory', 'main'),
+    'verify': ('verify', 'main'),
+}
 
-import day01
-import day02
-import day03
-import day04
-import day05
-import day06
-import day07
-import day08
-import day09
-import day10
-import day11
-import day12
-import day13
-import day14
-import day15
-import day16
-import day17
-import day18
+# Seconds between reports given by a bare --progress.
+DEFAULT_PROGRESS_INTERVAL = 1.0
+# Exit code for a run aborted by --timeout, as used by timeout(1).
+TIMEOUT_EXIT_CODE = 124
 
 
 def exit_with_error(message: str, error_code: int = -1) -> None:
@@ -39,34 +81,316 @@ def show_usage_and_exit() -> None:
     '''
     Prints the CLI usage message to stderr and exits with code -1.
     '''
-    exit_with_error('Usage: ./main.py <day_number> <part_number> < input.txt')
+    exit_with_error('Usage: ./main.py [--timing-startup] [--profile] '
+                    '[--profile-output FILE] [--memory] [--top N] '
+                    '[--no-cache | --refresh] [--cache-dir DIR] '
+                    '[--cache-max-bytes N] [--backend python|numpy] '
+                    '[--stream [--batch-size N]] [--format text|json] '
+                    '[--engine NAME] [--timeout SECONDS] '
+                    '[--progress [SECONDS]] '
+                    '<day_number> <part_number|both> < input.txt')
 
 
-if __name__ == '__main__':
-    if len(sys.argv) < 3:
-        # Insufficient arguments given
-        show_usage_and_exit()
+def interpreter_startup_time() -> Optional[float]:
+    '''
+    Returns the number of seconds between the creation of this process and the
+    first line of main.py being executed, or None if it can't be determined
+    (only supported on Linux, and limited to the resolution of clock ticks).
+    '''
+    try:
+        with open('/proc/self/stat', encoding='ascii') as stat:
+            # The process name may contain spaces, so index from its end.
+            fields = stat.read().rsplit(')', 1)[1].split()
+        started = int(fields[19]) / os.sysconf('SC_CLK_TCK')
+        now = time.clock_gettime(time.CLOCK_BOOTTIME)
+    except (OSError, IndexError, ValueError, AttributeError):
+        return None
+    return max(0.0, now - started - (time.perf_counter() - START))
+
 
-    days = [day01, day02, day03, day04, day05, day06, day07, day08, day09,
-            day10, day11, day12, day13, day14, day15, day16, day17, day18]
+def print_timings(timings: List[tuple]) -> None:
+    '''
+    Prints a table of (label, seconds) timings to stderr. Timings of None are
+    reported as unavailable.
+    '''
+    for label, seconds in timings:
+        value = 'n/a' if seconds is None else f'{seconds * 1000:10.3f} ms'
+        print(f'{label + ":":20}{value:>13}', file=sys.stderr)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    '''
+    Parses the command-line arguments for a single solver run, exiting with
+    the usage message if they're malformed.
+    '''
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.error = lambda _: show_usage_and_exit()  # type: ignore
+    parser.add_argument('day')
+    parser.add_argument('part')
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('--timing-startup', action='store_true')
+    modes.add_argument('--profile', action='store_true')
+    modes.add_argument('--memory', action='store_true')
+    parser.add_argument('--profile-output')
+    parser.add_argument('--top', type=int, default=0)
+    caching = parser.add_mutually_exclusive_group()
+    caching.add_argument('--no-cache', action='store_true')
+    caching.add_argument('--refresh', action='store_true')
+    parser.add_argument('--cache-dir')
+    parser.add_argument('--cache-max-bytes', type=int)
+    parser.add_argument('--backend', choices=solvers.BACKENDS,
+                        default=solvers.DEFAULT_BACKEND)
+    parser.add_argument('--stream', action='store_true')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    parser.add_argument('--engine')
+    parser.add_argument('--timeout', type=float)
+    parser.add_argument('--progress', type=float, nargs='?',
+                        const=DEFAULT_PROGRESS_INTERVAL)
+    args = parser.parse_args(argv)
+    if args.profile_output is not None \
+            or (args.top > 0 and not args.memory):
+        args.profile = True
+    return args
+
+
+def read_input(args: argparse.Namespace) -> Iterable[str]:
+    '''
+    Returns the puzzle input from stdin: a LineStream read on a background
+    thread if --stream was given, otherwise a complete InputBuffer.
+    '''
+    if args.stream:
+        return LineStream(sys.stdin.buffer, args.batch_size)
+    return InputBuffer.from_file(sys.stdin.buffer)
+
+
+def print_answers(answers: List[solvers.Answer]) -> None:
+    '''
+    Prints each answer on its own line.
+    '''
+    for answer in answers:
+        print(answer)
+
+
+def input_size(lines: Iterable[str]) -> Tuple[int, int]:
+    '''
+    Returns the size of an input read by read_input(), in bytes and lines. A
+    LineStream must have been consumed first.
+    '''
+    if isinstance(lines, LineStream):
+        return lines.bytes_read, lines.lines_read
+    assert isinstance(lines, InputBuffer)
+    return len(lines), lines.line_count()
+
+
+def run_json(day: int, part: str, args: argparse.Namespace) -> None:
+    '''
+    Runs the given solver on stdin and prints a JSON report of its answers,
+    input size, timings and peak memory use. For streamed input, the read
+    time only covers starting the reader; waiting for input counts towards
+    the parse time.
+    '''
+    import json  # pylint: disable=import-outside-toplevel
+    read_start = time.perf_counter_ns()
+    lines = read_input(args)
+    parse_start = time.perf_counter_ns()
+    parsed = solvers.parse(day, lines, args.backend, engine=args.engine)
+    parse_end = time.perf_counter_ns()
+    answers = {}
+    solve_ns = {}
+    for selected in solvers.selected_parts(part):
+        solve_start = time.perf_counter_ns()
+        answers[selected] = solvers.solve_parsed(
+            day, selected, parsed, args.backend, args.engine)
+        solve_ns[selected] = time.perf_counter_ns() - solve_start
+    size, line_count = input_size(lines)
+    print(json.dumps({
+        'day': day,
+        'part': part,
+        'backend': args.backend,
+        'engine': args.engine,
+        'answers': answers,
+        'input_bytes': size,
+        'input_lines': line_count,
+        'read_ns': parse_start - read_start,
+        'parse_ns': parse_end - parse_start,
+        'solve_ns': solve_ns,
+        'peak_rss_bytes': peak_rss(),
+    }))
+
+
+def run_profiled(day: int, part: str, args: argparse.Namespace) -> None:
+    '''
+    Runs the given solver on stdin and prints its answers, then reports the
+    time spent in each phase (reading, parsing, solving and formatting) to
+    stderr. If requested, the run is also profiled with cProfile, with the
+    statistics dumped to a file and/or the hottest functions printed to
+    stderr.
+    '''
+    recorder = PhaseRecorder()
+    profile = None
+    if args.profile_output is not None or args.top > 0:
+        import cProfile  # pylint: disable=import-outside-toplevel
+        profile = cProfile.Profile()
+        profile.enable()
+
+    recorder.start()
+    with phase('read'):
+        buffer = read_input(args)
+    answers = solvers.solve(day, part, buffer, args.backend,
+                            engine=args.engine)
+    with phase('format'):
+        print_answers(answers)
+    recorder.stop()
+
+    if profile is not None:
+        profile.disable()
+    print_timings(recorder.timings())
+    if args.profile_output is not None:
+        profile.dump_stats(args.profile_output)
+    if args.top > 0:
+        print_hot_functions(profile, args.top, sys.stderr)
+
+
+def run_cached(day: int, part: str, args: argparse.Namespace) -> None:
+    '''
+    Prints the answers for the given solver on stdin, using the result cache
+    unless disabled. Each part is cached separately, so running both parts
+    reuses (and fills) the entries of single-part runs. With --refresh, the
+    answers are always recomputed and the cache entries replaced. When every
+    answer is cached, the solver module isn't imported; otherwise the parsed
+    input is itself cached for the days that support it.
+    '''
+    # pylint: disable=import-outside-toplevel
+    from cache import DEFAULT_MAX_BYTES, ResultCache
+    cache = ResultCache(args.cache_dir,
+                        DEFAULT_MAX_BYTES if args.cache_max_bytes is None
+                        else args.cache_max_bytes)
+    buffer = InputBuffer.from_file(sys.stdin.buffer)
+    parts = solvers.selected_parts(part)
+    keys = [cache.key(day, selected, buffer.data) for selected in parts]
+    if not args.refresh:
+        answers = [cache.get(key) for key in keys]
+        if None not in answers:
+            print_answers(answers)  # type: ignore
+            return
+
+    answers = solvers.solve(day, part, buffer, args.backend, cache,
+                            args.engine)
+    for key, answer in zip(keys, answers):
+        cache.put(key, answer)
+    print_answers(answers)
+
+
+def run(day: int, args: argparse.Namespace) -> None:
+    '''
+    Runs the solver for `day` on stdin in the mode selected by `args`.
+    '''
+    plain = not (args.profile or args.memory or args.timing_startup)
+    # Streamed input is consumed as it arrives, so it can't be hashed up
+    # front for the cache. Cache entries hold the default solvers' answers,
+    # so engine runs always solve the input.
+    if plain and args.format == 'text' and args.engine is None \
+            and not (args.no_cache or args.stream):
+        run_cached(day, args.part, args)
+        return
+
+    solvers.load_engine(day, args.backend, args.engine)
+    if args.format == 'json':
+        run_json(day, args.part, args)
+        return
+    if args.profile:
+        run_profiled(day, args.part, args)
+        return
+    if args.memory:
+        buffer = read_input(args)
+        answers, usage = trace_memory(solvers.solve, day, args.part, buffer,
+                                      args.backend, None, args.engine,
+                                      top=args.top or 10)
+        print_answers(answers)
+        print_memory_usage(usage, sys.stderr)
+        return
+    if plain:
+        print_answers(solvers.solve(
+            day, args.part, read_input(args), args.backend,
+            engine=args.engine))
+        return
+
+    recorder = PhaseRecorder()
+    read_start = time.perf_counter()
+    lines = read_input(args)
+    solve_start = time.perf_counter()
+    recorder.start()
+    answers = solvers.solve(day, args.part, lines, args.backend,
+                            engine=args.engine)
+    recorder.stop()
+    solve_end = time.perf_counter()
+    print_answers(answers)
+    phases = dict(recorder.timings())
+    print_timings([
+        ('interpreter start', interpreter_startup_time()),
+        ('import', read_start - START),
+        ('read', solve_start - read_start),
+        ('parse', phases['parse']),
+        ('solve', phases['solve']),
+        ('total', solve_end - START)])
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Runs the solver selected by `argv` on stdin and prints its answers, or
+    hands off to the module implementing a subcommand.
+    '''
+    if len(argv) > 0 and argv[0] in COMMANDS:
+        module, function = COMMANDS[argv[0]]
+        getattr(importlib.import_module(module), function)(argv[1:])
+        return
+
+    args = parse_args(argv)
     try:
-        day = int(sys.argv[1])
+        day = int(args.day)
     except ValueError:
         # Day number couldn't be parsed as an int
         show_usage_and_exit()
 
-    if 0 < day <= len(days):
-        module = days[day-1]
-    else:
-        exit_with_error(
-                f"Invalid day '{day}'; "
-                f"day must be between 1 and {len(days)} inclusive.")
-
-    match part := sys.argv[2]:
-        case '1': fn = module.part1
-        case '2': fn = module.part2
-        case _:
-            exit_with_error(
-                    f"Invalid part '{part}'; part must be either 1 or 2.")
-
-    print(fn(sys.stdin))
+    try:
+        solvers.check_day(day)
+        solvers.check_part(args.part)
+    except ValueError as error:
+        exit_with_error(str(error))
+    if not solvers.backend_available(args.backend):
+        print(f"The {args.backend} backend isn't installed; falling back to "
+              f"{solvers.DEFAULT_BACKEND}.", file=sys.stderr)
+        args.backend = solvers.DEFAULT_BACKEND
+    if args.engine is not None:
+        try:
+            solvers.load_engine(day, args.backend, args.engine)
+        except ValueError as error:
+            exit_with_error(str(error))
+
+    plain = not (args.profile or args.memory or args.timing_startup)
+    if args.batch_size < 1:
+        exit_with_error('Batch size must be at least 1.')
+    if args.format == 'json' and not plain:
+        exit_with_error("--format json can't be combined with "
+                        '--timing-startup, --profile or --memory.')
+    if args.timeout is not None and args.timeout <= 0 \
+            or args.progress is not None and args.progress <= 0:
+        exit_with_error('--timeout and --progress must be positive.')
+    if args.timeout is None and args.progress is None:
+        run(day, args)
+        return
+    # pylint: disable=import-outside-toplevel
+    from progress import BudgetExceeded, ProgressMeter
+    meter = ProgressMeter(args.timeout, args.progress, sys.stderr)
+    meter.start()
+    try:
+        run(day, args)
+    except BudgetExceeded as exceeded:
+        exit_with_error(str(exceeded), TIMEOUT_EXIT_CODE)
+    finally:
+        meter.stop()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,215 @@
+'''
+Lightweight per-phase profiling and memory tracing for the solvers. Solvers
+mark the phases of their work with the `phase` context manager:
+
+    with phase('parse'):
+        data = parse_input(lines)
+
+When no PhaseRecorder is active, `phase` returns a shared do-nothing context
+manager, so the markers cost only a function call. Phases may nest, in which
+case time spent in the inner phase is not counted towards the outer one.
+'''
+
+import sys
+import time
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+_recorder: Optional['PhaseRecorder'] = None
+
+
+class PhaseRecorder:
+    '''
+    Accumulates the exclusive time spent in each named phase while it's
+    active, i.e. between calls to start() and stop().
+    '''
+
+    def __init__(self):
+        self.totals: Dict[str, float] = {}
+        self._stack: List[List] = []
+
+    def start(self) -> None:
+        '''
+        Makes this the recorder that `phase` reports to.
+        '''
+        global _recorder  # pylint: disable=global-statement
+        _recorder = self
+
+    def stop(self) -> None:
+        '''
+        Stops recording phases.
+        '''
+        global _recorder  # pylint: disable=global-statement
+        _recorder = None
+
+    def enter(self, name: str) -> None:
+        '''
+        Records the start of the named phase, pausing the enclosing one.
+        '''
+        now = time.perf_counter()
+        if len(self._stack) > 0:
+            self._charge(self._stack[-1], now)
+        self._stack.append([name, now])
+
+    def exit(self) -> None:
+        '''
+        Records the end of the innermost phase, resuming the enclosing one.
+        '''
+        now = time.perf_counter()
+        self._charge(self._stack.pop(), now)
+        if len(self._stack) > 0:
+            self._stack[-1][1] = now
+
+    def _charge(self, frame: List, now: float) -> None:
+        name, start = frame
+        self.totals[name] = self.totals.get(name, 0.0) + now - start
+
+    def timings(self) -> List[Tuple[str, float]]:
+        '''
+        Returns the (phase name, seconds) totals in order of first use.
+        '''
+        return list(self.totals.items())
+
+
+class _Phase:
+    '''
+    Context manager marking a phase on the active recorder.
+    '''
+
+    def __init__(self, recorder: PhaseRecorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.recorder.enter(self.name)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.exit()
+
+
+class _NullPhase:
+    '''
+    Context manager that does nothing, used while no recorder is active.
+    '''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def phase(name: str):
+    '''
+    Returns a context manager marking the enclosed code as belonging to the
+    named phase. Does nothing unless a PhaseRecorder has been started.
+    '''
+    if _recorder is None:
+        return _NULL_PHASE
+    return _Phase(_recorder, name)
+
+
+def print_hot_functions(profile, top: int, file) -> None:
+    '''
+    Prints the `top` functions of a cProfile.Profile, ranked by the time spent
+    in the function itself, to `file`.
+    '''
+    import pstats  # pylint: disable=import-outside-toplevel
+    stats = pstats.Stats(profile, stream=file)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+
+
+class MemoryUsage(NamedTuple):
+    '''
+    Memory traced while running a solver: the peak number of bytes allocated
+    at once, and the largest allocation sites as (file:line, bytes, blocks)
+    tuples.
+    '''
+    peak: int
+    sites: List[Tuple[str, int, int]]
+
+
+def trace_memory(fn: Callable, *args, top: int = 0) \
+        -> Tuple[Any, MemoryUsage]:
+    '''
+    Calls `fn(*args)` with tracemalloc enabled, returning its result and the
+    memory it used. If `top` is positive, the `top` largest allocation sites
+    around the time of peak usage are reported as well. These are found by
+    snapshotting the traced allocations whenever a function returns with
+    usage more than 5% above the last snapshot, which slows the call down
+    considerably.
+    '''
+    import tracemalloc  # pylint: disable=import-outside-toplevel
+    snapshots = []
+    high_water = [0]
+
+    def on_return(_frame, event, _arg):
+        if event == 'return':
+            current, _ = tracemalloc.get_traced_memory()
+            if current > high_water[0] * 1.05:
+                high_water[0] = current
+                snapshots.append(tracemalloc.take_snapshot())
+                del snapshots[:-1]
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    if top > 0:
+        sys.setprofile(on_return)
+    try:
+        result = fn(*args)
+    finally:
+        sys.setprofile(None)
+        _, peak = tracemalloc.get_traced_memory()
+        if top > 0 and len(snapshots) == 0:
+            snapshots.append(tracemalloc.take_snapshot())
+        tracemalloc.stop()
+
+    sites = []
+    if top > 0:
+        snapshot = snapshots[-1].filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        for stat in snapshot.statistics('lineno')[:top]:
+            frame = stat.traceback[0]
+            sites.append((f'{frame.filename}:{frame.lineno}',
+                          stat.size, stat.count))
+    return result, MemoryUsage(peak, sites)
+
+
+def peak_rss() -> Optional[int]:
+    '''
+    Returns the peak resident set size of this process in bytes, or None if
+    it can't be determined on this platform.
+    '''
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes; macOS reports bytes.
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def format_bytes(size: float) -> str:
+    '''
+    Formats a number of bytes in human-readable binary units.
+    '''
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GiB'
+
+
+def print_memory_usage(usage: MemoryUsage, file) -> None:
+    '''
+    Prints the peak memory and top allocation sites in `usage` to `file`.
+    '''
+    print(f'peak memory: {format_bytes(usage.peak)}', file=file)
+    for location, size, count in usage.sites:
+        print(f'  {format_bytes(size):>12} in {count:>8} blocks  {location}',
+              file=file)
@@ -0,0 +1,162 @@
+'''
+Cooperative progress reporting and deadlines for long-running solvers.
+Solvers count units of work in their main loops with a counter:
+
+    tick = counter('paths')
+    for path in paths:
+        tick()
+
+When no ProgressMeter is active, `counter` returns a shared do-nothing
+function, so the ticks cost only a call. While a meter is active, each
+counter checks the clock every so often (aiming for about CHECK_INTERVAL
+seconds between checks, whatever the cost of a unit) to print the throughput
+to its output and to raise BudgetExceeded once the deadline has passed.
+'''
+
+import time
+from typing import Callable, Dict, Optional, TextIO
+
+# Target number of seconds between clock checks.
+CHECK_INTERVAL = 0.01
+
+_meter: Optional['ProgressMeter'] = None
+
+
+class BudgetExceeded(Exception):
+    '''
+    Raised from within a solver when the active meter's deadline passes. It
+    carries the work counted up to that point.
+    '''
+
+    def __init__(self, elapsed: float, counts: Dict[str, int]):
+        self.elapsed = elapsed
+        self.counts = counts
+        super().__init__(
+            f'Time budget exceeded after {elapsed:.3f} s'
+            + ''.join(f'; {summary}' for summary in self.summaries()))
+
+    def summaries(self):
+        '''
+        Yields a "<count> <unit> (<rate> <unit>/s)" summary for each unit.
+        '''
+        for unit, count in self.counts.items():
+            rate = count / self.elapsed if self.elapsed > 0 else 0
+            yield f'{count} {unit} ({rate:.1f} {unit}/s)'
+
+
+class ProgressMeter:
+    '''
+    Counts the units of work done by solvers while it's active, i.e. between
+    calls to start() and stop(). If `timeout` is given, solvers are aborted
+    with BudgetExceeded that many seconds after start(); if `interval` is
+    given, the throughput is written to `output` that often.
+    '''
+
+    def __init__(self, timeout: Optional[float] = None,
+                 interval: Optional[float] = None,
+                 output: Optional[TextIO] = None):
+        self.timeout = timeout
+        self.interval = interval
+        self.output = output
+        self.counts: Dict[str, int] = {}
+        self._started = 0.0
+        self._deadline = float('inf')
+        self._next_report = float('inf')
+        self._last_counts: Dict[str, int] = {}
+        self._last_report = 0.0
+
+    def start(self) -> None:
+        '''
+        Starts the clock and makes this the meter that counters report to.
+        '''
+        global _meter  # pylint: disable=global-statement
+        self._started = self._last_report = time.monotonic()
+        if self.timeout is not None:
+            self._deadline = self._started + self.timeout
+        if self.interval is not None:
+            self._next_report = self._started + self.interval
+        _meter = self
+
+    def stop(self) -> None:
+        '''
+        Stops counting work.
+        '''
+        global _meter  # pylint: disable=global-statement
+        _meter = None
+
+    def elapsed(self) -> float:
+        '''
+        Returns the number of seconds since start().
+        '''
+        return time.monotonic() - self._started
+
+    def counter(self, unit: str) -> Callable[[], None]:
+        '''
+        Returns a function counting one unit of work each time it's called.
+        '''
+        self.counts.setdefault(unit, 0)
+        done = 0
+        stride = 1
+        next_check = 1
+        last_check = time.monotonic()
+
+        def tick() -> None:
+            nonlocal done, stride, next_check, last_check
+            done += 1
+            if done < next_check:
+                return
+            now = time.monotonic()
+            self.counts[unit] += stride
+            # Adapt the stride so that checks happen every CHECK_INTERVAL,
+            # growing it at most twofold at a time.
+            spent = now - last_check
+            target = stride * CHECK_INTERVAL / spent if spent > 0 else stride
+            stride = max(1, min(stride * 2, int(target)))
+            next_check = done + stride
+            last_check = now
+            self.check(now)
+
+        return tick
+
+    def check(self, now: float) -> None:
+        '''
+        Reports the throughput if it's due, and raises BudgetExceeded if the
+        deadline has passed.
+        '''
+        if now >= self._deadline:
+            raise BudgetExceeded(now - self._started, dict(self.counts))
+        if now >= self._next_report:
+            self.report(now)
+            while self._next_report <= now:
+                self._next_report += self.interval or float('inf')
+
+    def report(self, now: float) -> None:
+        '''
+        Writes the work counted so far, and the rate since the last report,
+        to the output.
+        '''
+        spent = now - self._last_report
+        rates = []
+        for unit, count in self.counts.items():
+            recent = count - self._last_counts.get(unit, 0)
+            rate = recent / spent if spent > 0 else 0
+            rates.append(f'{count} {unit} ({rate:.1f} {unit}/s)')
+        self._last_counts = dict(self.counts)
+        self._last_report = now
+        if self.output is not None:
+            print(f'progress: {now - self._started:8.3f} s  '
+                  + ', '.join(rates), file=self.output, flush=True)
+
+
+def _null_tick() -> None:
+    pass
+
+
+def counter(unit: str) -> Callable[[], None]:
+    '''
+    Returns a function to be called once per unit of work. Does nothing
+    unless a ProgressMeter has been started.
+    '''
+    if _meter is None:
+        return _null_tick
+    return _meter.counter(unit)
@@ -0,0 +1,240 @@
+'''
+Lazy registry of the Advent of Code 2021 solvers. Day modules are only
+imported when one of their solvers is requested, so a single run of main.py
+pays the import cost of just the day it needs.
+
+Every day module splits its solvers into a shared `parse` step and per-part
+`solve1`/`solve2` steps, so both parts can be answered from a single parse of
+the input by asking for part BOTH.
+
+Solvers can also run on an alternative backend. A day supports a backend by
+having a `dayNN_<backend>` module with the same interface as `dayNN`; days
+without one, and every day when the backend's library isn't installed, fall
+back to the pure Python solvers.
+
+Each day can also have several engines: independent implementations of the
+same parse/solve interface. The day module's own solvers are its reference
+engine, unless it registers another under REFERENCE in a module-level
+`ENGINES` dict, in which case its own solvers become DEFAULT_ENGINE. Any
+other entries in `ENGINES`, and the day's alternative backend modules, are
+fast engines to be checked against the reference (see verify.py).
+'''
+
+import importlib
+import importlib.util
+from types import ModuleType
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List,
+                    NamedTuple, Optional, Tuple, Union)
+
+from profiling import phase
+
+if TYPE_CHECKING:
+    from cache import ResultCache
+
+DAYS = range(1, 19)
+PARTS = ('1', '2')
+BOTH = 'both'
+BACKENDS = ('python', 'numpy')
+DEFAULT_BACKEND = 'python'
+REFERENCE = 'reference'
+DEFAULT_ENGINE = 'default'
+
+Answer = Union[int, str]
+Solver = Callable[[Iterable[str]], Answer]
+
+
+class Engine(NamedTuple):
+    '''
+    One implementation of a day's parse and per-part solve steps.
+    '''
+    parse: Callable[[Iterable[str]], Any]
+    solve1: Callable[[Any], Answer]
+    solve2: Callable[[Any], Answer]
+
+    @classmethod
+    def of(cls, module: ModuleType) -> 'Engine':
+        '''
+        Returns the engine made up of a day module's own solvers.
+        '''
+        return cls(module.parse, module.solve1, module.solve2)
+
+    def solve(self, part: str, lines: Iterable[str]) -> Answer:
+        '''
+        Parses `lines` and returns the answer to a single part.
+        '''
+        if part not in PARTS:
+            raise ValueError(f"Invalid part '{part}'; part must be 1 or 2.")
+        solver = self.solve1 if part == '1' else self.solve2
+        return solver(self.parse(lines))
+
+
+def module_name(day: int) -> str:
+    '''
+    Returns the name of the module containing the solvers for `day`.
+    '''
+    return f'day{day:02d}'
+
+
+def check_day(day: int) -> None:
+    '''
+    Raises a ValueError if there is no solver module for `day`.
+    '''
+    if day not in DAYS:
+        raise ValueError(
+                f"Invalid day '{day}'; "
+                f"day must be between {DAYS[0]} and {DAYS[-1]} inclusive.")
+
+
+def check_part(part: str) -> None:
+    '''
+    Raises a ValueError if `part` doesn't name one of the solver parts, or
+    BOTH.
+    '''
+    if part not in PARTS and part != BOTH:
+        raise ValueError(
+                f"Invalid part '{part}'; part must be 1, 2 or {BOTH}.")
+
+
+def selected_parts(part: str) -> Tuple[str, ...]:
+    '''
+    Returns the parts selected by `part`, expanding BOTH into every part.
+    '''
+    check_part(part)
+    return PARTS if part == BOTH else (part,)
+
+
+def check_backend(backend: str) -> None:
+    '''
+    Raises a ValueError if `backend` doesn't name one of the BACKENDS.
+    '''
+    if backend not in BACKENDS:
+        raise ValueError(
+                f"Invalid backend '{backend}'; backend must be one of "
+                f"{', '.join(BACKENDS)}.")
+
+
+def backend_available(backend: str) -> bool:
+    '''
+    Returns True if the library behind `backend` is installed.
+    '''
+    check_backend(backend)
+    return backend == DEFAULT_BACKEND \
+        or importlib.util.find_spec(backend) is not None
+
+
+def load_day(day: int, backend: str = DEFAULT_BACKEND) -> ModuleType:
+    '''
+    Imports and returns the module containing the solvers for `day` on the
+    given backend, falling back to the pure Python module if the day has no
+    such backend or its library isn't installed. Raises a ValueError if no
+    such day or backend exists.
+    '''
+    check_day(day)
+    check_backend(backend)
+    if backend != DEFAULT_BACKEND:
+        name = f'{module_name(day)}_{backend}'
+        try:
+            return importlib.import_module(name)
+        except ModuleNotFoundError as error:
+            if error.name not in (name, backend):
+                raise
+    return importlib.import_module(module_name(day))
+
+
+def get_solver(day: int, part: str,
+               backend: str = DEFAULT_BACKEND) -> Solver:
+    '''
+    Returns the solver for the given day and part, importing its module on
+    first use. The solver for BOTH parses its input once and returns both
+    answers, one per line. Raises a ValueError if either the day, part or
+    backend is invalid.
+    '''
+    check_part(part)
+    if part == BOTH:
+        load_day(day, backend)
+        return lambda lines: '\n'.join(
+            str(answer) for answer in solve(day, BOTH, lines, backend))
+    return getattr(load_day(day, backend), f'part{part}')
+
+
+def solve(day: int, part: str, lines: Iterable[str],
+          backend: str = DEFAULT_BACKEND,
+          cache: Optional['ResultCache'] = None,
+          engine: Optional[str] = None) -> List[Answer]:
+    '''
+    Parses `lines` once with the given day's parser, then returns the answer
+    to each part selected by `part`, in order. If a cache is given, the
+    parsed input is loaded from (or stored in) it where the day supports
+    that. The parse and each solve are marked as 'parse' and 'solve'
+    profiling phases. If `engine` names one of the day's engines, it is used
+    instead of the backend's solvers.
+    '''
+    parts = selected_parts(part)
+    parsed = parse(day, lines, backend, cache, engine)
+    return [solve_parsed(day, selected, parsed, backend, engine)
+            for selected in parts]
+
+
+def parse(day: int, lines: Iterable[str], backend: str = DEFAULT_BACKEND,
+          cache: Optional['ResultCache'] = None,
+          engine: Optional[str] = None) -> Any:
+    '''
+    Parses `lines` with the given day's parser, within a 'parse' profiling
+    phase. See solve() for the use of `cache` and `engine`; parsed inputs
+    are only cached for the backend's own solvers.
+    '''
+    solver = load_engine(day, backend, engine)
+    with phase('parse'):
+        if cache is None or engine is not None:
+            return solver.parse(lines)
+        return cache.parse(solver, lines)
+
+
+def solve_parsed(day: int, part: str, parsed: Any,
+                 backend: str = DEFAULT_BACKEND,
+                 engine: Optional[str] = None) -> Answer:
+    '''
+    Returns the answer to a single part for input already parsed by parse(),
+    within a 'solve' profiling phase.
+    '''
+    check_part(part)
+    solver = getattr(load_engine(day, backend, engine), f'solve{part}')
+    with phase('solve'):
+        return solver(parsed)
+
+
+def engines(day: int) -> Dict[str, Engine]:
+    '''
+    Returns every engine for `day` by name, starting with its REFERENCE
+    engine. Backends whose library isn't installed are left out.
+    '''
+    module = load_day(day)
+    registered: Dict[str, Engine] = dict(getattr(module, 'ENGINES', {}))
+    own = Engine.of(module)
+    if REFERENCE in registered:
+        found = {REFERENCE: registered.pop(REFERENCE), DEFAULT_ENGINE: own}
+    else:
+        found = {REFERENCE: own}
+    found.update(registered)
+    for backend in BACKENDS:
+        if backend != DEFAULT_BACKEND and backend_available(backend):
+            if (alternative := load_day(day, backend)) is not module:
+                found[backend] = Engine.of(alternative)
+    return found
+
+
+def load_engine(day: int, backend: str = DEFAULT_BACKEND,
+                engine: Optional[str] = None) -> Union[ModuleType, Engine]:
+    '''
+    Returns the named engine for `day`, or the day's module on the given
+    backend if `engine` is None. Either has the day module's parse and
+    solve1/solve2 functions. Raises a ValueError if there's no such engine.
+    '''
+    if engine is None:
+        return load_day(day, backend)
+    found = engines(day)
+    if engine not in found:
+        raise ValueError(
+                f"Invalid engine '{engine}' for day {day}; engine must be "
+                f"one of {', '.join(found)}.")
+    return found[engine]
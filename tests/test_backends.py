@@ -0,0 +1,63 @@
+'''
+Test cases for the alternative solver backends.
+'''
+
+import importlib.util
+import unittest
+
+import generators
+from inputs import InputBuffer
+import solvers
+
+NUMPY_DAYS = (1, 3, 5, 9, 11)
+
+
+@unittest.skipIf(importlib.util.find_spec('numpy') is None,
+                 'NumPy is not installed')
+class TestNumpyBackend(unittest.TestCase):
+    '''
+    Test cases checking the NumPy solvers against the pure Python ones.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_days_are_routed_to_numpy(self):
+        for day in NUMPY_DAYS:
+            self.assertEqual(solvers.load_day(day, 'numpy').__name__,
+                             f'{solvers.module_name(day)}_numpy')
+
+    def test_other_days_fall_back_to_python(self):
+        self.assertEqual(solvers.load_day(2, 'numpy').__name__, 'day02')
+
+    def test_same_answers_as_python(self):
+        for day in NUMPY_DAYS:
+            _, sizes = generators.GENERATORS[day]
+            for size in sizes[:2]:
+                data = ''.join(generators.generate(day, size))
+                with self.subTest(day=day, size=size):
+                    self.assertEqual(
+                        solvers.solve(day, solvers.BOTH, data.splitlines(True),
+                                      'numpy'),
+                        solvers.solve(day, solvers.BOTH,
+                                      InputBuffer(data.encode())))
+
+    def test_window_sizes(self):
+        lines = generators.generate(1, 200)
+        python, fast = solvers.load_day(1), solvers.load_day(1, 'numpy')
+        for window in (1, 2, 3, 7, 50):
+            with self.subTest(window=window):
+                self.assertEqual(fast.solve2(fast.parse(lines), window),
+                                 python.solve2(python.parse(lines), window))
+
+
+class TestBackends(unittest.TestCase):
+    '''
+    Test cases for selecting backends.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_invalid_backend(self):
+        with self.assertRaises(ValueError):
+            solvers.get_solver(1, '1', 'fortran')
+
+    def test_python_is_always_available(self):
+        self.assertTrue(solvers.backend_available(solvers.DEFAULT_BACKEND))
@@ -0,0 +1,39 @@
+'''
+Test cases for the batch runner.
+'''
+
+import os
+import tempfile
+import unittest
+
+import batch
+
+
+class TestBatch(unittest.TestCase):
+    '''
+    Test cases for finding and running batch tasks.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        with open(os.path.join(self.tmp.name, 'day07.txt'), 'w',
+                  encoding='utf-8') as file:
+            file.write('16,1,2,0,4,2,7,1,2,14\n')
+
+    def test_find_tasks(self):
+        self.assertEqual(
+            [(day, part) for day, part, _ in batch.find_tasks(self.tmp.name)],
+            [(7, '1'), (7, '2')])
+
+    def test_run_all(self):
+        results = batch.run_all(batch.find_tasks(self.tmp.name), workers=2)
+        self.assertEqual([result.answer for result in results], [37, 168])
+        self.assertTrue(all(result.error is None for result in results))
+
+    def test_run_task_captures_errors(self):
+        path = os.path.join(self.tmp.name, 'day07.txt')
+        result = batch.run_task(4, '1', path)
+        self.assertIsNone(result.answer)
+        self.assertIsNotNone(result.error)
@@ -0,0 +1,56 @@
+'''
+Test cases for the benchmark suite and its input generators.
+'''
+
+import unittest
+
+import bench
+import generators
+import solvers
+
+
+class TestGenerators(unittest.TestCase):
+    '''
+    Test cases for the synthetic input generators.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_every_day_has_a_generator(self):
+        self.assertEqual(sorted(generators.GENERATORS), list(solvers.DAYS))
+
+    def test_generated_inputs_are_solvable(self):
+        for day in solvers.DAYS:
+            size = generators.GENERATORS[day][1][0]
+            lines = generators.generate(day, size)
+            for part in solvers.PARTS:
+                with self.subTest(day=day, part=part):
+                    solvers.get_solver(day, part)(lines)
+
+    def test_generation_is_deterministic(self):
+        self.assertEqual(generators.generate(4, 10, seed=1),
+                         generators.generate(4, 10, seed=1))
+        self.assertNotEqual(generators.generate(4, 10, seed=1),
+                            generators.generate(4, 10, seed=2))
+
+
+class TestBench(unittest.TestCase):
+    '''
+    Test cases for comparing benchmark results against a baseline.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.baseline = [{'day': 1, 'part': '1', 'size': 10, 'seconds': 1.0},
+                         {'day': 1, 'part': '2', 'size': 10, 'seconds': 1.0}]
+
+    def test_regression_detected(self):
+        results = [{'day': 1, 'part': '1', 'size': 10, 'seconds': 1.2},
+                   {'day': 1, 'part': '2', 'size': 10, 'seconds': 1.05}]
+        regressions = bench.find_regressions(results, self.baseline, 10)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('day 1 part 1', regressions[0])
+
+    def test_unmatched_results_ignored(self):
+        results = [{'day': 2, 'part': '1', 'size': 10, 'seconds': 9.0}]
+        self.assertEqual(bench.find_regressions(results, self.baseline, 10),
+                         [])
@@ -0,0 +1,133 @@
+'''
+Test cases for the on-disk result cache.
+'''
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import cache
+from cache import ResultCache
+import day02
+from inputs import InputBuffer
+import main
+import solvers
+
+
+class TestResultCache(unittest.TestCase):
+    '''
+    Test cases for storing, retrieving and evicting cached answers.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache = ResultCache(self.tmp.name)
+
+    def test_round_trip(self):
+        int_key = self.cache.key(1, '1', b'199\n200\n')
+        str_key = self.cache.key(13, '2', b'6,10\n')
+        self.assertIsNone(self.cache.get(int_key))
+        self.cache.put(int_key, 7)
+        self.cache.put(str_key, '  ██\n██  ')
+        self.assertEqual(self.cache.get(int_key), 7)
+        self.assertEqual(self.cache.get(str_key), '  ██\n██  ')
+
+    def test_keys_differ_by_day_part_and_input(self):
+        keys = {self.cache.key(1, '1', b'1\n'), self.cache.key(2, '1', b'1\n'),
+                self.cache.key(1, '2', b'1\n'), self.cache.key(1, '1', b'2\n')}
+        self.assertEqual(len(keys), 4)
+
+    def test_least_recently_used_evicted(self):
+        self.cache.put('probe', 0)
+        entry_usage = cache.disk_usage(
+            os.stat(os.path.join(self.tmp.name, 'probe')))
+        os.remove(os.path.join(self.tmp.name, 'probe'))
+        # Entries are counted by the blocks they occupy, not their length.
+        limit = ResultCache(self.tmp.name, max_bytes=2 * entry_usage)
+        for i, key in enumerate(['a', 'b', 'c']):
+            limit.put(key, 1000 + i)
+            used = time.time() - 100 + i
+            os.utime(os.path.join(self.tmp.name, key), (used, used))
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), ['b', 'c'])
+
+    def test_temporary_files(self):
+        fresh = os.path.join(self.tmp.name, 'fresh' + cache.TEMP_SUFFIX)
+        stale = os.path.join(self.tmp.name, 'stale' + cache.TEMP_SUFFIX)
+        for path in (fresh, stale):
+            with open(path, 'wb') as file:
+                file.write(b'int\n1')
+        used = time.time() - 2 * cache.STALE_TEMP_SECONDS
+        os.utime(stale, (used, used))
+        ResultCache(self.tmp.name, max_bytes=0).put('a', 1)
+        self.assertEqual(os.listdir(self.tmp.name), [os.path.basename(fresh)])
+
+    def test_unparseable_entries_are_misses(self):
+        for text in (b'', b'int\n', b'int\nabc', b'\xff\xfe'):
+            with self.subTest(text=text):
+                with open(os.path.join(self.tmp.name, 'a'), 'wb') as file:
+                    file.write(text)
+                self.assertIsNone(self.cache.get('a'))
+        data = b'116\n138\n213\n'
+        module = solvers.load_day(15)
+        self.cache.put_bytes(self.cache.parsed_key(module, data), b'12')
+        parsed = self.cache.parse(module, InputBuffer(data))
+        self.assertEqual(module.solve1(parsed), 7)
+
+    def test_parsed_round_trip(self):
+        inputs = {
+            5: b'0,9 -> 5,9\n8,0 -> 0,8\n9,4 -> 3,4\n',
+            7: b'16,1,2,0,4,2,7,1,2,14\n',
+            15: b'116\n138\n213\n',
+        }
+        for day, data in inputs.items():
+            module = solvers.load_day(day)
+            with self.subTest(day=day):
+                parsed = self.cache.parse(module, InputBuffer(data))
+                self.assertIsNotNone(self.cache.get_bytes(
+                    self.cache.parsed_key(module, data)))
+                loaded = self.cache.parse(module, InputBuffer(data))
+                for part in solvers.PARTS:
+                    solve = getattr(module, f'solve{part}')
+                    self.assertEqual(solve(loaded), solve(parsed))
+
+    def test_parsed_skipped_without_serialiser(self):
+        module = solvers.load_day(1)
+        self.cache.parse(module, InputBuffer(b'199\n200\n'))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+class TestCachedRuns(unittest.TestCase):
+    '''
+    Test cases for command-line runs that go through the result cache.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def run_main(self, argv, data: bytes) -> str:
+        stdin = io.TextIOWrapper(io.BytesIO(data))
+        output = io.StringIO()
+        with mock.patch('sys.stdin', stdin), \
+                contextlib.redirect_stdout(output):
+            main.main(argv + ['--cache-dir', self.tmp.name])
+        return output.getvalue()
+
+    def test_engine_runs_bypass_cache(self):
+        data = b'forward 5\ndown 5\nforward 8\nup 3\ndown 8\nforward 2\n'
+        broken = solvers.Engine(day02.parse, lambda _: -1, lambda _: -2)
+        with mock.patch.dict(day02.ENGINES, {'broken': broken}):
+            self.assertEqual(
+                self.run_main(['2', 'both', '--engine', 'broken'], data),
+                '-1\n-2\n')
+        self.assertEqual(self.run_main(['2', 'both'], data), '150\n900\n')
+        self.assertEqual(
+            self.run_main(['2', 'both', '--engine', 'parallel'], data),
+            '150\n900\n')
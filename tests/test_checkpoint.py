@@ -0,0 +1,69 @@
+'''
+Test cases for resuming solvers from checkpoints on growing inputs.
+'''
+
+import os
+import tempfile
+import unittest
+
+import checkpoint
+import generators
+import solvers
+
+
+class TestCheckpoint(unittest.TestCase):
+    '''
+    Test cases for saving solver state and resuming from it.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.input = os.path.join(self.tmp.name, 'input.txt')
+        self.checkpoint = os.path.join(self.tmp.name, 'input.checkpoint')
+
+    def append(self, data: bytes) -> None:
+        with open(self.input, 'ab') as file:
+            file.write(data)
+
+    def test_resumes_on_growing_input(self):
+        for day in (1, 2, 10):
+            data = ''.join(generators.generate(day, 300, seed=1)).encode()
+            expected = solvers.solve(day, solvers.BOTH, data.decode()
+                                     .splitlines(keepends=True))
+            with self.subTest(day=day):
+                open(self.input, 'wb').close()
+                # Cut mid-line too, to cover incomplete final lines.
+                cuts = [0, len(data) // 3 + 1, len(data) // 2, len(data)]
+                for start, end in zip(cuts, cuts[1:]):
+                    self.append(data[start:end])
+                    answers = checkpoint.resume(day, self.input,
+                                                self.checkpoint)
+                self.assertEqual(answers, expected)
+                self.assertEqual(checkpoint.load(self.checkpoint).offset,
+                                 len(data))
+                os.remove(self.checkpoint)
+
+    def test_only_new_data_is_read(self):
+        self.append(b'1\n2\n3\n4\n')
+        checkpoint.resume(1, self.input, self.checkpoint)
+        saved = checkpoint.load(self.checkpoint)
+        self.assertEqual(saved.offset, 8)
+        self.assertEqual(saved.state['last'], [2, 3, 4])
+        self.append(b'1\n5\n')
+        self.assertEqual(
+            checkpoint.resume(1, self.input, self.checkpoint), [4, 2])
+
+    def test_replaced_input_is_solved_from_scratch(self):
+        self.append(b'forward 5\ndown 5\n')
+        checkpoint.resume(2, self.input, self.checkpoint)
+        with open(self.input, 'wb') as file:
+            file.write(b'forward 2\ndown 3\nforward 4\n')
+        self.assertEqual(
+            checkpoint.resume(2, self.input, self.checkpoint), [18, 72])
+
+    def test_unsupported_day(self):
+        self.append(b'3,4,3,1,2\n')
+        with self.assertRaises(ValueError):
+            checkpoint.resume(6, self.input, self.checkpoint)
@@ -0,0 +1,41 @@
+'''
+Test cases for packed integer coordinates.
+'''
+
+import unittest
+
+import coords
+
+
+class TestCoords(unittest.TestCase):
+    '''
+    Test cases for packing, moving and bounding coordinates.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_round_trip(self):
+        for x, y in [(0, 0), (3, 7), (-5, 2), (4, -9), (-1, -1)]:
+            point = coords.pack(x, y)
+            self.assertEqual(coords.unpack(point), (x, y))
+            self.assertEqual((coords.x_of(point), coords.y_of(point)), (x, y))
+
+    def test_offsets_are_additive(self):
+        for dx, dy in [(1, 0), (-1, 0), (0, -1), (-3, 4), (2, -2)]:
+            self.assertEqual(coords.pack(0, 5) + coords.offset(dx, dy),
+                             coords.pack(dx, 5 + dy))
+
+    def test_neighbours_within_bounds(self):
+        corner = set(coords.neighbours(coords.pack(0, 0), 3, 3))
+        self.assertEqual({coords.unpack(p) for p in corner}, {(1, 0), (0, 1)})
+        centre = list(coords.neighbours(coords.pack(1, 1), 3, 3, True))
+        self.assertEqual(len(centre), 8)
+        self.assertFalse(coords.in_bounds(coords.pack(3, 0), 3, 3))
+
+    def test_line(self):
+        for start, end, expected in [
+                ((1, 1), (1, 3), [(1, 1), (1, 2), (1, 3)]),
+                ((9, 7), (7, 7), [(9, 7), (8, 7), (7, 7)]),
+                ((9, 7), (7, 9), [(9, 7), (8, 8), (7, 9)]),
+                ((2, 2), (2, 2), [(2, 2)])]:
+            points = coords.line(coords.pack(*start), coords.pack(*end))
+            self.assertEqual([coords.unpack(p) for p in points], expected)
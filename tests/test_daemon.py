@@ -0,0 +1,76 @@
+'''
+Test cases for the solver daemon.
+'''
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+import daemon
+
+
+class TestDaemon(unittest.TestCase):
+    '''
+    Test cases for pipelined requests to a running daemon.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'daemon.sock')
+        pool = ProcessPoolExecutor(max_workers=2)
+        self.addCleanup(pool.shutdown)
+
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        async def start():
+            server = await asyncio.start_unix_server(
+                daemon.Daemon(pool, quiet=True).handle, self.path)
+            started.set()
+            async with server:
+                await server.serve_forever()
+
+        task = loop.create_task(start())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        started.wait()
+
+        def stop():
+            loop.call_soon_threadsafe(task.cancel)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+        self.addCleanup(stop)
+
+    def test_pipelined_requests(self):
+        requests = [(7, '1', b'16,1,2,0,4,2,7,1,2,14\n'),
+                    (1, '1', b'199\n200\n208\n210\n200\n207\n240\n269\n'
+                             b'260\n263\n'),
+                    (7, '2', b'16,1,2,0,4,2,7,1,2,14\n')] * 10
+        responses = daemon.request_many(self.path, requests)
+        self.assertEqual([response.body for response in responses],
+                         ['37', '7', '168'] * 10)
+        self.assertTrue(all(response.ok for response in responses))
+
+    def test_errors_reported_in_order(self):
+        responses = daemon.request_many(
+            self.path, [(19, '1', b''), (4, '1', b'garbage\n'),
+                        (7, '1', b'1,2,3\n')])
+        self.assertEqual([response.ok for response in responses],
+                         [False, False, True])
+        self.assertEqual(responses[2].body, '2')
+
+    def test_negative_length_rejected(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(b'7 1 -5\n1,2,3\n')
+            with sock.makefile('rb') as stream:
+                status, _, size = stream.readline().split()
+                body = stream.read(int(size)).decode()
+        self.assertEqual(status, b'error')
+        self.assertIn('Malformed request header', body)
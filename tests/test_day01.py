@@ -0,0 +1,60 @@
+'''
+Example test cases for Day 1 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import io
+import unittest
+
+from day01 import count_increases, part1, part2, solve2
+from inputs import InputBuffer, LineStream
+
+
+class TestDay01(unittest.TestCase):
+    '''
+    Example test cases for Day 1, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = '199 200 208 210 200 207 240 269 260 263'.split()
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 7)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 5)
+
+    def test_part1_bulk_input(self):
+        self.assertEqual(part1(self.bulk()), 7)
+
+    def test_part2_bulk_input(self):
+        self.assertEqual(part2(self.bulk()), 5)
+
+    def test_part1_streamed_input(self):
+        self.assertEqual(part1(self.streamed()), 7)
+
+    def test_part2_streamed_input(self):
+        self.assertEqual(part2(self.streamed()), 5)
+
+    def test_window_sizes(self):
+        depths = [int(depth) for depth in self.data]
+        for window in range(1, len(depths) + 1):
+            sums = [sum(depths[i:i + window])
+                    for i in range(len(depths) - window + 1)]
+            with self.subTest(window=window):
+                self.assertEqual(
+                    solve2(depths, window),
+                    sum(1 for a, b in zip(sums, sums[1:]) if b > a))
+        self.assertEqual(solve2(depths), 5)
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            count_increases([1, 2, 3], 0)
+
+    def bulk(self):
+        return InputBuffer(
+            ''.join(line.rstrip('\n') + '\n' for line in self.data).encode())
+
+    def streamed(self):
+        return LineStream(io.BytesIO(self.bulk().bytes()), batch_size=3)
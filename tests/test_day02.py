@@ -0,0 +1,77 @@
+'''
+Example test cases for Day 2 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import functools
+import io
+import unittest
+from unittest import mock
+
+import day02
+from day02 import part1, part2
+from inputs import InputBuffer, LineStream
+
+
+class TestDay02(unittest.TestCase):
+    '''
+    Example test cases for Day 2, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            'forward 5',
+            'down 5',
+            'forward 8',
+            'up 3',
+            'down 8',
+            'forward 2'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 150)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 900)
+
+    def test_part1_bulk_input(self):
+        self.assertEqual(part1(self.bulk()), 150)
+
+    def test_part2_bulk_input(self):
+        self.assertEqual(part2(self.bulk()), 900)
+
+    def test_part1_streamed_input(self):
+        self.assertEqual(part1(self.streamed()), 150)
+
+    def test_part2_streamed_input(self):
+        self.assertEqual(part2(self.streamed()), 900)
+
+    def test_summaries_combine(self):
+        data = self.bulk().bytes()
+        expected = day02.summarise(data)
+        self.assertEqual(expected[0] * expected[2], 900)
+        for count in range(1, len(self.data) + 2):
+            ranges = day02.split_lines(data, count)
+            with self.subTest(count=count):
+                self.assertEqual(
+                    b''.join(data[start:end] for start, end in ranges), data)
+                self.assertTrue(all(data[end - 1] == ord('\n')
+                                    for _, end in ranges))
+                self.assertEqual(functools.reduce(
+                    day02.combine,
+                    (day02.summarise(data[start:end])
+                     for start, end in ranges), (0, 0, 0)), expected)
+
+    def test_parallel_engine(self):
+        data = self.bulk().bytes() * 50
+        with mock.patch.object(day02, 'MIN_RANGE_BYTES', 64):
+            self.assertEqual(day02.summarise_parallel(data, workers=3),
+                             day02.summarise(data))
+
+    def bulk(self):
+        return InputBuffer(
+            ''.join(line.rstrip('\n') + '\n' for line in self.data).encode())
+
+    def streamed(self):
+        return LineStream(io.BytesIO(self.bulk().bytes()), batch_size=3)
@@ -0,0 +1,53 @@
+'''
+Example test cases for Day 3 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import random
+import unittest
+
+import day03
+from day03 import part1, part2
+from inputs import InputBuffer
+
+
+class TestDay03(unittest.TestCase):
+    '''
+    Example test cases for Day 3, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = (('00100 11110 10110 10111 10101 01111 '
+                      '00111 11100 10000 11001 00010 01010')
+                     .replace(' ', '\n ')
+                     .split(' '))
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 198)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 230)
+
+    def test_bulk_input(self):
+        data = InputBuffer(''.join(self.data).encode())
+        self.assertEqual(part1(data), 198)
+        self.assertEqual(part2(data), 230)
+
+    def test_same_answers_as_reference(self):
+        rng = random.Random(3)
+        for width in (1, 2, 3, 5, 6, 13, 40):
+            for size in (1, 2, 3, 5, 20):
+                rows = [f'{rng.getrandbits(width):0{width}b}\n'
+                        for _ in range(size)]
+                with self.subTest(rows=rows):
+                    reference = day03.parse_reference(rows)
+                    report = day03.parse(rows)
+                    self.assertEqual(day03.solve1(report),
+                                     day03.solve1_reference(reference))
+                    self.assertEqual(day03.solve2(report),
+                                     day03.solve2_reference(reference))
+
+    def test_uneven_rows(self):
+        with self.assertRaises(ValueError):
+            day03.parse(['101\n', '11\n'])
@@ -0,0 +1,88 @@
+'''
+Example test cases for Day 4 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import random
+import unittest
+from unittest import mock
+
+import day04
+from day04 import part1, part2
+from inputs import InputBuffer
+
+
+class TestDay04(unittest.TestCase):
+    '''
+    Example test cases for Day 4, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '7,4,9,5,11,17,23,2,0,14,21,24,10,16,13,6,15,25,12,22,18,20,8,19,'
+            '3,26,1',
+            '',
+            '22 13 17 11  0',
+            ' 8  2 23  4 24',
+            '21  9 14 16  7',
+            ' 6 10  3 18  5',
+            ' 1 12 20 15 19',
+            '',
+            ' 3 15  0  2 22',
+            ' 9 18 13 17  5',
+            '19  8  7 25 23',
+            '20 11 10 24  4',
+            '14 21 16 12  6',
+            '',
+            '14 21 17 24  4',
+            '10 16 15  9 19',
+            '18  8 23 26 20',
+            '22 11 13  6  5',
+            ' 2  0 12  3  7']
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 4512)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 1924)
+
+    def test_bulk_input(self):
+        data = InputBuffer('\n'.join(self.data).encode())
+        self.assertEqual(part1(data), 4512)
+        self.assertEqual(part2(data), 1924)
+
+    def test_same_answers_as_reference(self):
+        # Small number ranges and short, repetitive draws give ties, boards
+        # that never win and numbers drawn twice.
+        rng = random.Random(4)
+        for _ in range(200):
+            draw_order = [rng.randrange(30) for _ in range(rng.randrange(40))]
+            lines = [','.join(map(str, draw_order or [0])) + '\n']
+            for _ in range(rng.randrange(1, 4)):
+                lines.append('\n')
+                numbers = rng.sample(range(30), 25)
+                lines.extend(' '.join(map(str, numbers[i:i + 5])) + '\n'
+                             for i in range(0, 25, 5))
+            for solve, reference in ((day04.solve1, day04.solve1_reference),
+                                     (day04.solve2, day04.solve2_reference)):
+                with self.subTest(lines=lines, solver=solve.__name__):
+                    self.assertEqual(self.outcome(solve, day04.parse(lines)),
+                                     self.outcome(
+                                         reference,
+                                         day04.parse_reference(lines)))
+
+    def test_parallel_win_times(self):
+        draw_order, boards = day04.parse(self.data)
+        boards = boards * 10
+        with mock.patch.object(day04, 'MIN_CHUNK_BOARDS', 4):
+            self.assertEqual(
+                day04.win_times_parallel(draw_order, boards, workers=3),
+                day04.win_times(draw_order, boards))
+
+    @staticmethod
+    def outcome(solve, game):
+        try:
+            return solve(game)
+        except ValueError as error:
+            return str(error)
@@ -0,0 +1,45 @@
+'''
+Example test cases for Day 5 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day05 import part1, part2
+from inputs import InputBuffer
+
+
+class TestDay05(unittest.TestCase):
+    '''
+    Example test cases for Day 5, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '0,9 -> 5,9',
+            '8,0 -> 0,8',
+            '9,4 -> 3,4',
+            '2,2 -> 2,1',
+            '7,0 -> 7,4',
+            '6,4 -> 2,0',
+            '0,9 -> 2,9',
+            '3,4 -> 1,4',
+            '0,0 -> 8,8',
+            '5,5 -> 8,2']
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 5)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 12)
+
+    def test_part1_bulk_input(self):
+        self.assertEqual(part1(self.bulk()), 5)
+
+    def test_part2_bulk_input(self):
+        self.assertEqual(part2(self.bulk()), 12)
+
+    def bulk(self):
+        return InputBuffer(
+            ''.join(line.rstrip('\n') + '\n' for line in self.data).encode())
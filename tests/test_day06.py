@@ -0,0 +1,24 @@
+'''
+Example test cases for Day 6 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day06 import part1, part2
+
+
+class TestDay06(unittest.TestCase):
+    '''
+    Example test cases for Day 6, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = ["3,4,3,1,2"]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 5934)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 26984457539)
@@ -0,0 +1,24 @@
+'''
+Example test cases for Day 7 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day07 import part1, part2
+
+
+class TestDay07(unittest.TestCase):
+    '''
+    Example test cases for Day 7, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = ['16,1,2,0,4,2,7,1,2,14']
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 37)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 168)
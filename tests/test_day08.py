@@ -0,0 +1,45 @@
+'''
+Example test cases for Day 8 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day08 import part1, part2
+
+
+class TestDay08(unittest.TestCase):
+    '''
+    Example test cases for Day 8, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            'be cfbegad cbdgef fgaecd cgeb fdcge agebfd fecdb fabcd edb | '
+            'fdgacbe cefdb cefbgd gcbe',
+            'edbfga begcd cbg gc gcadebf fbgde acbgfd abcde gfcbed gfec | '
+            'fcgedb cgb dgebacf gc',
+            'fgaebd cg bdaec gdafb agbcfd gdcbef bgcad gfac gcb cdgabef | '
+            'cg cg fdcagb cbg',
+            'fbegcd cbd adcefb dageb afcb bc aefdc ecdab fgdeca fcdbega | '
+            'efabcd cedba gadfec cb',
+            'aecbfdg fbg gf bafeg dbefa fcge gcbea fcaegb dgceab fcbdga | '
+            'gecf egdcabf bgf bfgea',
+            'fgeab ca afcebg bdacfeg cfaedg gcfdb baec bfadeg bafgc acf | '
+            'gebdcfa ecba ca fadegcb',
+            'dbcfg fgd bdegcaf fgec aegbdf ecdfab fbedc dacgb gdcebf gf | '
+            'cefg dcbef fcge gbcadfe',
+            'bdfegc cbegaf gecbf dfcage bdacg ed bedf ced adcbefg gebcd | '
+            'ed bcgafe cdgba cbgef',
+            'egadfb cdbfeg cegd fecab cgb gbdefca cg fgcdab egfdb bfceg | '
+            'gbdfcae bgc cg cgb',
+            'gcafb gcf dcaebfg ecagb gf abcdeg gaef cafbge fdbac fegbdc | '
+            'fgae cfgab fg bagce'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 26)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 61229)
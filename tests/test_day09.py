@@ -0,0 +1,30 @@
+'''
+Example test cases for Day 9 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day09 import part1, part2
+
+
+class TestDay09(unittest.TestCase):
+    '''
+    Example test cases for Day 9, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '2199943210\n',
+            '3987894921\n',
+            '9856789892\n',
+            '8767896789\n',
+            '9899965678\n'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 15)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 1134)
@@ -0,0 +1,65 @@
+'''
+Example test cases for Day 10 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import io
+import unittest
+
+from day10 import part1, part2
+from inputs import InputBuffer, LineStream
+
+
+class TestDay10(unittest.TestCase):
+    '''
+    Example test cases for Day 10, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '[({(<(())[]>[[{[]{<()<>>\n',
+            '[(()[<>])]({[<{<<[]>>(\n',
+            '{([(<{}[<>[]}>{[]{[(<()>\n',
+            '(((({<>}<{<{<>}{[]{[]{}\n',
+            '[[<[([]))<([[{}[[()]]]\n',
+            '[{[{({}]{}}([{[{{{}}([]\n',
+            '{<[[]]>}<{[{[{[]{()[[[]\n',
+            '[<(<(<(<{}))><([]([]()\n',
+            '<{([([[(<>()){}]>(<<{{\n',
+            '<{([{{}}[<[[[<>{}]]]>[]]'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 26397)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 288957)
+
+    def test_part1_bulk_input(self):
+        self.assertEqual(part1(self.bulk()), 26397)
+
+    def test_part2_bulk_input(self):
+        self.assertEqual(part2(self.bulk()), 288957)
+
+    def test_part1_streamed_input(self):
+        self.assertEqual(part1(self.streamed()), 26397)
+
+    def test_part2_streamed_input(self):
+        self.assertEqual(part2(self.streamed()), 288957)
+
+    def test_deeply_nested_line(self):
+        # A single pass per line, however deep its chunks are nested.
+        data = self.data + ['(' * 5000 + ')' * 5000 + '\n',
+                            '<' * 5000 + ')' + '\n']
+        self.data = data
+        for lines in (data, self.bulk(), self.streamed()):
+            with self.subTest(lines=type(lines).__name__):
+                self.assertEqual(part1(lines), 26397 + 3)
+
+    def bulk(self):
+        return InputBuffer(
+            ''.join(line.rstrip('\n') + '\n' for line in self.data).encode())
+
+    def streamed(self):
+        return LineStream(io.BytesIO(self.bulk().bytes()), batch_size=3)
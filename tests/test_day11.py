@@ -0,0 +1,35 @@
+'''
+Example test cases for Day 11 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day11 import part1, part2
+
+
+class TestDay11(unittest.TestCase):
+    '''
+    Example test cases for Day 11, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '5483143223\n',
+            '2745854711\n',
+            '5264556173\n',
+            '6141336146\n',
+            '6357385478\n',
+            '4167524645\n',
+            '2176841721\n',
+            '6882881134\n',
+            '4846848554\n',
+            '5283751526'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 1656)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 195)
@@ -0,0 +1,78 @@
+'''
+Example test cases for Day 12 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day12 import part1, part2
+
+
+class TestDay12(unittest.TestCase):
+    '''
+    Example test cases for Day 12, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.example1 = [
+            'start-A\n',
+            'start-b\n',
+            'A-c\n',
+            'A-b\n',
+            'b-d\n',
+            'A-end\n',
+            'b-end'
+        ]
+
+        self.example2 = [
+            'dc-end\n',
+            'HN-start\n',
+            'start-kj\n',
+            'dc-start\n',
+            'dc-HN\n',
+            'LN-dc\n',
+            'HN-end\n',
+            'kj-sa\n',
+            'kj-HN\n',
+            'kj-dc'
+        ]
+
+        self.example3 = [
+            'fs-end\n',
+            'he-DX\n',
+            'fs-he\n',
+            'start-DX\n',
+            'pj-DX\n',
+            'end-zg\n',
+            'zg-sl\n',
+            'zg-pj\n',
+            'pj-he\n',
+            'RW-he\n',
+            'fs-DX\n',
+            'pj-RW\n',
+            'zg-RW\n',
+            'start-pj\n',
+            'he-WI\n',
+            'zg-he\n',
+            'pj-fs\n',
+            'start-RW'
+        ]
+
+    def test_part1_example1(self):
+        self.assertEqual(part1(self.example1), 10)
+
+    def test_part1_example2(self):
+        self.assertEqual(part1(self.example2), 19)
+
+    def test_part1_example3(self):
+        self.assertEqual(part1(self.example3), 226)
+
+    def test_part2_example1(self):
+        self.assertEqual(part2(self.example1), 36)
+
+    def test_part2_example2(self):
+        self.assertEqual(part2(self.example2), 103)
+
+    def test_part2_example3(self):
+        self.assertEqual(part2(self.example3), 3509)
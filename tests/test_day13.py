@@ -0,0 +1,54 @@
+'''
+Example test cases for Day 13 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day13 import part1, part2
+
+
+class TestDay13(unittest.TestCase):
+    '''
+    Example test cases for Day 13, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '6,10\n',
+            '0,14\n',
+            '9,10\n',
+            '0,3\n',
+            '10,4\n',
+            '4,11\n',
+            '6,0\n',
+            '6,12\n',
+            '4,1\n',
+            '0,13\n',
+            '10,12\n',
+            '3,4\n',
+            '3,0\n',
+            '8,4\n',
+            '1,10\n',
+            '2,14\n',
+            '8,10\n',
+            '9,0\n',
+            '\n',
+            'fold along y=7\n',
+            'fold along x=5'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 17)
+
+    def test_part2_example(self):
+        expected = '\n'.join(line.ljust(82) for line in [
+            '              ',
+            '  ██████████  ',
+            '  ██      ██  ',
+            '  ██      ██  ',
+            '  ██      ██  ',
+            '  ██████████  ',
+            '              '])
+        self.assertEqual(part2(self.data), expected)
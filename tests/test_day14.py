@@ -0,0 +1,43 @@
+'''
+Example test cases for Day 14 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day14 import part1, part2
+
+
+class TestDay14(unittest.TestCase):
+    '''
+    Example test cases for Day 14, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            'NNCB\n',
+            '\n',
+            'CH -> B\n',
+            'HH -> N\n',
+            'CB -> H\n',
+            'NH -> C\n',
+            'HB -> C\n',
+            'HC -> B\n',
+            'HN -> C\n',
+            'NN -> C\n',
+            'BH -> H\n',
+            'NC -> B\n',
+            'NB -> B\n',
+            'BN -> B\n',
+            'BB -> N\n',
+            'BC -> B\n',
+            'CC -> N\n',
+            'CN -> C'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 1588)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 2188189693529)
@@ -0,0 +1,35 @@
+'''
+Example test cases for Day 15 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day15 import part1, part2
+
+
+class TestDay15(unittest.TestCase):
+    '''
+    Example test cases for Day 15, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '1163751742\n',
+            '1381373672\n',
+            '2136511328\n',
+            '3694931569\n',
+            '7463417111\n',
+            '1319128137\n',
+            '1359912421\n',
+            '3125421639\n',
+            '1293138521\n',
+            '2311944581'
+        ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 40)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 315)
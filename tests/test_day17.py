@@ -0,0 +1,24 @@
+'''
+Example test cases for Day 17 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day17 import part1, part2
+
+
+class TestDay17(unittest.TestCase):
+    '''
+    Example test cases for Day 17, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = ['target area: x=20..30, y=-10..-5']
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 45)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 112)
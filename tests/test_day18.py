@@ -0,0 +1,35 @@
+'''
+Example test cases for Day 18 of the Advent of Code 2021, as specified in
+the problem description.
+'''
+
+import unittest
+
+from day18 import part1, part2
+
+
+class TestDay18(unittest.TestCase):
+    '''
+    Example test cases for Day 18, as specified in the problem description
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.data = [
+            '[[[0,[5,8]],[[1,7],[9,6]]],[[4,[1,2]],[[1,4],2]]]\n',
+            '[[[5,[2,8]],4],[5,[[9,9],0]]]\n',
+            '[6,[[[6,2],[5,6]],[[7,6],[4,7]]]]\n',
+            '[[[6,[0,7]],[0,9]],[4,[9,[9,0]]]]\n',
+            '[[[7,[6,4]],[3,[1,3]]],[[[5,5],1],9]]\n',
+            '[[6,[[7,3],[3,2]]],[[[3,8],[5,7]],4]]\n',
+            '[[[[5,4],[7,7]],8],[[8,3],8]]\n',
+            '[[9,3],[[9,9],[6,[4,9]]]]\n',
+            '[[2,[[7,7],7]],[[5,8],[[9,3],[0,2]]]]\n',
+            '[[[[5,2],5],[8,[3,7]]],[[5,[7,5]],[4,4]]]'
+            ]
+
+    def test_part1_example(self):
+        self.assertEqual(part1(self.data), 4140)
+
+    def test_part2_example(self):
+        self.assertEqual(part2(self.data), 3993)
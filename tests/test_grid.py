@@ -0,0 +1,59 @@
+'''
+Test cases for the compact grid type.
+'''
+
+import unittest
+
+from grid import Grid, neighbour_table
+from inputs import InputBuffer
+
+
+class TestGrid(unittest.TestCase):
+    '''
+    Test cases for parsing grids and walking their neighbours.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.grid = Grid.from_digits(b'123\n456\n789\n')
+
+    def test_from_digits(self):
+        self.assertEqual((self.grid.width, self.grid.height), (3, 3))
+        self.assertEqual(list(self.grid.cells), list(range(1, 10)))
+        self.assertEqual(self.grid[2, 1], 6)
+        self.assertEqual(self.grid.coords(self.grid.index(1, 2)), (1, 2))
+
+    def test_parse(self):
+        lines = ['123\n', '456\n', '789']
+        self.assertEqual(Grid.parse(lines).cells, self.grid.cells)
+        self.assertEqual(
+            Grid.parse(InputBuffer(''.join(lines).encode())).cells,
+            self.grid.cells)
+
+    def test_copy_is_independent(self):
+        copy = self.grid.copy()
+        copy.cells[0] = 0
+        self.assertEqual(self.grid.cells[0], 1)
+
+    def test_orthogonal_neighbours(self):
+        kinds, offsets = self.grid.neighbour_table()
+        neighbours = [sorted(self.grid.cells[i + offset]
+                             for offset in offsets[kinds[i]])
+                      for i in range(len(self.grid))]
+        self.assertEqual(neighbours[0], [2, 4])
+        self.assertEqual(neighbours[4], [2, 4, 6, 8])
+        self.assertEqual(neighbours[5], [3, 5, 9])
+
+    def test_diagonal_neighbours(self):
+        kinds, offsets = self.grid.neighbour_table(diagonals=True)
+        self.assertEqual(len(offsets[kinds[0]]), 3)
+        self.assertEqual(len(offsets[kinds[1]]), 5)
+        self.assertEqual(len(offsets[kinds[4]]), 8)
+
+    def test_single_row_and_column(self):
+        kinds, offsets = neighbour_table(4, 1)
+        self.assertEqual([offsets[kind] for kind in kinds],
+                         [(1,), (-1, 1), (-1, 1), (-1,)])
+        kinds, offsets = neighbour_table(1, 3)
+        self.assertEqual([offsets[kind] for kind in kinds],
+                         [(1,), (-1, 1), (-1,)])
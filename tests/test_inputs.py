@@ -0,0 +1,113 @@
+'''
+Test cases for the bulk input layer.
+'''
+
+import io
+import tempfile
+import unittest
+
+from inputs import InputBuffer, LineStream
+
+
+class TestInputBuffer(unittest.TestCase):
+    '''
+    Test cases for reading and splitting bulk inputs.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_iterates_like_a_text_file(self):
+        text = '199\n\n200\n208'
+        self.assertEqual(list(InputBuffer(text.encode())),
+                         list(io.StringIO(text)))
+
+    def test_byte_lines(self):
+        buffer = InputBuffer(b'a b\n\ncd\n')
+        self.assertEqual([bytes(line) for line in buffer.byte_lines()],
+                         [b'a b', b'', b'cd'])
+
+    def test_ints(self):
+        buffer = InputBuffer(b'0,9 -> 5,9\n8,0 -> 0,8\n')
+        self.assertEqual(list(buffer.ints(separators=b',->')),
+                         [0, 9, 5, 9, 8, 0, 0, 8])
+
+    def test_from_regular_file_is_mapped(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b'forward 5\ndown 5\n')
+            file.seek(0)
+            buffer = InputBuffer.from_file(file)
+            self.assertNotIsInstance(buffer.data, bytes)
+            self.assertEqual(buffer.text(), 'forward 5\ndown 5\n')
+
+    def test_size(self):
+        self.assertEqual(len(InputBuffer(b'1\n2\n3')), 5)
+        self.assertEqual(InputBuffer(b'1\n2\n3').line_count(), 3)
+        self.assertEqual(InputBuffer(b'1\n2\n').line_count(), 2)
+        self.assertEqual(InputBuffer(b'').line_count(), 0)
+
+    def test_from_stream(self):
+        buffer = InputBuffer.from_file(io.BytesIO(b'1\n2\n'))
+        self.assertEqual(list(buffer.ints()), [1, 2])
+
+
+class TestLineStream(unittest.TestCase):
+    '''
+    Test cases for reading lines on a background thread.
+    '''
+    # pylint: disable=missing-function-docstring,protected-access
+
+    def test_iterates_like_a_text_file(self):
+        text = '199\n\n200\n208'
+        self.assertEqual(list(LineStream(io.BytesIO(text.encode()))),
+                         list(io.StringIO(text)))
+
+    def test_splits_on_newlines_only(self):
+        data = b'ab\x0ccd\n1\r2\n\xe2\x80\xa8\nx\r\n'
+        stream = LineStream(io.BytesIO(data))
+        self.assertEqual(list(stream), list(InputBuffer(data)))
+        self.assertEqual(stream.lines_read, 4)
+
+    def test_batches(self):
+        data = b''.join(b'%d\n' % i for i in range(10))
+        stream = LineStream(io.BytesIO(data), batch_size=4)
+        self.assertEqual([len(batch) for batch in stream.batches()],
+                         [4, 4, 2])
+        self.assertEqual(list(stream), [])
+        self.assertEqual((stream.bytes_read, stream.lines_read),
+                         (len(data), 10))
+
+    def test_lines_split_across_blocks(self):
+        class Trickle(io.RawIOBase):
+            '''
+            A stream returning a few bytes per read, like a slow pipe.
+            '''
+            def __init__(self, data):
+                self.data = data
+
+            def read1(self, size=-1):
+                chunk, self.data = self.data[:3], self.data[3:]
+                return chunk
+
+        text = 'forward 5\ndown 5\nup 3\n'
+        self.assertEqual(list(LineStream(Trickle(text.encode()))),
+                         text.splitlines(True))
+
+    def test_reader_waits_for_consumer(self):
+        data = b''.join(b'%d\n' % i for i in range(100))
+        stream = LineStream(io.BytesIO(data), batch_size=1, max_batches=2)
+        batches = stream.batches()
+        next(batches)
+        # The reader can only get a bounded distance ahead of the consumer.
+        self.assertLessEqual(stream._queue.qsize(), 2)
+        self.assertEqual(len(list(batches)), 99)
+
+    def test_reader_errors_are_raised(self):
+        stream = LineStream(io.BytesIO(b'\xff\n'))
+        with self.assertRaises(UnicodeDecodeError):
+            list(stream)
+
+    def test_close_stops_reader(self):
+        data = b'1\n' * 1000
+        stream = LineStream(io.BytesIO(data), batch_size=1, max_batches=1)
+        stream.close()
+        stream._thread.join(timeout=5)
+        self.assertFalse(stream._thread.is_alive())
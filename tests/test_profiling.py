@@ -0,0 +1,45 @@
+'''
+Test cases for the per-phase profiling hooks.
+'''
+
+import time
+import unittest
+
+from profiling import PhaseRecorder, peak_rss, phase, trace_memory
+
+
+class TestProfiling(unittest.TestCase):
+    '''
+    Test cases for recording phase timings.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_phase_is_noop_when_inactive(self):
+        with phase('parse'):
+            pass
+        self.assertIs(phase('parse'), phase('solve'))
+
+    def test_nested_phases_are_exclusive(self):
+        recorder = PhaseRecorder()
+        recorder.start()
+        try:
+            with phase('solve'):
+                with phase('parse'):
+                    time.sleep(0.02)
+        finally:
+            recorder.stop()
+        timings = dict(recorder.timings())
+        self.assertEqual(list(timings), ['solve', 'parse'])
+        self.assertGreaterEqual(timings['parse'], 0.02)
+        self.assertLess(timings['solve'], 0.02)
+
+    def test_trace_memory(self):
+        result, usage = trace_memory(lambda n: len([0] * n), 100_000, top=3)
+        self.assertEqual(result, 100_000)
+        self.assertGreaterEqual(usage.peak, 100_000 * 8)
+        self.assertLessEqual(len(usage.sites), 3)
+
+    def test_peak_rss(self):
+        if (peak := peak_rss()) is not None:
+            # Even a bare interpreter needs more than a megabyte.
+            self.assertGreater(peak, 1 << 20)
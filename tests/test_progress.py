@@ -0,0 +1,91 @@
+'''
+Test cases for the cooperative progress and deadline facility.
+'''
+
+import io
+import time
+import unittest
+
+import day12
+from progress import BudgetExceeded, ProgressMeter, counter
+
+
+class TestProgress(unittest.TestCase):
+    '''
+    Test cases for counting work, reporting it and enforcing deadlines.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_counter_is_noop_when_inactive(self):
+        self.assertIs(counter('paths'), counter('pairs'))
+        counter('paths')()
+
+    def test_counts_work(self):
+        meter = ProgressMeter()
+        meter.start()
+        try:
+            tick = counter('lines')
+            for _ in range(5):
+                tick()
+        finally:
+            meter.stop()
+        self.assertGreaterEqual(meter.counts['lines'], 1)
+        self.assertLessEqual(meter.counts['lines'], 5)
+
+    def test_deadline(self):
+        meter = ProgressMeter(timeout=0.01)
+        meter.start()
+        try:
+            with self.assertRaises(BudgetExceeded) as context:
+                tick = counter('pairs')
+                while True:
+                    tick()
+        finally:
+            meter.stop()
+        self.assertGreaterEqual(context.exception.elapsed, 0.01)
+        self.assertGreater(context.exception.counts['pairs'], 0)
+        self.assertIn('pairs/s', str(context.exception))
+
+    def test_reports(self):
+        output = io.StringIO()
+        meter = ProgressMeter(interval=0.01, output=output)
+        meter.start()
+        try:
+            tick = counter('paths')
+            end = time.monotonic() + 0.05
+            while time.monotonic() < end:
+                tick()
+        finally:
+            meter.stop()
+        self.assertIn('paths/s', output.getvalue())
+
+    def test_solver_is_aborted(self):
+        small = 'cdefghijk'
+        lines = ['start-A\n', 'A-end\n']
+        lines += [f'A-{cave}\n' for cave in small]
+        lines += [f'{a}-{b}\n' for i, a in enumerate(small)
+                  for b in small[i + 1:]]
+        meter = ProgressMeter(timeout=0.05)
+        meter.start()
+        try:
+            with self.assertRaises(BudgetExceeded) as context:
+                day12.part2(lines)
+        finally:
+            meter.stop()
+        self.assertGreater(context.exception.counts['states'], 0)
+
+    def test_search_without_paths_is_aborted(self):
+        # No path reaches the end, so only the search itself is counted.
+        small = 'cdefghijk'
+        lines = [f'start-{cave}\n' for cave in small]
+        lines += [f'{a}-{b}\n' for i, a in enumerate(small)
+                  for b in small[i + 1:]]
+        lines.append('xy-end\n')
+        meter = ProgressMeter(timeout=0.05)
+        meter.start()
+        try:
+            with self.assertRaises(BudgetExceeded) as context:
+                day12.part2(lines)
+        finally:
+            meter.stop()
+        self.assertLess(context.exception.elapsed, 1)
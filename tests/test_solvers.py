@@ -0,0 +1,52 @@
+'''
+Test cases for the lazy solver registry.
+'''
+
+import sys
+import unittest
+
+import generators
+import solvers
+
+
+class TestSolvers(unittest.TestCase):
+    '''
+    Test cases for looking up solvers by day and part.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_every_day_has_both_parts(self):
+        for day in solvers.DAYS:
+            for part in solvers.PARTS:
+                self.assertTrue(callable(solvers.get_solver(day, part)))
+
+    def test_only_requested_day_is_imported(self):
+        sys.modules.pop('day17', None)
+        solvers.get_solver(16, '1')
+        self.assertNotIn('day17', sys.modules)
+
+    def test_invalid_day(self):
+        with self.assertRaises(ValueError):
+            solvers.get_solver(19, '1')
+
+    def test_invalid_part(self):
+        with self.assertRaises(ValueError):
+            solvers.get_solver(1, '3')
+
+    def test_both_parts_match_separate_runs(self):
+        for day in solvers.DAYS:
+            _, sizes = generators.GENERATORS[day]
+            lines = generators.generate(day, sizes[0])
+            expected = [solvers.get_solver(day, part)(lines)
+                        for part in solvers.PARTS]
+            with self.subTest(day=day):
+                self.assertEqual(
+                    solvers.solve(day, solvers.BOTH, lines), expected)
+                self.assertEqual(
+                    solvers.get_solver(day, solvers.BOTH)(lines),
+                    '\n'.join(str(answer) for answer in expected))
+
+    def test_parse_once_solve_separately(self):
+        parsed = solvers.parse(7, ['16,1,2,0,4,2,7,1,2,14\n'])
+        self.assertEqual([solvers.solve_parsed(7, part, parsed)
+                          for part in solvers.PARTS], [37, 168])
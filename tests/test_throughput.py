@@ -0,0 +1,88 @@
+'''
+Test cases for the multi-input throughput runner.
+'''
+
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import throughput
+
+
+class TestThroughput(unittest.TestCase):
+    '''
+    Test cases for finding, reading and solving many inputs for one day.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.inputs = [f'{i},{i + 2},{3 * i}\n'.encode() for i in range(10)]
+        for i, data in enumerate(self.inputs):
+            with open(os.path.join(self.tmp.name, f'in{i}.txt'), 'wb') as file:
+                file.write(data)
+
+    def test_find_inputs(self):
+        self.assertEqual(
+            [os.path.basename(path)
+             for path in throughput.find_inputs([self.tmp.name])],
+            [f'in{i}.txt' for i in range(10)])
+        self.assertEqual(
+            len(throughput.find_inputs(
+                [os.path.join(self.tmp.name, 'in[0-3].txt')])), 4)
+
+    def test_read_framed(self):
+        stream = io.BytesIO(b''.join(
+            f'{len(data)}\n'.encode() + data for data in self.inputs))
+        self.assertEqual(list(throughput.read_framed(stream)), self.inputs)
+
+    def test_read_framed_truncated(self):
+        with self.assertRaises(ValueError):
+            list(throughput.read_framed(io.BytesIO(b'10\nabc')))
+
+    def test_malformed_stream_reported(self):
+        for stream in (b'4\n1,2\nten\n1,2\n', b'-1\n1,2\n'):
+            stdin = io.TextIOWrapper(io.BytesIO(stream))
+            errors = io.StringIO()
+            with self.subTest(stream=stream), \
+                    mock.patch('sys.stdin', stdin), \
+                    contextlib.redirect_stdout(io.StringIO()), \
+                    contextlib.redirect_stderr(errors), \
+                    self.assertRaises(SystemExit) as exited:
+                throughput.main(['7', '1', '--stream', '--workers', '1'])
+            self.assertEqual(exited.exception.code, -1)
+            self.assertIn('Malformed frame header', errors.getvalue())
+
+    def test_results_in_input_order(self):
+        inputs = [(str(i), data) for i, data in enumerate(self.inputs)]
+        inputs.append(('bad', b'x\n'))
+        results = list(throughput.run_inputs(
+            7, 'both', inputs, workers=2, chunk_size=3, max_in_flight=1))
+        self.assertEqual([result.label for result in results],
+                         [label for label, _ in inputs])
+        self.assertEqual(results[1].answers, [2, 3])
+        self.assertIsNotNone(results[-1].error)
+
+    def test_results_not_held_back_by_slow_producer(self):
+        more = threading.Event()
+
+        def slow_inputs():
+            yield '0', self.inputs[0]
+            more.wait(10)
+            yield '1', self.inputs[1]
+
+        start = time.monotonic()
+        results = throughput.run_inputs(7, '1', slow_inputs(), workers=1,
+                                        chunk_size=1)
+        try:
+            self.assertEqual(next(results).label, '0')
+            self.assertLess(time.monotonic() - start, 5)
+        finally:
+            more.set()
+        self.assertEqual([result.label for result in results], ['1'])
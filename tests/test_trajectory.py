@@ -0,0 +1,116 @@
+'''
+Test cases for the day 2 trajectory index.
+'''
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import day02
+import generators
+import trajectory
+from trajectory import Trajectory, load_or_build
+
+
+def replay(lines, k):
+    '''
+    Follows the first `k` commands the slow way.
+    '''
+    horizontal = depth = aim = 0
+    for command, amount in day02.parse(lines)[:k]:
+        if command == 'forward':
+            horizontal += amount
+            depth += aim * amount
+        else:
+            aim += amount if command == 'down' else -amount
+    return horizontal, depth, aim
+
+
+class TestTrajectory(unittest.TestCase):
+    '''
+    Test cases for building, querying and saving trajectory indexes.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.lines = generators.generate(2, 200, seed=1)
+        self.data = ''.join(self.lines).encode()
+
+    def test_positions(self):
+        for interval in (1, 7, 64, 500):
+            trajectory = Trajectory.build(self.data, interval)
+            self.assertEqual(len(trajectory), len(self.lines))
+            for k in range(len(self.lines) + 1):
+                with self.subTest(interval=interval, k=k):
+                    self.assertEqual(trajectory.position_after(k),
+                                     replay(self.lines, k))
+
+    def test_final_position_matches_part2(self):
+        horizontal, depth, _ = Trajectory.build(self.data).position_after(
+            len(self.lines))
+        self.assertEqual(horizontal * depth, day02.part2(self.lines))
+
+    def test_blank_lines_and_missing_newline(self):
+        trajectory = Trajectory.build(b'forward 5\n\ndown 5\nforward 8', 2)
+        self.assertEqual(len(trajectory), 3)
+        self.assertEqual(trajectory.position_after(3), (13, 40, 5))
+
+    def test_out_of_range(self):
+        trajectory = Trajectory.build(self.data)
+        with self.assertRaises(IndexError):
+            trajectory.position_after(len(self.lines) + 1)
+        with self.assertRaises(IndexError):
+            trajectory.position_after(-1)
+
+    def test_round_trip(self):
+        trajectory = Trajectory.build(self.data, 10)
+        loaded = Trajectory.from_bytes(trajectory.to_bytes(), self.data)
+        self.assertEqual(loaded.interval, 10)
+        self.assertEqual(loaded.position_after(95),
+                         trajectory.position_after(95))
+        self.assertIsNone(Trajectory.from_bytes(trajectory.to_bytes(),
+                                                self.data + b'up 1\n'))
+
+    def test_load_or_build(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input.txt')
+            index_path = input_path + '.trajectory'
+            with open(input_path, 'wb') as file:
+                file.write(self.data)
+            load_or_build(input_path, index_path, interval=5)
+            self.assertTrue(os.path.exists(index_path))
+            self.assertEqual(
+                load_or_build(input_path, index_path, interval=9).interval, 5)
+            self.assertEqual(load_or_build(input_path, index_path, 9,
+                                           rebuild=True).interval, 9)
+
+    def test_corrupt_index_is_rebuilt(self):
+        index = Trajectory.build(self.data, 10).to_bytes()
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input.txt')
+            index_path = input_path + '.trajectory'
+            with open(input_path, 'wb') as file:
+                file.write(self.data)
+            # Cut mid-item, at a column boundary, and within the header.
+            for size in (len(index) - 3, len(index) - 8, 20):
+                with self.subTest(size=size):
+                    with open(index_path, 'wb') as file:
+                        file.write(index[:size])
+                    trajectory = load_or_build(input_path, index_path, 7)
+                    self.assertEqual(trajectory.interval, 7)
+                    self.assertEqual(trajectory.position_after(95),
+                                     replay(self.lines, 95))
+
+    def test_overflow_reported(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, 'input.txt')
+            with open(input_path, 'wb') as file:
+                file.write(b'down 9000000000\nforward 9000000000\n' * 2)
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors), \
+                    self.assertRaises(SystemExit) as exited:
+                trajectory.main(['--interval', '1', input_path, '1'])
+        self.assertEqual(exited.exception.code, -1)
+        self.assertNotEqual(errors.getvalue(), '')
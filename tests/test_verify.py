@@ -0,0 +1,90 @@
+'''
+Test cases for the engine registry and differential verification.
+'''
+
+import unittest
+
+import day01
+import solvers
+import verify
+
+
+def broken_solve1(depths) -> int:
+    '''
+    Solves day 1 part 1 wrongly whenever a depth above 1000 is present.
+    '''
+    answer = day01.solve1(depths)
+    return answer + 1 if any(depth > 1000 for depth in depths) else answer
+
+
+class TestEngines(unittest.TestCase):
+    '''
+    Test cases for listing a day's engines.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def test_own_solvers_are_the_reference(self):
+        engines = solvers.engines(6)
+        self.assertEqual(list(engines), [solvers.REFERENCE])
+        self.assertEqual(engines[solvers.REFERENCE].solve('1', ['3,4\n']),
+                         2188)
+
+    def test_registered_reference(self):
+        engines = solvers.engines(10)
+        self.assertEqual(list(engines)[:2],
+                         [solvers.REFERENCE, solvers.DEFAULT_ENGINE])
+        lines = ['[({(<(())[]>[[{[]{<()<>>\n', '{([(<{}[<>[]}>{[]{[(<()>\n']
+        for part in solvers.PARTS:
+            with self.subTest(part=part):
+                self.assertEqual(
+                    engines[solvers.REFERENCE].solve(part, lines),
+                    engines[solvers.DEFAULT_ENGINE].solve(part, lines))
+
+    def test_load_engine(self):
+        self.assertEqual(solvers.load_engine(2).__name__, 'day02')
+        self.assertEqual(
+            solvers.solve(2, solvers.BOTH, ['forward 2\n', 'down 3\n'],
+                          engine='parallel'), [6, 0])
+        with self.assertRaises(ValueError):
+            solvers.load_engine(2, engine='missing')
+
+    def test_invalid_part(self):
+        with self.assertRaises(ValueError):
+            solvers.engines(1)[solvers.REFERENCE].solve(solvers.BOTH, [])
+
+
+class TestVerify(unittest.TestCase):
+    '''
+    Test cases for comparing engines and shrinking failing inputs.
+    '''
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        self.reference = solvers.Engine.of(day01)
+        self.broken = solvers.Engine(day01.parse, broken_solve1, day01.solve2)
+
+    def test_diverges(self):
+        lines = ['999\n', '1001\n', '1002\n']
+        self.assertTrue(verify.diverges(self.reference, self.broken, '1',
+                                        lines))
+        self.assertFalse(verify.diverges(self.reference, self.broken, '2',
+                                         lines))
+        self.assertFalse(verify.diverges(self.reference, self.broken, '1',
+                                         lines[:1]))
+
+    def test_minimise(self):
+        lines = [f'{depth}\n' for depth in range(900, 1100, 7)]
+        minimal = verify.minimise(self.reference, self.broken, '1', lines)
+        self.assertEqual(len(minimal), 1)
+        self.assertGreater(int(minimal[0]), 1000)
+
+    def test_days_without_engines_are_skipped(self):
+        self.assertEqual(list(verify.verify_day(6, [10], seed=1, repeat=1)),
+                         [])
+
+    def test_verify_day(self):
+        results = list(verify.verify_day(10, [20, 50], seed=1, repeat=1))
+        self.assertEqual(len(results), 4)
+        self.assertFalse(any(result.diverged for result in results))
+        self.assertEqual({result.engine for result in results},
+                         {solvers.DEFAULT_ENGINE})
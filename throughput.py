@@ -0,0 +1,255 @@
+'''
+Throughput runner that solves many different inputs for a single day and part,
+spreading them in chunks over a pool of worker processes.
+Usage: ./main.py throughput [--workers N] [--chunk-size N] [--max-in-flight N]
+                            [--framed] <day_number> <part_number|both>
+                            (<path|glob> ... | --stream)
+
+Inputs are given as files, directories (every file within, in name order) or
+glob patterns, or with --stream as a sequence of framed inputs on stdin: each
+is a header line "<input length>\\n" followed by that many bytes of puzzle
+input. Results are written to stdout in input order as soon as they're ready,
+and at most --max-in-flight chunks are queued at once, so arbitrarily long
+streams are solved in bounded memory.
+'''
+
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor
+import glob
+import itertools
+import os
+import queue
+import sys
+import threading
+import time
+from typing import (BinaryIO, Iterable, Iterator, List, NamedTuple, Optional,
+                    Tuple, TypeVar, Union)
+
+from inputs import InputBuffer
+import solvers
+
+DEFAULT_CHUNK_SIZE = 16
+
+# An input is either the path of a file to read or the input bytes themselves.
+Input = Union[str, bytes]
+
+T = TypeVar('T')
+
+
+class InputResult(NamedTuple):
+    '''
+    The outcome of solving a single input.
+    '''
+    label: str
+    answers: Optional[List[solvers.Answer]]
+    error: Optional[str]
+
+
+def find_inputs(patterns: Iterable[str]) -> List[str]:
+    '''
+    Expands each of `patterns` into input file paths: files are used as is,
+    directories contribute every file within them and anything else is
+    treated as a glob pattern. Each group is sorted by name.
+    '''
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths.extend(sorted(
+                entry.path for entry in os.scandir(pattern)
+                if entry.is_file()))
+        elif os.path.isfile(pattern):
+            paths.append(pattern)
+        else:
+            paths.extend(sorted(
+                path for path in glob.glob(pattern) if os.path.isfile(path)))
+    return paths
+
+
+def read_framed(stream: BinaryIO) -> Iterator[bytes]:
+    '''
+    Yields each framed input from `stream` until it's exhausted. Raises a
+    ValueError if a header is malformed or an input is truncated.
+    '''
+    while header := stream.readline():
+        if header.strip() == b'':
+            continue
+        if not header.strip().isdigit():
+            raise ValueError(f'Malformed frame header: {header!r}')
+        size = int(header)
+        data = stream.read(size)
+        if len(data) != size:
+            raise ValueError(
+                f'Truncated input: expected {size} bytes, got {len(data)}')
+        yield data
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    '''
+    Splits `items` into lists of `size` items (the last may be shorter).
+    '''
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def solve_input(day: int, part: str, item: Input) \
+        -> Tuple[Optional[List[solvers.Answer]], Optional[str]]:
+    '''
+    Solves a single input, returning its answers, or the error it raised.
+    '''
+    try:
+        if isinstance(item, bytes):
+            return solvers.solve(day, part, InputBuffer(item)), None
+        with open(item, 'rb') as file:
+            return solvers.solve(day, part, InputBuffer.from_file(file)), None
+    except Exception as ex:  # pylint: disable=broad-except
+        return None, f'{type(ex).__name__}: {ex}'
+
+
+def solve_chunk(day: int, part: str, items: List[Input]) \
+        -> List[Tuple[Optional[List[solvers.Answer]], Optional[str]]]:
+    '''
+    Solves every input in a chunk. Executed within the worker processes.
+    '''
+    return [solve_input(day, part, item) for item in items]
+
+
+def run_inputs(day: int, part: str, inputs: Iterable[Tuple[str, Input]],
+               workers: Optional[int] = None,
+               chunk_size: int = DEFAULT_CHUNK_SIZE,
+               max_in_flight: Optional[int] = None) -> Iterator[InputResult]:
+    '''
+    Solves every (label, input) pair in `inputs` over a pool of `workers`
+    processes (defaulting to the number of CPUs), yielding the results in
+    input order as soon as each chunk's are ready. Inputs are read and sent
+    to the workers `chunk_size` at a time on a background thread, so a slow
+    producer doesn't hold back results that are already done, and no more
+    than `max_in_flight` chunks (default: twice the number of workers) are
+    submitted ahead of the results being yielded, so `inputs` is consumed
+    lazily.
+    '''
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+    slots = threading.Semaphore(max_in_flight)
+    # Submitted chunks in input order, followed by a None sentinel (or the
+    # exception that stopped the reader).
+    submitted: queue.Queue = queue.Queue()
+    stop = threading.Event()
+
+    def results(labels: List[str], future: Future) -> Iterator[InputResult]:
+        for label, (answers, error) in zip(labels, future.result()):
+            yield InputResult(label, answers, error)
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=solvers.load_day,
+                             initargs=(day,)) as pool:
+
+        def submit_all() -> None:
+            try:
+                for chunk in chunked(inputs, chunk_size):
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    labels = [label for label, _ in chunk]
+                    items = [item for _, item in chunk]
+                    submitted.put(
+                        (labels, pool.submit(solve_chunk, day, part, items)))
+                submitted.put(None)
+            except Exception as ex:  # pylint: disable=broad-except
+                submitted.put(ex)
+
+        threading.Thread(target=submit_all, daemon=True).start()
+        try:
+            while (chunk := submitted.get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield from results(*chunk)
+                slots.release()
+        finally:
+            stop.set()
+
+
+def write_result(result: InputResult, framed: bool) -> None:
+    '''
+    Writes a single result to stdout, either as a "<label>: <answer>" line
+    (with multi-line answers indented to match) or, if `framed` is set, as a
+    header line "<ok|error> <body length>\\n" followed by the body.
+    '''
+    if result.error is not None:
+        status, body = 'error', result.error
+    else:
+        status = 'ok'
+        body = '\n'.join(str(answer) for answer in result.answers or [])
+    if framed:
+        data = body.encode()
+        sys.stdout.buffer.write(f'{status} {len(data)}\n'.encode() + data)
+        return
+    if result.error is not None:
+        body = f'ERROR {body}'
+    prefix = f'{result.label}: '
+    print(prefix + body.replace('\n', '\n' + ' ' * len(prefix)))
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py throughput`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py throughput')
+    parser.add_argument('day', type=int)
+    parser.add_argument('part')
+    parser.add_argument('inputs', nargs='*',
+                        help='input files, directories or glob patterns')
+    parser.add_argument('--stream', action='store_true',
+                        help='read framed inputs from stdin instead')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='inputs sent to a worker at a time '
+                             f'(default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='chunks queued ahead of the output (default: '
+                             'twice the number of workers)')
+    parser.add_argument('--framed', action='store_true',
+                        help='write framed results instead of text lines')
+    args = parser.parse_args(argv)
+
+    try:
+        solvers.check_day(args.day)
+        solvers.check_part(args.part)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.stream == (len(args.inputs) > 0):
+        parser.error('give either input paths or --stream, but not both')
+
+    if args.stream:
+        inputs: Iterable[Tuple[str, Input]] = (
+            (str(i), data)
+            for i, data in enumerate(read_framed(sys.stdin.buffer)))
+    else:
+        paths = find_inputs(args.inputs)
+        if len(paths) == 0:
+            print('No input files found', file=sys.stderr)
+            sys.exit(-1)
+        inputs = ((path, path) for path in paths)
+
+    start = time.perf_counter()
+    count = errors = 0
+    try:
+        for result in run_inputs(args.day, args.part, inputs, args.workers,
+                                 args.chunk_size, args.max_in_flight):
+            write_result(result, args.framed)
+            sys.stdout.flush()
+            count += 1
+            errors += result.error is not None
+    except ValueError as error:
+        # Raised by read_framed for a malformed stream.
+        sys.stdout.flush()
+        print(error, file=sys.stderr)
+        sys.exit(-1)
+    wall_time = time.perf_counter() - start
+    sys.stdout.flush()
+    print(f'{count} inputs in {wall_time * 1000:.3f} ms wall time '
+          f'({count / wall_time if wall_time > 0 else 0:.1f} inputs/s)',
+          file=sys.stderr)
+    if errors > 0:
+        sys.exit(1)
@@ -0,0 +1,224 @@
+'''
+Index of the submarine's trajectory through a day 2 command log, answering
+"where was the submarine after command k?" without replaying the log from
+the start for each query.
+Usage: ./main.py trajectory [--interval N] [--index FILE] [--rebuild]
+                            <input_file> <command_index> ...
+
+A single pass over the log records the horizontal position, depth and aim
+(as in part 2), together with the byte offset of the next command, after
+every `interval` commands. A query reads the nearest checkpoint at or
+before command k and replays at most `interval - 1` commands from there,
+so an interval of 1 gives prefix arrays with constant-time queries, while
+larger intervals trade query time for a smaller index.
+
+The index is saved next to the input and reused as long as the input is
+unchanged (by length and SHA-256 hash). Positions are stored as signed
+64-bit integers, so building an index for a log whose depth overflows
+them raises an OverflowError.
+'''
+
+import argparse
+from array import array
+import hashlib
+import os
+import struct
+import sys
+from typing import Iterator, List, Optional, Tuple, Union
+
+from day02 import Position, step
+
+DEFAULT_INTERVAL = 64
+
+# Header of a saved index: the interval, the number of commands, the length
+# of the input and its SHA-256 hash.
+HEADER = struct.Struct('<QQQ32s')
+
+
+def commands_from(data: Union[bytes, memoryview], offset: int = 0) \
+        -> Iterator[Tuple[bytes, int]]:
+    '''
+    Yields each command in `data` from byte `offset` onwards, as its
+    undecoded name and its amount. Blank lines are skipped.
+    '''
+    while offset < len(data):
+        end = data.find(b'\n', offset) + 1 or len(data)
+        if words := bytes(data[offset:end]).split():
+            command, amount = words
+            yield command, int(amount)
+        offset = end
+
+
+class Trajectory:
+    '''
+    The positions of the submarine after every `interval` commands of a log,
+    and where in the log each checkpoint's next command starts.
+    '''
+
+    def __init__(self, data: bytes, interval: int, count: int,
+                 horizontal: array, depth: array, aim: array,
+                 offsets: array):
+        self.data = data
+        self.interval = interval
+        self.count = count
+        self.horizontal = horizontal
+        self.depth = depth
+        self.aim = aim
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, data: bytes, interval: int = DEFAULT_INTERVAL) \
+            -> 'Trajectory':
+        '''
+        Indexes the command log `data` in a single pass.
+        '''
+        if interval < 1:
+            raise ValueError(f'Interval must be positive, not {interval}')
+        columns = (array('q'), array('q'), array('q'))
+        offsets = array('Q')
+        horizontal = depth = aim = count = 0
+        end = 0
+        for line in data.splitlines(keepends=True):
+            start = end
+            end += len(line)
+            if not (words := line.split()):
+                continue
+            if count % interval == 0:
+                for column, value in zip(columns, (horizontal, depth, aim)):
+                    column.append(value)
+                offsets.append(start)
+            command, amount = words[0], int(words[1])
+            match command:
+                case b'forward':
+                    horizontal += amount
+                    depth += aim * amount
+                case b'down':
+                    aim += amount
+                case b'up':
+                    aim -= amount
+            count += 1
+        if count % interval == 0:
+            for column, value in zip(columns, (horizontal, depth, aim)):
+                column.append(value)
+            offsets.append(end)
+        return cls(data, interval, count, *columns, offsets)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def position_after(self, k: int) -> Position:
+        '''
+        Returns the position after the first `k` commands, from 0 (the start)
+        to the number of commands. Raises an IndexError for any other `k`.
+        '''
+        if not 0 <= k <= self.count:
+            raise IndexError(
+                f'Command index {k} out of range 0 to {self.count}')
+        checkpoint, remaining = divmod(k, self.interval)
+        position = (self.horizontal[checkpoint], self.depth[checkpoint],
+                    self.aim[checkpoint])
+        if remaining == 0:
+            return position
+        for command, amount in commands_from(
+                self.data, self.offsets[checkpoint]):
+            position = step(position, command, amount)
+            remaining -= 1
+            if remaining == 0:
+                break
+        return position
+
+    def to_bytes(self) -> bytes:
+        '''
+        Serialises this index, without the input itself.
+        '''
+        return HEADER.pack(self.interval, self.count, len(self.data),
+                           hashlib.sha256(self.data).digest()) \
+            + b''.join(column.tobytes() for column in (
+                self.horizontal, self.depth, self.aim, self.offsets))
+
+    @classmethod
+    def from_bytes(cls, index: bytes, data: bytes) -> Optional['Trajectory']:
+        '''
+        Reconstructs an index serialised by to_bytes() for the input `data`,
+        or returns None if it was built from a different input or its
+        columns are too short. Raises a ValueError or struct.error if it's
+        otherwise malformed.
+        '''
+        interval, count, size, digest = HEADER.unpack_from(index)
+        if size != len(data) or digest != hashlib.sha256(data).digest() \
+                or interval < 1:
+            return None
+        checkpoints = count // interval + 1
+        columns = []
+        start = HEADER.size
+        for typecode in 'qqqQ':
+            column = array(typecode)
+            end = start + checkpoints * column.itemsize
+            column.frombytes(index[start:end])
+            if len(column) != checkpoints:
+                return None
+            columns.append(column)
+            start = end
+        return cls(data, interval, count, *columns)
+
+
+def default_path(input_path: str) -> str:
+    '''
+    Returns the index file to use for an input when none is given.
+    '''
+    return f'{input_path}.trajectory'
+
+
+def load_or_build(input_path: str, index_path: str,
+                  interval: int = DEFAULT_INTERVAL,
+                  rebuild: bool = False) -> Trajectory:
+    '''
+    Returns the index for the input at `input_path`, reading it from
+    `index_path` if it's there and up to date (and `rebuild` isn't set), or
+    otherwise building it with the given interval and saving it there.
+    '''
+    with open(input_path, 'rb') as file:
+        data = file.read()
+    if not rebuild:
+        try:
+            with open(index_path, 'rb') as file:
+                trajectory = Trajectory.from_bytes(file.read(), data)
+            if trajectory is not None:
+                return trajectory
+        except (OSError, ValueError, struct.error):
+            pass
+    trajectory = Trajectory.build(data, interval)
+    with open(index_path + '.tmp', 'wb') as file:
+        file.write(trajectory.to_bytes())
+    os.replace(index_path + '.tmp', index_path)
+    return trajectory
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py trajectory`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py trajectory')
+    parser.add_argument('input', help='the day 2 command log')
+    parser.add_argument('queries', type=int, nargs='+', metavar='k',
+                        help='number of commands to follow')
+    parser.add_argument('--interval', type=int, default=DEFAULT_INTERVAL,
+                        help='commands between checkpoints when building '
+                             f'the index (default: {DEFAULT_INTERVAL})')
+    parser.add_argument('--index',
+                        help='index file (default: the input path followed '
+                             'by .trajectory)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='rebuild the index even if it is up to date')
+    args = parser.parse_args(argv)
+
+    try:
+        trajectory = load_or_build(args.input,
+                                   args.index or default_path(args.input),
+                                   args.interval, args.rebuild)
+        for k in args.queries:
+            horizontal, depth, aim = trajectory.position_after(k)
+            print(f'{k} horizontal={horizontal} depth={depth} aim={aim}')
+    except (ValueError, IndexError, OverflowError, OSError) as error:
+        print(error, file=sys.stderr)
+        sys.exit(-1)
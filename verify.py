@@ -0,0 +1,222 @@
+'''
+Differential verification of each day's fast engines against its reference
+engine (see solvers.engines).
+Usage: ./main.py verify [--days 1,2,...] [--sizes N,...] [--engines A,...]
+                        [--seed N] [--repeat N] [--max-trials N]
+
+Every engine is run side by side with the reference on synthetic inputs of
+increasing size, and timed to report its speed ratio over the reference. When
+an engine gives a different answer (or raises where the reference doesn't),
+lines are deleted from the failing input for as long as the divergence
+persists, and the smallest failing input found is reported. The command exits
+with a non-zero code if any engine diverged.
+'''
+
+import argparse
+import sys
+import time
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from bench import int_list
+import generators
+from inputs import InputBuffer
+import solvers
+
+DEFAULT_MAX_TRIALS = 2000
+
+
+class Verification(NamedTuple):
+    '''
+    The outcome of checking one engine on one input.
+    '''
+    day: int
+    part: str
+    size: int
+    engine: str
+    expected: solvers.Answer
+    answer: Optional[solvers.Answer]
+    error: Optional[str]
+    seconds: float
+    reference_seconds: float
+    minimal_input: Optional[List[str]]
+
+    @property
+    def diverged(self) -> bool:
+        '''
+        True if the engine disagreed with the reference.
+        '''
+        return self.minimal_input is not None
+
+
+def run_engine(engine: solvers.Engine, part: str, lines: List[str]) \
+        -> Tuple[Optional[solvers.Answer], Optional[str]]:
+    '''
+    Returns the engine's answer to `part` for `lines`, or the error it raised.
+    '''
+    try:
+        return engine.solve(part, InputBuffer(''.join(lines).encode())), None
+    except Exception as ex:  # pylint: disable=broad-except
+        return None, f'{type(ex).__name__}: {ex}'
+
+
+def diverges(reference: solvers.Engine, engine: solvers.Engine, part: str,
+             lines: List[str]) -> bool:
+    '''
+    Returns True if `engine` gives a different answer from `reference` for
+    `lines`. Inputs the reference itself rejects don't count as divergent.
+    '''
+    expected, error = run_engine(reference, part, lines)
+    if error is not None:
+        return False
+    answer, error = run_engine(engine, part, lines)
+    return error is not None or answer != expected
+
+
+def minimise(reference: solvers.Engine, engine: solvers.Engine, part: str,
+             lines: List[str], max_trials: int = DEFAULT_MAX_TRIALS) \
+        -> List[str]:
+    '''
+    Shrinks an input on which `engine` diverges from `reference` by deleting
+    ever smaller runs of lines, keeping each deletion after which the engines
+    still diverge. Stops after `max_trials` comparisons, so the result is
+    small but not necessarily minimal for large inputs.
+    '''
+    trials = 0
+    run = len(lines) // 2
+    while run > 0 and trials < max_trials:
+        start = 0
+        while start < len(lines) and trials < max_trials:
+            candidate = lines[:start] + lines[start + run:]
+            trials += 1
+            if len(candidate) > 0 \
+                    and diverges(reference, engine, part, candidate):
+                lines = candidate
+            else:
+                start += run
+        run //= 2
+    return lines
+
+
+def time_engine(engine: solvers.Engine, part: str, data: InputBuffer,
+                repeat: int) -> Tuple[solvers.Answer, float]:
+    '''
+    Returns the engine's answer to `part` for `data` and the fastest of
+    `repeat` runs, in seconds.
+    '''
+    best = float('inf')
+    answer: solvers.Answer = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        answer = engine.solve(part, data)
+        best = min(best, time.perf_counter() - start)
+    return answer, best
+
+
+def verify_day(day: int, sizes: Optional[Sequence[int]], seed: int,
+               repeat: int, names: Optional[Sequence[str]] = None,
+               max_trials: int = DEFAULT_MAX_TRIALS) \
+        -> Iterator[Verification]:
+    '''
+    Checks each of the day's fast engines (or just those in `names`) against
+    its reference on inputs of each size in `sizes` (or the day's default
+    benchmark sweep if None), smallest first. Once an engine diverges on one
+    part, it isn't checked on larger inputs for that part. Days without any
+    engines to check are skipped without running the reference.
+    '''
+    engines = solvers.engines(day)
+    reference = engines.pop(solvers.REFERENCE)
+    if names is not None:
+        engines = {name: engine for name, engine in engines.items()
+                   if name in names}
+    if len(engines) == 0:
+        return
+    _, default_sizes = generators.GENERATORS[day]
+    failed = set()
+    for size in sorted(sizes or default_sizes):
+        lines = generators.generate(day, size, seed)
+        data = InputBuffer(''.join(lines).encode())
+        for part in solvers.PARTS:
+            expected, reference_seconds = time_engine(
+                reference, part, data, repeat)
+            for name, engine in engines.items():
+                if (name, part) in failed:
+                    continue
+                try:
+                    answer, seconds = time_engine(engine, part, data, repeat)
+                    error = None
+                except Exception as ex:  # pylint: disable=broad-except
+                    answer, seconds = None, float('nan')
+                    error = f'{type(ex).__name__}: {ex}'
+                minimal_input = None
+                if error is not None or answer != expected:
+                    failed.add((name, part))
+                    minimal_input = minimise(
+                        reference, engine, part, lines, max_trials)
+                yield Verification(day, part, size, name, expected, answer,
+                                   error, seconds, reference_seconds,
+                                   minimal_input)
+
+
+def report(result: Verification) -> None:
+    '''
+    Prints a verification result to stderr, along with the minimal failing
+    input if the engine diverged.
+    '''
+    ratio = (result.reference_seconds / result.seconds
+             if result.seconds > 0 else float('inf'))
+    print(f'day {result.day:2} part {result.part}  size {result.size:>8}  '
+          f'{result.engine:>9}  {result.seconds * 1000:12.3f} ms  '
+          f'{ratio:7.2f}x  {"DIVERGED" if result.diverged else "ok"}',
+          file=sys.stderr)
+    if result.minimal_input is None:
+        return
+    reference = solvers.engines(result.day)[solvers.REFERENCE]
+    engine = solvers.engines(result.day)[result.engine]
+    lines = result.minimal_input
+    expected, _ = run_engine(reference, result.part, lines)
+    answer, error = run_engine(engine, result.part, lines)
+    print(f'  minimal failing input ({len(lines)} lines): expected '
+          f'{expected!r}, got {error if error is not None else repr(answer)}',
+          file=sys.stderr)
+    for line in lines:
+        print(f'    {line.rstrip()}', file=sys.stderr)
+
+
+def main(argv: List[str]) -> None:
+    '''
+    Entry point for `./main.py verify`.
+    '''
+    parser = argparse.ArgumentParser(prog='./main.py verify')
+    parser.add_argument('--days', type=int_list, default=list(solvers.DAYS),
+                        help='comma-separated days to verify')
+    parser.add_argument('--sizes', type=int_list, default=None,
+                        help="comma-separated input sizes (default: each "
+                             "day's own sweep)")
+    parser.add_argument('--engines', type=lambda value: value.split(','),
+                        default=None,
+                        help='comma-separated engines to check (default: '
+                             'every fast engine)')
+    parser.add_argument('--seed', type=int, default=2021)
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='timed runs per engine; the fastest is kept')
+    parser.add_argument('--max-trials', type=int, default=DEFAULT_MAX_TRIALS,
+                        help='comparisons allowed when shrinking a failing '
+                             f'input (default: {DEFAULT_MAX_TRIALS})')
+    args = parser.parse_args(argv)
+
+    for day in args.days:
+        try:
+            solvers.check_day(day)
+        except ValueError as error:
+            parser.error(str(error))
+
+    checked = diverged = 0
+    for day in args.days:
+        for result in verify_day(day, args.sizes, args.seed, args.repeat,
+                                 args.engines, args.max_trials):
+            report(result)
+            checked += 1
+            diverged += result.diverged
+    print(f'{checked} checks, {diverged} divergent', file=sys.stderr)
+    if diverged > 0:
+        sys.exit(1)